@@ -0,0 +1,21 @@
+# backend/accounts/management/commands/recount_followers.py
+
+from django.core.management.base import BaseCommand
+from reviews.services.timeline import recount_followers
+
+
+class Command(BaseCommand):
+    help = "User.followers_count(팔로잉 피드 fan-out 기준)를 Follow 테이블 기준으로 재계산"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 재계산할 유저 수")
+
+    def handle(self, *args, **options):
+        def on_batch(checked, fixed):
+            self.stdout.write(f"  - {checked}명 확인, {fixed}명 보정")
+
+        self.stdout.write(self.style.SUCCESS("팔로워 수 재계산..."))
+        result = recount_followers(batch_size=options["batch_size"], on_batch=on_batch)
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ 완료: {result['checked']}명 중 {result['fixed']}명 보정")
+        )
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:05
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_followers_count(apps, schema_editor):
+    User = apps.get_model("accounts", "User")
+    Follow = apps.get_model("accounts", "Follow")
+    counts = (
+        Follow.objects.filter(to_user_id=OuterRef("pk"))
+        .order_by()
+        .values("to_user_id")
+        .annotate(n=Count("id"))
+        .values("n")
+    )
+    User.objects.update(followers_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_alter_user_profile_image'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='followers_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_followers_count, migrations.RunPython.noop),
+    ]
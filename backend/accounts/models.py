@@ -21,6 +21,10 @@ class User(AbstractUser):
     # (기존) profile_image = models.URLField(blank=True, default="")
     profile_image = models.ImageField(upload_to='profiles/', blank=True, null=True)
 
+    # ✅ 팔로워 수 (follow_toggle / withdraw에서 F()로 증감)
+    # - 팔로잉 피드 fan-out 대상인지(FEED_FANOUT_MAX_FOLLOWERS) 판단할 때 COUNT 없이 사용
+    followers_count = models.PositiveIntegerField(default=0)
+
     # 관리자 생성/폼에서 email/name을 요구하도록
     EMAIL_FIELD = "email"
     REQUIRED_FIELDS = ["email", "name"]
@@ -45,8 +45,8 @@ class UserSerializer(serializers.ModelSerializer):
         ]
 
     def get_followers_count(self, obj):
-        # obj를 팔로우하는 사람 수
-        return Follow.objects.filter(to_user=obj).count()
+        # obj를 팔로우하는 사람 수 (follow_toggle에서 증감하는 컬럼)
+        return obj.followers_count
 
     def get_following_count(self, obj):
         # obj가 팔로우하는 사람 수
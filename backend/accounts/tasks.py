@@ -0,0 +1,67 @@
+# backend/accounts/tasks.py
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.tokens import PasswordResetTokenGenerator
+from django.core.mail import send_mail
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+from jobs.registry import task
+
+User = get_user_model()
+
+
+def _frontend_base_url():
+    """
+    비번 재설정 링크 생성용.
+    1) settings.FRONTEND_BASE_URL 있으면 사용
+    2) 없으면 localhost로 fallback
+    """
+    base = getattr(settings, "FRONTEND_BASE_URL", None)
+    return (base or "http://localhost:5173").rstrip("/")
+
+
+def _find_username_email(user):
+    subject = "[혜성(The Comet)] 아이디(Username) 안내"
+    message = (
+        "요청하신 아이디 안내입니다.\n\n"
+        f"- 아이디(username): {user.username}\n\n"
+        "본인이 요청하지 않았다면 이 메일을 무시하세요."
+    )
+    return subject, message
+
+
+def _password_reset_email(user):
+    uid = urlsafe_base64_encode(force_bytes(user.pk))
+    token = PasswordResetTokenGenerator().make_token(user)
+    # 프론트 라우트 예시: /reset-password?uid=...&token=...
+    reset_link = f"{_frontend_base_url()}/reset-password?uid={uid}&token={token}"
+
+    subject = "[혜성(The Comet)] 비밀번호 재설정 안내"
+    message = (
+        "비밀번호 재설정 요청을 받았습니다.\n\n"
+        "아래 링크에서 새 비밀번호를 설정해주세요:\n"
+        f"{reset_link}\n\n"
+        "본인이 요청하지 않았다면 이 메일을 무시하세요."
+    )
+    return subject, message
+
+
+EMAILS = {
+    "find_username": _find_username_email,
+    "password_reset": _password_reset_email,
+}
+
+
+@task("accounts.send_email")
+def send_email(user_id: int, kind: str):
+    """
+    ✅ payload에는 user_id/kind만 → 재설정 토큰은 발송할 때 만들어서 Job.payload에 남지 않음
+    실패하면 예외 → 작업 큐가 backoff 후 재시도
+    """
+    user = User.objects.filter(pk=user_id, is_active=True).first()
+    if user is None or not user.email:
+        return
+    subject, message = EMAILS[kind](user)
+    from_email = getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@example.com")
+    send_mail(subject, message, from_email, [user.email], fail_silently=False)
@@ -1,3 +1,45 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.contrib.auth.tokens import PasswordResetTokenGenerator
+from django.core import mail
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from jobs.models import Job
+from jobs.services import claim_next, run_job
+
+User = get_user_model()
+
+
+@override_settings(JOBS_EAGER=True, EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class SendEmailSafelyTests(APITestCase):
+    """
+    JOBS_EAGER에서 메일 발송이 실패해도 요청은 200 (계정 존재 여부도 드러나지 않음)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="comet", email="comet@example.com")
+
+    def test_sends_in_eager_mode(self):
+        res = self.client.post("/api/accounts/find-username/", {"email": "comet@example.com"})
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_send_failure_does_not_reach_request(self):
+        with mock.patch("accounts.tasks.send_mail", side_effect=OSError("smtp down")):
+            res = self.client.post("/api/accounts/password-reset/request/", {"email": "comet@example.com"})
+        self.assertEqual(res.status_code, 200)
+
+    @override_settings(JOBS_EAGER=False)
+    def test_reset_token_not_stored_in_job(self):
+        self.client.post("/api/accounts/password-reset/request/", {"email": "comet@example.com"})
+        job = Job.objects.get()
+        self.assertEqual(job.payload, {"user_id": self.user.id, "kind": "password_reset"})
+
+        # 링크는 발송할 때 만들어지고 그대로 재설정에 쓸 수 있음
+        self.assertTrue(run_job(claim_next("w1")))
+        link = next(line for line in mail.outbox[0].body.splitlines() if "reset-password?" in line)
+        token = link.split("token=")[1]
+        self.assertTrue(PasswordResetTokenGenerator().check_token(self.user, token))
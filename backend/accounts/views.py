@@ -1,3 +1,5 @@
+import logging
+
 from django.contrib.auth import authenticate, get_user_model
 from rest_framework.decorators import api_view, permission_classes, parser_classes # ✅ parser_classes 추가
 from rest_framework.permissions import AllowAny, IsAuthenticated
@@ -5,15 +7,19 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.conf import settings
-from django.core.mail import send_mail
-from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
-from django.utils.encoding import force_bytes, force_str
+from jobs.services import enqueue
+from django.utils.http import urlsafe_base64_decode
+from django.utils.encoding import force_str
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
-from django.db import transaction
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
 from django.utils import timezone
 import uuid
 from rest_framework.parsers import MultiPartParser, FormParser # ✅ Parser들 추가
 from django.shortcuts import get_object_or_404
+from reviews.services.timeline import add_author_to_timeline, drop_user_timelines, remove_author_from_timeline
 from .models import Follow, UserSetting
 from .serializers import (
     SignupSerializer,
@@ -28,6 +34,7 @@ from .serializers import (
 )
 
 User = get_user_model()
+logger = logging.getLogger(__name__)
 
 
 def _issue_tokens(user: User):
@@ -158,17 +165,30 @@ def follow_toggle(request, username):
     if not target:
         return Response({"detail": "유저를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
-    rel = Follow.objects.filter(from_user=request.user, to_user=target).first()
-    if rel:
-        rel.delete()
-        is_following = False
-    else:
-        Follow.objects.create(from_user=request.user, to_user=target)
-        is_following = True
+    # ✅ 삭제-또는-삽입 + followers_count F() 증감, 팔로잉 피드 타임라인도 같은 트랜잭션에서 채우기/정리
+    with transaction.atomic():
+        deleted, _ = Follow.objects.filter(from_user=request.user, to_user=target).delete()
+        followers = User.objects.filter(pk=target.pk)
+        if deleted:
+            is_following = False
+            followers.update(followers_count=Greatest(F("followers_count") - 1, 0))
+            remove_author_from_timeline(request.user.id, target.id)
+        else:
+            is_following = True
+            try:
+                with transaction.atomic():
+                    Follow.objects.create(from_user=request.user, to_user=target)
+            except (IntegrityError, ValidationError):
+                # 동시에 두 번 눌러서 다른 요청이 먼저 넣음 → 카운트/타임라인은 그쪽에서 처리
+                pass
+            else:
+                followers.update(followers_count=F("followers_count") + 1)
+                add_author_to_timeline(request.user.id, target.id)
+        followers_count = followers.values_list("followers_count", flat=True).first() or 0
 
     result = {
         "is_following": is_following,
-        "followers_count": Follow.objects.filter(to_user=target).count(),
+        "followers_count": followers_count,
         "following_count": Follow.objects.filter(from_user=target).count(),
     }
     return Response(FollowToggleResultSerializer(result).data, status=status.HTTP_200_OK)
@@ -219,29 +239,18 @@ def user_follow_list(request, username, type):
 
 # backend/accounts/views.py (아래에 추가)
 
-def _frontend_base_url(request):
-    """
-    비번 재설정 링크 생성용.
-    1) settings.FRONTEND_BASE_URL 있으면 사용
-    2) 없으면 요청 Origin 사용
-    3) 둘 다 없으면 localhost로 fallback
-    """
-    base = getattr(settings, "FRONTEND_BASE_URL", None)
-    if base:
-        return base.rstrip("/")
-    origin = request.headers.get("Origin")
-    if origin:
-        return origin.rstrip("/")
-    return "http://localhost:5173"
-
-
-def _send_email_safely(subject: str, message: str, to_email: str):
+def _send_email_safely(user, kind: str):
     """
     개발 단계에서는 콘솔 이메일 백엔드면 print로 확인 가능.
     운영에서는 SMTP 세팅 필요.
+    ✅ 발송은 백그라운드 작업(accounts.send_email)으로 넘겨서 응답을 SMTP에 묶지 않음
+    ✅ payload는 user_id/kind만 (재설정 링크·토큰은 작업이 발송할 때 만듦 → Job 테이블에 안 남음)
+    ✅ JOBS_EAGER면 여기서 바로 발송됨 → 실패해도 요청은 그대로 진행 (예전 fail_silently=True와 동일)
     """
-    from_email = getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@example.com")
-    send_mail(subject, message, from_email, [to_email], fail_silently=True)
+    try:
+        enqueue("accounts.send_email", {"user_id": user.id, "kind": kind}, priority=10)
+    except Exception:
+        logger.exception("email %s for user #%s failed", kind, user.id)
 
 
 @api_view(["POST", "DELETE"])
@@ -268,8 +277,12 @@ def withdraw(request):
 
     with transaction.atomic():
         # 팔로우 관계 정리(원하면 유지해도 되는데, 보통 지움)
+        following_ids = list(Follow.objects.filter(from_user=user).values_list("to_user_id", flat=True))
+        User.objects.filter(pk__in=following_ids).update(followers_count=Greatest(F("followers_count") - 1, 0))
         Follow.objects.filter(from_user=user).delete()
         Follow.objects.filter(to_user=user).delete()
+        user.followers_count = 0
+        drop_user_timelines(user.id)
 
         # 개인정보 마스킹 + 비활성화
         user.is_active = False
@@ -291,7 +304,7 @@ def withdraw(request):
         # 선택: 탈퇴 시각 기록하고 싶으면 모델에 필드 추가 후 저장
         user.save(update_fields=[
             "is_active", "username", "email", "name", "birth_date", "gender",
-            "profile_image", "password"
+            "profile_image", "password", "followers_count"
         ])
 
     return Response({"message": "탈퇴 처리되었습니다."}, status=status.HTTP_200_OK)
@@ -319,13 +332,7 @@ def find_username(request):
 
     # user가 있을 때만 이메일 발송(그래도 응답은 동일하게)
     if user:
-        subject = "[혜성(The Comet)] 아이디(Username) 안내"
-        message = (
-            "요청하신 아이디 안내입니다.\n\n"
-            f"- 아이디(username): {user.username}\n\n"
-            "본인이 요청하지 않았다면 이 메일을 무시하세요."
-        )
-        _send_email_safely(subject, message, user.email)
+        _send_email_safely(user, "find_username")
 
     return Response(
         {"message": "입력하신 정보와 일치하는 계정이 있으면 이메일로 안내했습니다."},
@@ -348,22 +355,7 @@ def password_reset_request(request):
     user = User.objects.filter(email__iexact=email, is_active=True).first()
 
     if user:
-        token_gen = PasswordResetTokenGenerator()
-        uid = urlsafe_base64_encode(force_bytes(user.pk))
-        token = token_gen.make_token(user)
-
-        base = _frontend_base_url(request)
-        # 프론트 라우트 예시: /reset-password?uid=...&token=...
-        reset_link = f"{base}/reset-password?uid={uid}&token={token}"
-
-        subject = "[혜성(The Comet)] 비밀번호 재설정 안내"
-        message = (
-            "비밀번호 재설정 요청을 받았습니다.\n\n"
-            "아래 링크에서 새 비밀번호를 설정해주세요:\n"
-            f"{reset_link}\n\n"
-            "본인이 요청하지 않았다면 이 메일을 무시하세요."
-        )
-        _send_email_safely(subject, message, user.email)
+        _send_email_safely(user, "password_reset")
 
     return Response(
         {"message": "해당 이메일의 계정이 존재하면 재설정 링크를 전송했습니다."},
@@ -0,0 +1,9 @@
+# backend/gunicorn.conf.py
+# gunicorn이 작업 디렉터리(backend/)에서 자동으로 읽는 설정
+
+
+def post_worker_init(worker):
+    # ✅ 워커가 뜨자마자 자동완성 색인을 백그라운드로 미리 구성
+    from movies.services.suggest import warm_up
+
+    warm_up()
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+
+
+class JobsConfig(AppConfig):
+    name = 'jobs'
+
+    def ready(self):
+        # 각 앱의 tasks.py에 있는 @task 등록
+        from django.utils.module_loading import autodiscover_modules
+        autodiscover_modules("tasks")
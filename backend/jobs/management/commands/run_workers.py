@@ -0,0 +1,62 @@
+# backend/jobs/management/commands/run_workers.py
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+
+from django.core.management.base import BaseCommand
+from jobs.services import work
+
+
+class Command(BaseCommand):
+    help = "백그라운드 작업(Job) 워커 실행 (--workers N개 프로세스)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=1, help="워커 프로세스 수")
+        parser.add_argument("--poll", type=float, default=1.0, help="작업이 없을 때 대기(초)")
+        parser.add_argument("--once", action="store_true", help="지금 실행 가능한 작업만 처리하고 종료")
+
+    def handle(self, *args, **options):
+        workers = max(1, options["workers"])
+        poll = options["poll"]
+        once = options["once"]
+
+        if workers == 1:
+            self._run_single(poll, once)
+            return
+
+        # ✅ 워커 N개 = manage.py run_workers --workers 1 자식 프로세스 N개
+        cmd = [sys.executable, sys.argv[0], "run_workers", "--workers", "1", "--poll", str(poll)]
+        if once:
+            cmd.append("--once")
+        children = [subprocess.Popen(cmd) for _ in range(workers)]
+        self.stdout.write(self.style.SUCCESS(f"워커 {workers}개 시작: pid {[c.pid for c in children]}"))
+
+        def forward(signum, frame):
+            for c in children:
+                if c.poll() is None:
+                    c.send_signal(signum)
+
+        signal.signal(signal.SIGTERM, forward)
+        signal.signal(signal.SIGINT, forward)
+
+        codes = [c.wait() for c in children]
+        if any(codes):
+            sys.exit(1)
+
+    def _run_single(self, poll, once):
+        worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        stopping = {"flag": False}
+
+        def stop(signum, frame):
+            # 지금 작업까지만 끝내고 종료
+            stopping["flag"] = True
+
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+
+        self.stdout.write(self.style.SUCCESS(f"워커 시작: {worker_id}"))
+        processed = work(worker_id, poll_interval=poll, should_stop=lambda: stopping["flag"], once=once)
+        self.stdout.write(self.style.SUCCESS(f"✅ 워커 종료: {worker_id} ({processed}건 처리)"))
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.9 on 2026-10-18 21:40
+
+from django.db import migrations
+
+
+def scrub_email_payloads(apps, schema_editor):
+    # 예전 accounts.send_email 작업은 payload에 메일 본문(비번 재설정 링크·토큰 포함)을 그대로 저장했음 → 삭제
+    Job = apps.get_model("jobs", "Job")
+    Job.objects.filter(name="accounts.send_email", payload__has_key="message").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(scrub_email_payloads, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,53 @@
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+
+class Job(models.Model):
+    """
+    백그라운드 작업 1건
+    - name: jobs.registry에 등록된 task 이름 (예: movies.refresh_movie)
+    - priority: 클수록 먼저 처리
+    - run_after: 이 시각 이후에만 실행 (재시도 backoff에도 사용)
+    - idempotency_key: 같은 키로 대기/실행 중인 작업이 있으면 새로 만들지 않음
+    """
+    STATUS_CHOICES = [
+        ("QUEUED", "Queued"),
+        ("RUNNING", "Running"),
+        ("DONE", "Done"),
+        ("FAILED", "Failed"),
+    ]
+    ACTIVE_STATUSES = ["QUEUED", "RUNNING"]
+
+    name = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="QUEUED")
+    priority = models.SmallIntegerField(default=0)
+
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=5)
+    run_after = models.DateTimeField(default=timezone.now)
+
+    idempotency_key = models.CharField(max_length=200, null=True, blank=True)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["idempotency_key"],
+                condition=Q(status__in=["QUEUED", "RUNNING"]),
+                name="unique_active_job_key",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["status", "-priority", "run_after"], name="job_claim_idx"),
+        ]
+
+    def __str__(self):
+        return f"#{self.id} {self.name} ({self.status})"
@@ -0,0 +1,19 @@
+# backend/jobs/registry.py
+"""
+task 등록소
+- 각 앱 tasks.py에서 @task("앱.작업명")으로 등록 (JobsConfig.ready에서 autodiscover)
+- payload(dict)가 keyword 인자로 그대로 들어감
+"""
+
+TASKS = {}
+
+
+def task(name: str):
+    def decorator(func):
+        TASKS[name] = func
+        return func
+    return decorator
+
+
+def get_task(name: str):
+    return TASKS.get(name)
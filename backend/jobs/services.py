@@ -0,0 +1,225 @@
+# backend/jobs/services.py
+"""
+DB 기반 작업 큐
+- enqueue(): 뷰/서비스에서 작업 등록
+- claim_next(): 워커가 작업 1건을 가져감
+  · PostgreSQL: SELECT ... FOR UPDATE SKIP LOCKED
+  · SQLite: status 조건부 UPDATE(compare-and-set)로 한 워커만 성공
+- run_job(): 실행 + 실패 시 지수 backoff 재시도 (실행 중에는 heartbeat로 locked_at 갱신)
+- requeue_stale_jobs(): heartbeat가 끊긴 RUNNING 작업을 다시 대기열로 (attempts 다 쓰면 FAILED)
+- purge_finished_jobs(): 끝난 작업은 보관 기간(JOBS_RETENTION_DAYS) 뒤 삭제
+"""
+import logging
+import threading
+import time
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+from .registry import get_task
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue(name: str, payload=None, *, priority=0, delay=0, idempotency_key=None, max_attempts=None) -> Job:
+    """
+    작업 등록. idempotency_key가 같은 작업이 대기/실행 중이면 그 작업을 그대로 반환
+    """
+    payload = payload or {}
+
+    if getattr(settings, "JOBS_EAGER", False):
+        # 워커 없이 바로 실행 (로컬 개발용)
+        get_task(name)(**payload)
+        return Job(name=name, payload=payload, status="DONE")
+
+    if idempotency_key:
+        existing = Job.objects.filter(idempotency_key=idempotency_key, status__in=Job.ACTIVE_STATUSES).first()
+        if existing:
+            return existing
+
+    try:
+        with transaction.atomic():
+            return Job.objects.create(
+                name=name,
+                payload=payload,
+                priority=priority,
+                run_after=timezone.now() + timedelta(seconds=delay),
+                idempotency_key=idempotency_key,
+                max_attempts=max_attempts or getattr(settings, "JOBS_MAX_ATTEMPTS", 5),
+            )
+    except IntegrityError:
+        # 동시에 같은 키로 등록된 경우
+        existing = Job.objects.filter(idempotency_key=idempotency_key, status__in=Job.ACTIVE_STATUSES).first()
+        if existing:
+            return existing
+        raise
+
+
+def _claimable():
+    return Job.objects.filter(status="QUEUED", run_after__lte=timezone.now()).order_by("-priority", "run_after", "id")
+
+
+def claim_next(worker_id: str):
+    now = timezone.now()
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            job = _claimable().select_for_update(skip_locked=True).first()
+            if job is None:
+                return None
+            Job.objects.filter(id=job.id).update(
+                status="RUNNING", locked_by=worker_id, locked_at=now, attempts=F("attempts") + 1, updated_at=now
+            )
+        return Job.objects.get(id=job.id)
+
+    # SQLite: 후보를 고른 뒤 status가 그대로일 때만 가져감(다른 워커가 먼저 가져가면 다음 후보)
+    for _ in range(5):
+        job_id = _claimable().values_list("id", flat=True).first()
+        if job_id is None:
+            return None
+        claimed = Job.objects.filter(id=job_id, status="QUEUED").update(
+            status="RUNNING", locked_by=worker_id, locked_at=now, attempts=F("attempts") + 1, updated_at=now
+        )
+        if claimed:
+            return Job.objects.get(id=job_id)
+    return None
+
+
+def _backoff_seconds(attempts: int) -> float:
+    base = getattr(settings, "JOBS_BACKOFF_BASE", 10)
+    return min(base * (2 ** max(attempts - 1, 0)), getattr(settings, "JOBS_BACKOFF_MAX", 3600))
+
+
+def _touch_lock(job_id: int, worker_id: str) -> bool:
+    now = timezone.now()
+    return bool(
+        Job.objects.filter(id=job_id, status="RUNNING", locked_by=worker_id).update(locked_at=now, updated_at=now)
+    )
+
+
+def _heartbeat(job_id: int, worker_id: str, stop: threading.Event):
+    # 실행 중인 작업의 locked_at을 주기적으로 갱신 → 오래 걸리는 작업을 requeue_stale_jobs가 다시 돌리지 않게
+    interval = getattr(settings, "JOBS_HEARTBEAT_INTERVAL", 60)
+    try:
+        while not stop.wait(interval):
+            try:
+                _touch_lock(job_id, worker_id)
+            except Exception:
+                logger.warning("job #%s heartbeat failed", job_id, exc_info=True)
+    finally:
+        connection.close()
+
+
+def run_job(job: Job):
+    func = get_task(job.name)
+    now = timezone.now()
+
+    if func is None:
+        Job.objects.filter(id=job.id).update(
+            status="FAILED", last_error=f"unknown task: {job.name}", finished_at=now, updated_at=now
+        )
+        return False
+
+    stop = threading.Event()
+    beat = threading.Thread(
+        target=_heartbeat, args=(job.id, job.locked_by, stop), daemon=True, name=f"job-{job.id}-heartbeat"
+    )
+    beat.start()
+    try:
+        func(**(job.payload or {}))
+        error = None
+    except Exception:
+        error = traceback.format_exc()[-4000:]
+    finally:
+        # 결과를 쓰기 전에 heartbeat부터 멈춤
+        stop.set()
+        beat.join()
+
+    now = timezone.now()
+    if error is None:
+        Job.objects.filter(id=job.id).update(status="DONE", finished_at=now, updated_at=now)
+        return True
+
+    logger.warning("job #%s %s failed (attempt %s/%s)", job.id, job.name, job.attempts, job.max_attempts)
+    if job.attempts < job.max_attempts:
+        Job.objects.filter(id=job.id).update(
+            status="QUEUED",
+            run_after=now + timedelta(seconds=_backoff_seconds(job.attempts)),
+            last_error=error,
+            locked_by="",
+            locked_at=None,
+            updated_at=now,
+        )
+    else:
+        Job.objects.filter(id=job.id).update(status="FAILED", last_error=error, finished_at=now, updated_at=now)
+    return False
+
+
+def requeue_stale_jobs() -> int:
+    """
+    워커가 죽어서 RUNNING에 멈춘 작업 되살리기 (heartbeat가 JOBS_LOCK_TIMEOUT 동안 없던 작업)
+    - 가져갈 때 attempts를 이미 올렸으므로 죽은 실행도 1회로 셈 → attempts를 다 쓴 작업은 FAILED
+    반환: 다시 대기열에 넣은 수
+    """
+    timeout = getattr(settings, "JOBS_LOCK_TIMEOUT", 600)
+    now = timezone.now()
+    stale = Job.objects.filter(status="RUNNING", locked_at__lt=now - timedelta(seconds=timeout))
+
+    failed = stale.filter(attempts__gte=F("max_attempts")).update(
+        status="FAILED",
+        last_error="worker lost (lock expired)",
+        locked_by="",
+        locked_at=None,
+        finished_at=now,
+        updated_at=now,
+    )
+    if failed:
+        logger.warning("%s stale job(s) failed after max attempts", failed)
+    return stale.filter(attempts__lt=F("max_attempts")).update(
+        status="QUEUED", locked_by="", locked_at=None, run_after=now, updated_at=now
+    )
+
+
+def purge_finished_jobs() -> int:
+    # 끝난(DONE/FAILED) 작업은 JOBS_RETENTION_DAYS 지나면 삭제 (payload가 계속 쌓이지 않게)
+    days = getattr(settings, "JOBS_RETENTION_DAYS", 7)
+    deleted, _ = Job.objects.filter(
+        status__in=["DONE", "FAILED"], finished_at__lt=timezone.now() - timedelta(days=days)
+    ).delete()
+    return deleted
+
+
+def work(worker_id: str, poll_interval=1.0, should_stop=None, once=False) -> int:
+    """
+    워커 루프: 작업을 하나씩 가져와 실행
+    - once=True: 지금 실행 가능한 작업이 없으면 종료
+    - should_stop(): True를 반환하면 현재 작업까지만 하고 종료
+    """
+    processed = 0
+    last_stale_check = 0.0
+
+    while not (should_stop and should_stop()):
+        close_old_connections()
+
+        if time.monotonic() - last_stale_check > 60:
+            requeue_stale_jobs()
+            purge_finished_jobs()
+            last_stale_check = time.monotonic()
+
+        job = claim_next(worker_id)
+        if job is None:
+            if once:
+                break
+            time.sleep(poll_interval)
+            continue
+
+        run_job(job)
+        processed += 1
+
+    close_old_connections()
+    return processed
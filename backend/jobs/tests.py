@@ -0,0 +1,120 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from . import services
+from .models import Job
+from .registry import task
+from .services import claim_next, enqueue, purge_finished_jobs, run_job
+
+CALLS = []
+
+
+@task("jobs.tests.record")
+def record(value=None):
+    CALLS.append(value)
+
+
+@task("jobs.tests.fail")
+def fail():
+    raise RuntimeError("boom")
+
+
+@override_settings(JOBS_EAGER=False, JOBS_BACKOFF_BASE=10, JOBS_BACKOFF_MAX=3600)
+class JobQueueTests(TestCase):
+    def setUp(self):
+        CALLS.clear()
+
+    def test_enqueue_dedupes_active_idempotency_key(self):
+        first = enqueue("jobs.tests.record", {"value": 1}, idempotency_key="k")
+        second = enqueue("jobs.tests.record", {"value": 2}, idempotency_key="k")
+        self.assertEqual(first.id, second.id)
+        self.assertEqual(Job.objects.count(), 1)
+
+        # 끝난 작업의 키는 다시 등록 가능
+        run_job(claim_next("w1"))
+        third = enqueue("jobs.tests.record", {"value": 3}, idempotency_key="k")
+        self.assertNotEqual(third.id, first.id)
+        self.assertEqual(Job.objects.filter(status="QUEUED").count(), 1)
+
+    def test_claim_next_no_double_claim(self):
+        low = enqueue("jobs.tests.record", {"value": "low"})
+        high = enqueue("jobs.tests.record", {"value": "high"}, priority=5)
+        enqueue("jobs.tests.record", {"value": "later"}, delay=60)
+
+        a, b = claim_next("w1"), claim_next("w2")
+        self.assertEqual((a.id, a.locked_by, a.attempts), (high.id, "w1", 1))
+        self.assertEqual((b.id, b.locked_by), (low.id, "w2"))
+        self.assertIsNone(claim_next("w3"))  # 남은 건 run_after 전
+
+    def test_claim_skips_job_taken_by_another_worker(self):
+        taken = enqueue("jobs.tests.record", {"value": 1})
+        free = enqueue("jobs.tests.record", {"value": 2})
+        Job.objects.filter(id=taken.id).update(status="RUNNING", locked_by="other", attempts=1)
+
+        # 다른 워커가 후보를 고른 직후 가져간 상황: 첫 후보는 compare-and-set에 실패해야 함
+        candidates = [Job.objects.filter(id=taken.id), Job.objects.filter(id=free.id)]
+        with mock.patch.object(services, "_claimable", side_effect=candidates):
+            claimed = claim_next("w1")
+        self.assertEqual(claimed.id, free.id)
+        taken.refresh_from_db()
+        self.assertEqual((taken.locked_by, taken.attempts), ("other", 1))
+
+    def test_run_job_retries_with_backoff_then_fails(self):
+        job = enqueue("jobs.tests.fail", max_attempts=2)
+
+        before = timezone.now()
+        self.assertFalse(run_job(claim_next("w1")))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts, job.locked_by), ("QUEUED", 1, ""))
+        self.assertIn("RuntimeError: boom", job.last_error)
+        self.assertGreaterEqual(job.run_after, before + timedelta(seconds=10))
+        self.assertIsNone(claim_next("w1"))  # backoff 동안은 안 가져감
+
+        Job.objects.filter(id=job.id).update(run_after=timezone.now())
+        self.assertFalse(run_job(claim_next("w1")))
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ("FAILED", 2))
+        self.assertIsNotNone(job.finished_at)
+
+    def test_run_job_success_and_unknown_task(self):
+        enqueue("jobs.tests.record", {"value": 7})
+        self.assertTrue(run_job(claim_next("w1")))
+        self.assertEqual(CALLS, [7])
+
+        unknown = enqueue("jobs.tests.missing")
+        self.assertFalse(run_job(claim_next("w1")))
+        unknown.refresh_from_db()
+        self.assertEqual(unknown.status, "FAILED")
+        self.assertEqual(Job.objects.filter(status="DONE").count(), 1)
+
+    @override_settings(JOBS_RETENTION_DAYS=7)
+    def test_purge_finished_jobs(self):
+        old = enqueue("jobs.tests.record")
+        recent = enqueue("jobs.tests.record")
+        queued = enqueue("jobs.tests.record")
+        Job.objects.filter(id=old.id).update(status="DONE", finished_at=timezone.now() - timedelta(days=8))
+        Job.objects.filter(id=recent.id).update(status="FAILED", finished_at=timezone.now() - timedelta(days=1))
+
+        self.assertEqual(purge_finished_jobs(), 1)
+        self.assertEqual(set(Job.objects.values_list("id", flat=True)), {recent.id, queued.id})
+
+    @override_settings(JOBS_LOCK_TIMEOUT=600)
+    def test_requeue_stale_jobs_counts_attempts(self):
+        retry = enqueue("jobs.tests.record", max_attempts=2)
+        spent = enqueue("jobs.tests.record", max_attempts=2)
+        alive = enqueue("jobs.tests.record", max_attempts=2)
+        old = timezone.now() - timedelta(seconds=601)
+        Job.objects.filter(id=retry.id).update(status="RUNNING", locked_by="dead", locked_at=old, attempts=1)
+        Job.objects.filter(id=spent.id).update(status="RUNNING", locked_by="dead", locked_at=old, attempts=2)
+        Job.objects.filter(id=alive.id).update(status="RUNNING", locked_by="w1", locked_at=old, attempts=1)
+
+        # heartbeat가 갱신한 작업은 오래 걸려도 그대로 둠
+        self.assertTrue(services._touch_lock(alive.id, "w1"))
+        self.assertFalse(services._touch_lock(retry.id, "w1"))
+
+        self.assertEqual(services.requeue_stale_jobs(), 1)
+        statuses = dict(Job.objects.values_list("id", "status"))
+        self.assertEqual(statuses, {retry.id: "QUEUED", spent.id: "FAILED", alive.id: "RUNNING"})
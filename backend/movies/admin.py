@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Movie, Genre, Person, MovieGenre, MovieCredit, HomeSectionEntry
+from .models import Movie, Genre, Person, MovieGenre, MovieCredit, HomeSection, HomeSectionEntry, SyncCursor, SyncRun
 
 
 @admin.register(Movie)
@@ -23,3 +23,11 @@ class PersonAdmin(admin.ModelAdmin):
 admin.site.register(MovieGenre)
 admin.site.register(MovieCredit)
 admin.site.register(HomeSectionEntry)
+admin.site.register(HomeSection)
+admin.site.register(SyncCursor)
+
+
+@admin.register(SyncRun)
+class SyncRunAdmin(admin.ModelAdmin):
+    list_display = ("id", "kind", "status", "last_page", "total_pages", "movies_count", "failures_count", "started_at", "finished_at")
+    list_filter = ("kind", "status")
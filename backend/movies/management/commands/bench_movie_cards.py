@@ -0,0 +1,126 @@
+# backend/movies/management/commands/bench_movie_cards.py
+
+import random
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from rest_framework.renderers import JSONRenderer
+
+from movies.models import Genre, Movie, MovieGenre
+from movies.serializers import MovieListSerializer, serialize_movie_cards
+from reviews.models import Review
+from reviews.services.top_reviews import rebuild_top_reviews
+
+
+class SqlCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class Command(BaseCommand):
+    help = "카드 목록 직렬화 속도 비교: MovieListSerializer(DRF) vs serialize_movie_cards (임시 테스트 DB 사용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--movies", type=int, default=1000, help="만들 영화 수")
+        parser.add_argument("--page-size", type=int, default=50, help="한 번에 직렬화할 카드 수")
+        parser.add_argument("--repeat", type=int, default=50)
+        parser.add_argument("--fields", default="", help="빠른 경로에만 적용할 필드 목록 (예: tmdb_id,title,poster_path)")
+
+    def handle(self, *args, **options):
+        # ✅ 실제 DB를 건드리지 않게 임시 테스트 DB에서 측정
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            self._seed(options["movies"])
+            rows = self._run(options)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+
+        self.stdout.write(f"{'방식':<8}{'ms/페이지':>12}{'µs/카드':>10}{'SQL':>6}{'바이트':>9}")
+        for r in rows:
+            self.stdout.write(f"{r['name']:<8}{r['ms']:>12.2f}{r['us_per_card']:>10.1f}{r['sql']:>6}{r['bytes']:>9}")
+        self.stdout.write(self.style.SUCCESS(f"✅ 완료: {rows[0]['ms'] / rows[1]['ms']:.1f}배 빠름"))
+
+    def _seed(self, n):
+        rng = random.Random(42)
+        genres = Genre.objects.bulk_create([Genre(tmdb_id=100 + i, name=f"장르{i}") for i in range(19)])
+        movies = Movie.objects.bulk_create(
+            [
+                Movie(
+                    tmdb_id=i + 1,
+                    title=f"영화 {i}",
+                    original_title=f"Movie {i}",
+                    poster_path=f"/p{i}.jpg",
+                    backdrop_path=f"/b{i}.jpg" if i % 5 else "",
+                    release_date=date(2000, 1, 1) + timedelta(days=i) if i % 7 else None,
+                    popularity=rng.uniform(0, 500),
+                    vote_average=round(rng.uniform(0, 10), 1),
+                    vote_count=rng.randint(0, 20000),
+                )
+                for i in range(n)
+            ]
+        )
+        MovieGenre.objects.bulk_create(
+            [MovieGenre(movie=m, genre=g) for m in movies for g in rng.sample(genres, rng.randint(1, 4))]
+        )
+
+        users = [
+            get_user_model().objects.create_user(username=f"bench{i}", email=f"bench{i}@example.com", password="x")
+            for i in range(20)
+        ]
+        Review.objects.bulk_create(
+            [
+                Review(user=u, movie=m, content=f"{m.title} 한줄평", watched=True, rating=rng.randint(1, 5))
+                for m in movies[: n // 2]
+                for u in rng.sample(users, 3)
+            ]
+        )
+        rebuild_top_reviews()
+
+    def _run(self, options):
+        page_size, repeat = options["page_size"], options["repeat"]
+        fields = tuple(f.strip() for f in options["fields"].split(",") if f.strip()) or None
+        renderer = JSONRenderer()
+        qs = Movie.objects.order_by("-popularity", "-vote_count", "tmdb_id")
+
+        offsets = [i * page_size for i in range(max(Movie.objects.count() // page_size, 1))]
+
+        def drf(offset):
+            return renderer.render(MovieListSerializer(qs[offset:offset + page_size], many=True).data)
+
+        def fast(offset):
+            return renderer.render(serialize_movie_cards(qs[offset:offset + page_size], fields))
+
+        if fields is None:
+            # 기본 필드는 바이트 단위로 같아야 함
+            for offset in offsets:
+                if drf(offset) != fast(offset):
+                    raise CommandError(f"출력이 다릅니다 (offset={offset})")
+            self.stdout.write(self.style.SUCCESS(f"1) 출력 동일 확인: {len(offsets)}페이지"))
+
+        return [self._measure("drf", drf, offsets, repeat, page_size), self._measure("fast", fast, offsets, repeat, page_size)]
+
+    def _measure(self, name, func, offsets, repeat, page_size):
+        counter = SqlCounter()
+        with connection.execute_wrapper(counter):
+            size = len(func(offsets[0]))
+        sql = counter.count
+
+        started = time.perf_counter()
+        for i in range(repeat):
+            func(offsets[i % len(offsets)])
+        seconds = (time.perf_counter() - started) / repeat
+        return {
+            "name": name,
+            "ms": seconds * 1000,
+            "us_per_card": seconds * 1e6 / page_size,
+            "sql": sql,
+            "bytes": size,
+        }
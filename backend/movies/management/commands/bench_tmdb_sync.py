@@ -0,0 +1,116 @@
+# backend/movies/management/commands/bench_tmdb_sync.py
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+
+from movies.services import tmdb
+from movies.services.fake_tmdb import PAGE_SIZE, start_in_thread
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class SqlCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    # Linux는 KB 단위
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class Command(BaseCommand):
+    help = "fake TMDB 서버로 sync_bulk_movies / sync_home_section 처리량 측정 (임시 테스트 DB 사용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--pages", type=int, default=10, help="bulk 동기화 페이지 수")
+        parser.add_argument("--home-pages", type=int, default=1, help="홈 섹션당 페이지 수")
+        parser.add_argument("--with-detail", action="store_true")
+        parser.add_argument("--with-credits", action="store_true")
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument("--latency", type=float, default=0.03, help="fake 서버 응답 지연(초)")
+        parser.add_argument("--error-rate", type=float, default=0.0, help="fake 서버 429 비율")
+        parser.add_argument("--rate", type=float, default=None, help="TMDB_RATE_LIMIT 덮어쓰기(초당 요청)")
+        parser.add_argument("--cache", action="store_true", help="TMDB 응답 캐시 사용(기본은 끔)")
+
+    def handle(self, *args, **options):
+        server = start_in_thread(latency=options["latency"], error_rate=options["error_rate"])
+        overrides = {"TMDB_BASE_URL": server.base_url, "TMDB_CACHE_ENABLED": options["cache"]}
+        if options["rate"]:
+            overrides["TMDB_RATE_LIMIT"] = options["rate"]
+
+        # ✅ 실제 DB를 건드리지 않게 임시 테스트 DB에서 측정
+        old_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, autoclobber=True)
+        try:
+            with override_settings(**overrides):
+                tmdb.reset_client()
+                tmdb.fetch_and_sync_genre_master()
+                rows = [
+                    self._measure(
+                        "bulk",
+                        server,
+                        lambda: tmdb.sync_bulk_movies(
+                            pages=options["pages"],
+                            with_detail=options["with_detail"],
+                            with_credits=options["with_credits"],
+                            concurrency=options["concurrency"],
+                        ),
+                    ),
+                    self._measure("home", server, lambda: self._sync_home(options)),
+                ]
+        finally:
+            tmdb.reset_client()
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            server.shutdown()
+
+        self.stdout.write(f"{'단계':<6}{'영화':>7}{'초':>9}{'영화/초':>10}{'SQL':>8}{'SQL/영화':>10}{'HTTP':>7}{'429':>6}")
+        for r in rows:
+            self.stdout.write(
+                f"{r['name']:<6}{r['movies']:>7}{r['seconds']:>9.2f}{r['movies_per_sec']:>10.1f}"
+                f"{r['sql']:>8}{r['sql_per_movie']:>10.1f}{r['http']:>7}{r['throttled']:>6}"
+            )
+        rss = _peak_rss_mb()
+        if rss is not None:
+            self.stdout.write(f"peak RSS: {rss:.1f} MB")
+
+    def _sync_home(self, options):
+        movies = 0
+        for code, path in [
+            ("POPULAR", "/movie/popular"),
+            ("NOW_PLAYING", "/movie/now_playing"),
+            ("TOP_RATED", "/movie/top_rated"),
+        ]:
+            tmdb.sync_home_section(code, path, pages=options["home_pages"], concurrency=options["concurrency"])
+            movies += options["home_pages"] * PAGE_SIZE
+        return movies
+
+    def _measure(self, name, server, func):
+        counter = SqlCounter()
+        before = dict(server.stats)
+        started = time.perf_counter()
+        with connection.execute_wrapper(counter):
+            movies = func()
+        seconds = time.perf_counter() - started
+        return {
+            "name": name,
+            "movies": movies,
+            "seconds": seconds,
+            "movies_per_sec": movies / seconds if seconds else 0,
+            "sql": counter.count,
+            "sql_per_movie": counter.count / movies if movies else 0,
+            "http": server.stats["requests"] - before["requests"],
+            "throttled": server.stats["throttled"] - before["throttled"],
+        }
@@ -0,0 +1,23 @@
+# backend/movies/management/commands/build_movie_neighbors.py
+
+from django.core.management.base import BaseCommand
+from movies.services.neighbors import TOP_K, build_movie_neighbors
+
+
+class Command(BaseCommand):
+    help = "비슷한 영화(MovieNeighbor) top-K 계산 (기본: 지난 실행 이후 바뀐 영화만)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--full", action="store_true", help="전체 영화 다시 계산")
+        parser.add_argument("--top-k", type=int, default=TOP_K, help="영화별 저장할 이웃 수")
+        parser.add_argument("--batch-size", type=int, default=256, help="한 번에 계산할 영화 수(메모리 = batch x 전체 영화 수)")
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS("1) 비슷한 영화 계산..."))
+        result = build_movie_neighbors(
+            full=options["full"],
+            top_k=options["top_k"],
+            batch_size=options["batch_size"],
+        )
+        mode = "전체" if result["full"] else "증분"
+        self.stdout.write(self.style.SUCCESS(f"✅ 완료({mode}): {result['targets']}개 영화 갱신"))
@@ -0,0 +1,32 @@
+# backend/movies/management/commands/fake_tmdb_server.py
+
+from django.core.management.base import BaseCommand
+from movies.services.fake_tmdb import make_server
+
+
+class Command(BaseCommand):
+    help = "오프라인 TMDB 대역 서버 실행 (TMDB_BASE_URL=http://127.0.0.1:PORT/3 로 연결)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", type=str, default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8765)
+        parser.add_argument("--latency", type=float, default=0.0, help="응답 지연(초)")
+        parser.add_argument("--error-rate", type=float, default=0.0, help="429 응답 비율(0~1)")
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        server = make_server(
+            host=options["host"],
+            port=options["port"],
+            latency=options["latency"],
+            error_rate=options["error_rate"],
+            seed=options["seed"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"fake TMDB: http://{options['host']}:{options['port']}/3 (Ctrl+C로 종료)"))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self.stdout.write(f"요청 {server.stats['requests']}건, 429 {server.stats['throttled']}건")
@@ -0,0 +1,21 @@
+# backend/movies/management/commands/rebuild_search_index.py
+
+from django.core.management.base import BaseCommand
+from movies.services.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = "영화/인물 검색 색인(SearchEntry + FTS) 전체 재구성"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 색인할 행 수")
+
+    def handle(self, *args, **options):
+        def on_batch(kind, done):
+            self.stdout.write(f"  - {kind}: {done}개")
+
+        self.stdout.write(self.style.SUCCESS("1) 검색 색인 재구성..."))
+        counts = rebuild_search_index(batch_size=options["batch_size"], on_batch=on_batch)
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ 완료: 영화 {counts['movie']}개, 인물 {counts['person']}개")
+        )
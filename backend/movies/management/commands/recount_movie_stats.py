@@ -0,0 +1,39 @@
+# backend/movies/management/commands/recount_movie_stats.py
+
+from django.core.management.base import BaseCommand
+from movies.services.stats import recount_movie_stats
+
+
+class Command(BaseCommand):
+    help = "Movie 반응 집계(좋아요/리뷰/보고싶어요/별점 합계)를 실제 테이블 기준으로 재계산"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 재계산할 영화 수")
+        parser.add_argument("--top-reviews", action="store_true", help="영화별 대표 리뷰(MovieTopReview)도 다시 계산")
+        parser.add_argument("--review-likes", action="store_true", help="리뷰 좋아요 수(Review.like_count)도 다시 계산")
+
+    def handle(self, *args, **options):
+        def on_batch(checked, fixed):
+            self.stdout.write(f"  - {checked}개 확인, {fixed}개 보정")
+
+        self.stdout.write(self.style.SUCCESS("1) 반응 집계 재계산..."))
+        result = recount_movie_stats(batch_size=options["batch_size"], on_batch=on_batch)
+
+        step = 2
+        if options["review_likes"]:
+            from reviews.services.likes import recount_review_likes
+
+            self.stdout.write(self.style.SUCCESS(f"{step}) 리뷰 좋아요 수 재계산..."))
+            recount_review_likes(batch_size=options["batch_size"], on_batch=on_batch)
+            step += 1
+
+        if options["top_reviews"]:
+            from reviews.services.top_reviews import rebuild_top_reviews
+
+            # 대표 리뷰는 like_count 기준이라 좋아요 수 보정 뒤에
+            self.stdout.write(self.style.SUCCESS(f"{step}) 대표 리뷰 재계산..."))
+            rebuild_top_reviews()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✅ 완료: {result['checked']}개 중 {result['fixed']}개 보정")
+        )
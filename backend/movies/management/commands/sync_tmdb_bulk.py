@@ -1,5 +1,7 @@
+import time
+
 from django.core.management.base import BaseCommand
-from movies.services.tmdb import fetch_and_sync_genre_master, sync_bulk_movies
+from movies.services.tmdb import fetch_and_sync_genre_master, sync_bulk_movies, find_resumable_run, format_cache_stats
 
 class Command(BaseCommand):
     help = "TMDB discover/movie로 영화 다량(예: 500개) 동기화"
@@ -9,7 +11,9 @@ class Command(BaseCommand):
         parser.add_argument("--sort", type=str, default="popularity.desc", help="TMDB sort_by")
         parser.add_argument("--with-credits", action="store_true", help="credits(감독/출연진)까지 동기화")
         parser.add_argument("--with-detail", action="store_true", help="detail(runtime/genres 보정)까지 동기화")
-        parser.add_argument("--sleep", type=float, default=0.2, help="요청 간 sleep(초)")
+        parser.add_argument("--sleep", type=float, default=0, help="페이지 간 추가 sleep(초), 기본은 rate limiter가 조절")
+        parser.add_argument("--concurrency", type=int, default=8, help="TMDB 동시 요청 수")
+        parser.add_argument("--resume", action="store_true", help="같은 조건으로 중단된 마지막 실행을 이어서 진행")
 
     def handle(self, *args, **options):
         pages = options["pages"]
@@ -17,17 +21,54 @@ class Command(BaseCommand):
         with_credits = options["with_credits"]
         with_detail = options["with_detail"]
         sleep_sec = options["sleep"]
+        concurrency = options["concurrency"]
+
+        run = None
+        if options["resume"]:
+            params = {"sort_by": sort_by, "with_credits": with_credits, "with_detail": with_detail}
+            run = find_resumable_run("bulk", params)
+            if run:
+                self.stdout.write(self.style.WARNING(f"↪ 이어받기: SyncRun #{run.id} ({run.last_page}페이지까지 완료)"))
+            else:
+                self.stdout.write(self.style.WARNING("↪ 이어받을 실행이 없어 처음부터 진행"))
 
         self.stdout.write(self.style.SUCCESS("1) Genre master 동기화..."))
         fetch_and_sync_genre_master()
 
-        self.stdout.write(self.style.SUCCESS(f"2) Bulk movies 동기화... pages={pages} (≈{pages*20}개)"))
-        total = sync_bulk_movies(
-            pages=pages,
-            sort_by=sort_by,
-            with_credits=with_credits,
-            with_detail=with_detail,
-            sleep_sec=sleep_sec,
-        )
+        self.stdout.write(self.style.SUCCESS(f"2) Bulk movies 동기화... pages={pages} (≈{pages*20}개), concurrency={concurrency}"))
+
+        started = time.monotonic()
+        first_page = run.last_page if run else 0
+
+        def on_progress(r):
+            done = r.last_page - first_page
+            elapsed = max(time.monotonic() - started, 1e-6)
+            rate = done / elapsed
+            remain = r.total_pages - r.last_page
+            eta = remain / rate if rate > 0 else 0
+            self.stdout.write(
+                f"\r  [{r.last_page}/{r.total_pages}] {rate:.2f} pages/s, ETA {eta:.0f}s, "
+                f"영화 {r.movies_count}개, 실패 {r.failures_count}개",
+                ending="",
+            )
+            self.stdout.flush()
+
+        try:
+            total = sync_bulk_movies(
+                pages=pages,
+                sort_by=sort_by,
+                with_credits=with_credits,
+                with_detail=with_detail,
+                sleep_sec=sleep_sec,
+                concurrency=concurrency,
+                run=run,
+                on_progress=on_progress,
+            )
+        except BaseException:
+            self.stdout.write("")
+            self.stdout.write(self.style.ERROR("❌ 중단됨: 같은 옵션에 --resume을 붙이면 이어서 진행합니다."))
+            raise
 
+        self.stdout.write("")
         self.stdout.write(self.style.SUCCESS(f"✅ 완료: {total}개 upsert"))
+        self.stdout.write(format_cache_stats())
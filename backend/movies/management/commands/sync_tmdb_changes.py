@@ -0,0 +1,28 @@
+# backend/movies/management/commands/sync_tmdb_changes.py
+
+from django.core.management.base import BaseCommand
+from movies.services.tmdb import sync_changed_movies, format_cache_stats
+
+
+class Command(BaseCommand):
+    help = "TMDB change feed(/movie/changes) 기반 증분 동기화 (우리 DB에 있는 영화만 재수집)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=None, help="커서 대신 최근 N일 변경분을 다시 조회(14일씩 나눠서)")
+        parser.add_argument("--concurrency", type=int, default=8, help="TMDB 동시 요청 수")
+
+    def handle(self, *args, **options):
+        days = options["days"]
+        concurrency = options["concurrency"]
+
+        self.stdout.write(self.style.SUCCESS("1) 변경된 영화 동기화..."))
+        result = sync_changed_movies(days=days, concurrency=concurrency)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✅ 완료({result['windows']}개 구간): 변경 {result['changed']}개 중 보유 {result['matched']}개, "
+                f"갱신 {result['refreshed']}개, 실패 {result['failed']}개 "
+                f"(재시도 대상 {result['retried']}개, 포기 {result['gave_up']}개)"
+            )
+        )
+        self.stdout.write(format_cache_stats())
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.9 on 2026-10-18 19:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0005_synccursor'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HomeSection',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('section', models.CharField(choices=[('POPULAR', 'Popular'), ('NOW_PLAYING', 'Now Playing'), ('TOP_RATED', 'Top Rated')], max_length=20, unique=True)),
+                ('active_generation', models.PositiveIntegerField(default=0)),
+                ('synced_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.RemoveConstraint(
+            model_name='homesectionentry',
+            name='unique_section_movie',
+        ),
+        migrations.AddField(
+            model_name='homesectionentry',
+            name='generation',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='homesectionentry',
+            index=models.Index(fields=['section', 'generation', 'rank'], name='home_entry_gen_rank_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='homesectionentry',
+            constraint=models.UniqueConstraint(fields=('section', 'generation', 'movie'), name='unique_section_generation_movie'),
+        ),
+    ]
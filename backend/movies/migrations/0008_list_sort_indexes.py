@@ -0,0 +1,47 @@
+# Generated by Django 5.2.9 on 2026-10-18 19:40
+
+from django.db import migrations, models
+
+
+# PostgreSQL은 DESC 정렬에서 NULL이 맨 앞이라, 목록의 "NULLS LAST" 정렬용 인덱스를 따로 둠
+# (SQLite는 DESC에서 NULL이 원래 맨 뒤라 movie_latest_idx로 충분)
+def create_pg_latest_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS movie_latest_nl_idx ON movies_movie "
+        "(release_date DESC NULLS LAST, popularity DESC, tmdb_id DESC)"
+    )
+
+
+def drop_pg_latest_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS movie_latest_nl_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0007_syncrun'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['-popularity', '-vote_count', '-tmdb_id'], name='movie_popular_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['-release_date', '-popularity', '-tmdb_id'], name='movie_latest_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['-vote_average', '-vote_count', '-tmdb_id'], name='movie_rating_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='moviegenre',
+            index=models.Index(fields=['genre', 'movie'], name='moviegenre_genre_movie_idx'),
+        ),
+        migrations.RunPython(create_pg_latest_index, drop_pg_latest_index),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.2.9 on 2026-10-18 19:41
+
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+
+
+def backfill_counters(apps, schema_editor):
+    Movie = apps.get_model("movies", "Movie")
+    MovieLike = apps.get_model("movies", "MovieLike")
+    Review = apps.get_model("reviews", "Review")
+
+    stats = {}
+    for row in MovieLike.objects.order_by().values("movie_id").annotate(n=Count("id")):
+        stats.setdefault(row["movie_id"], {})["like_count"] = row["n"]
+    rows = Review.objects.order_by().values("movie_id").annotate(
+        review_count=Count("id", filter=Q(watched=True)),
+        wish_count=Count("id", filter=Q(watched=False)),
+        rating_sum=Sum("rating", filter=Q(watched=True)),
+    )
+    for row in rows:
+        s = stats.setdefault(row["movie_id"], {})
+        s["review_count"] = row["review_count"]
+        s["wish_count"] = row["wish_count"]
+        s["rating_sum"] = row["rating_sum"] or 0
+
+    fields = ["like_count", "review_count", "wish_count", "rating_sum"]
+    Movie.objects.bulk_update(
+        [Movie(id=movie_id, **{f: s.get(f, 0) for f in fields}) for movie_id, s in stats.items()],
+        fields,
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0008_list_sort_indexes'),
+        ('reviews', '0003_movietopreview'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='rating_sum',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='review_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='movie',
+            name='wish_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['-like_count', '-popularity', '-tmdb_id'], name='movie_likes_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='movie',
+            index=models.Index(fields=['-review_count', '-popularity', '-tmdb_id'], name='movie_reviews_idx'),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
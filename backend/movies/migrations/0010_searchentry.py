@@ -0,0 +1,156 @@
+# Generated by Django 5.2.9 on 2026-10-18 19:44
+
+import math
+import re
+import unicodedata
+
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.utils import OperationalError
+
+SQLITE_FTS = [
+    "CREATE VIRTUAL TABLE movies_search_fts USING fts5("
+    "title_tokens, body_tokens, content='movies_searchentry', content_rowid='id')",
+    "CREATE TRIGGER movies_searchentry_ai AFTER INSERT ON movies_searchentry BEGIN "
+    "INSERT INTO movies_search_fts(rowid, title_tokens, body_tokens) "
+    "VALUES (new.id, new.title_tokens, new.body_tokens); END",
+    "CREATE TRIGGER movies_searchentry_ad AFTER DELETE ON movies_searchentry BEGIN "
+    "INSERT INTO movies_search_fts(movies_search_fts, rowid, title_tokens, body_tokens) "
+    "VALUES ('delete', old.id, old.title_tokens, old.body_tokens); END",
+    "CREATE TRIGGER movies_searchentry_au AFTER UPDATE ON movies_searchentry BEGIN "
+    "INSERT INTO movies_search_fts(movies_search_fts, rowid, title_tokens, body_tokens) "
+    "VALUES ('delete', old.id, old.title_tokens, old.body_tokens); "
+    "INSERT INTO movies_search_fts(rowid, title_tokens, body_tokens) "
+    "VALUES (new.id, new.title_tokens, new.body_tokens); END",
+]
+SQLITE_FTS_DROP = [
+    "DROP TRIGGER IF EXISTS movies_searchentry_ai",
+    "DROP TRIGGER IF EXISTS movies_searchentry_ad",
+    "DROP TRIGGER IF EXISTS movies_searchentry_au",
+    "DROP TABLE IF EXISTS movies_search_fts",
+]
+# movies.services.search.PG_DOCUMENT와 같은 식
+PG_INDEX = (
+    "CREATE INDEX movies_searchentry_doc_gin ON movies_searchentry USING GIN (("
+    "setweight(to_tsvector('simple', title_tokens), 'A') || "
+    "setweight(to_tsvector('simple', body_tokens), 'B')))"
+)
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        try:
+            for sql in SQLITE_FTS:
+                schema_editor.execute(sql)
+        except OperationalError:
+            # FTS5 없이 빌드된 SQLite → 검색은 icontains로 동작
+            for sql in SQLITE_FTS_DROP:
+                schema_editor.execute(sql)
+    elif vendor == "postgresql":
+        schema_editor.execute(PG_INDEX)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        for sql in SQLITE_FTS_DROP:
+            schema_editor.execute(sql)
+    elif vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS movies_searchentry_doc_gin")
+
+
+# ✅ 이 마이그레이션 시점의 토크나이저 복사본 (movies.services.search를 고쳐도 이 마이그레이션 결과는 그대로)
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def _is_cjk(ch):
+    o = ord(ch)
+    return (
+        0xAC00 <= o <= 0xD7A3
+        or 0x1100 <= o <= 0x11FF
+        or 0x3130 <= o <= 0x318F
+        or 0x3040 <= o <= 0x30FF
+        or 0x4E00 <= o <= 0x9FFF
+    )
+
+
+def _tokenize(*texts):
+    tokens = []
+    for text in texts:
+        text = unicodedata.normalize("NFKC", text or "").lower()
+        for word in _WORD_RE.findall(text):
+            start = 0
+            for i in range(1, len(word) + 1):
+                if i == len(word) or _is_cjk(word[i]) != _is_cjk(word[start]):
+                    run = word[start:i]
+                    if _is_cjk(run[0]) and len(run) > 1:
+                        tokens.extend(run[j:j + 2] for j in range(len(run) - 1))
+                    else:
+                        tokens.append(run)
+                    start = i
+    return " ".join(dict.fromkeys(tokens))
+
+
+def movie_entry_fields(title, original_title, overview, popularity):
+    return {
+        "title_tokens": _tokenize(title, original_title),
+        "body_tokens": _tokenize(overview),
+        "boost": math.log1p(max(popularity or 0, 0)),
+    }
+
+
+def person_entry_fields(name, credits_count):
+    return {
+        "title_tokens": _tokenize(name),
+        "body_tokens": "",
+        "boost": math.log1p(credits_count or 0),
+    }
+
+
+def backfill_search_entries(apps, schema_editor):
+    Movie = apps.get_model("movies", "Movie")
+    Person = apps.get_model("movies", "Person")
+    MovieCredit = apps.get_model("movies", "MovieCredit")
+    SearchEntry = apps.get_model("movies", "SearchEntry")
+
+    entries = [
+        SearchEntry(kind="movie", object_id=pk, **movie_entry_fields(title, original_title, overview, popularity))
+        for pk, title, original_title, overview, popularity in Movie.objects.values_list(
+            "id", "title", "original_title", "overview", "popularity"
+        ).iterator()
+    ]
+    counts = dict(
+        MovieCredit.objects.order_by().values("person_id").annotate(n=Count("id")).values_list("person_id", "n")
+    )
+    entries += [
+        SearchEntry(kind="person", object_id=pk, **person_entry_fields(name, counts.get(pk, 0)))
+        for pk, name in Person.objects.values_list("id", "name").iterator()
+    ]
+    SearchEntry.objects.bulk_create(entries, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0009_movie_engagement_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('movie', 'Movie'), ('person', 'Person')], max_length=10)),
+                ('object_id', models.PositiveIntegerField()),
+                ('title_tokens', models.TextField(blank=True)),
+                ('body_tokens', models.TextField(blank=True)),
+                ('boost', models.FloatField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='unique_search_entry')],
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+        migrations.RunPython(backfill_search_entries, migrations.RunPython.noop),
+    ]
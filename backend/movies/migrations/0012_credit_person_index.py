@@ -0,0 +1,17 @@
+# Generated by Django 5.2.9 on 2026-10-18 19:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0011_movieneighbor'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='moviecredit',
+            index=models.Index(fields=['person', 'role_type', 'order'], name='credit_person_role_order_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0012_credit_person_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='synccursor',
+            name='retry_ids',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0013_synccursor_retry_ids'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='movie',
+            name='detail_refreshed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
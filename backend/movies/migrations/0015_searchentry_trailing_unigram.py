@@ -0,0 +1,91 @@
+# Generated by Django 5.2.9 on 2026-10-18 21:12
+
+import re
+import unicodedata
+
+from django.db import migrations
+
+# ✅ 이 마이그레이션 시점의 토크나이저 복사본: 한글(CJK) 구간은 n-gram + 마지막 글자
+# ("정" 검색이 "밀정"에 걸리도록). movies.services.search를 고쳐도 이 마이그레이션 결과는 그대로
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def _is_cjk(ch):
+    o = ord(ch)
+    return (
+        0xAC00 <= o <= 0xD7A3
+        or 0x1100 <= o <= 0x11FF
+        or 0x3130 <= o <= 0x318F
+        or 0x3040 <= o <= 0x30FF
+        or 0x4E00 <= o <= 0x9FFF
+    )
+
+
+def _tokenize(*texts):
+    tokens = []
+    for text in texts:
+        text = unicodedata.normalize("NFKC", text or "").lower()
+        for word in _WORD_RE.findall(text):
+            start = 0
+            for i in range(1, len(word) + 1):
+                if i == len(word) or _is_cjk(word[i]) != _is_cjk(word[start]):
+                    run = word[start:i]
+                    if _is_cjk(run[0]) and len(run) > 1:
+                        tokens.extend(run[j:j + 2] for j in range(len(run) - 1))
+                        tokens.append(run[-1])
+                    else:
+                        tokens.append(run)
+                    start = i
+    return " ".join(dict.fromkeys(tokens))
+
+
+def retokenize_search_entries(apps, schema_editor):
+    # 토큰만 다시 계산 (boost는 그대로) / FTS 테이블은 UPDATE 트리거가 같이 갱신
+    Movie = apps.get_model("movies", "Movie")
+    Person = apps.get_model("movies", "Person")
+    SearchEntry = apps.get_model("movies", "SearchEntry")
+
+    batch_size = 1000
+    last_id = 0
+    while True:
+        entries = list(
+            SearchEntry.objects.filter(id__gt=last_id).order_by("id").only("id", "kind", "object_id")[:batch_size]
+        )
+        if not entries:
+            break
+        last_id = entries[-1].id
+
+        movies = {
+            pk: (title, original_title, overview)
+            for pk, title, original_title, overview in Movie.objects.filter(
+                id__in=[e.object_id for e in entries if e.kind == "movie"]
+            ).values_list("id", "title", "original_title", "overview")
+        }
+        people = dict(
+            Person.objects.filter(id__in=[e.object_id for e in entries if e.kind == "person"]).values_list("id", "name")
+        )
+
+        changed = []
+        for e in entries:
+            if e.kind == "movie" and e.object_id in movies:
+                title, original_title, overview = movies[e.object_id]
+                e.title_tokens = _tokenize(title, original_title)
+                e.body_tokens = _tokenize(overview)
+            elif e.kind == "person" and e.object_id in people:
+                e.title_tokens = _tokenize(people[e.object_id])
+                e.body_tokens = ""
+            else:
+                continue
+            changed.append(e)
+        SearchEntry.objects.bulk_update(changed, ["title_tokens", "body_tokens"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0014_movie_detail_refreshed_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(retokenize_search_entries, migrations.RunPython.noop),
+    ]
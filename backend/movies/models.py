@@ -42,7 +42,32 @@ class Movie(models.Model):
     genres = models.ManyToManyField(Genre, through="MovieGenre", related_name="movies")
     people = models.ManyToManyField(Person, through="MovieCredit", related_name="movies")
 
+    # ✅ 우리 서비스 안의 반응 집계 (movies.services.stats로 증감, recount_movie_stats로 보정)
+    like_count = models.PositiveIntegerField(default=0)      # MovieLike
+    review_count = models.PositiveIntegerField(default=0)    # 봤어요 리뷰(watched=True)
+    wish_count = models.PositiveIntegerField(default=0)      # 보고싶어요(watched=False)
+    rating_sum = models.PositiveIntegerField(default=0)      # 봤어요 리뷰 별점 합계 (평균 = rating_sum / review_count)
+
     updated_at = models.DateTimeField(auto_now=True)
+    # ✅ 마지막 상세 갱신 시도 시각 (movies.refresh_movie, 실패해도 기록)
+    # - TMDB에도 런타임/크레딧이 없는 영화가 조회마다 다시 예약되지 않게
+    detail_refreshed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        # ✅ 목록 정렬(movie_list sort=popular|latest|rating|likes|reviews) + 커서 페이지네이션용
+        indexes = [
+            models.Index(fields=["-popularity", "-vote_count", "-tmdb_id"], name="movie_popular_idx"),
+            models.Index(fields=["-release_date", "-popularity", "-tmdb_id"], name="movie_latest_idx"),
+            models.Index(fields=["-vote_average", "-vote_count", "-tmdb_id"], name="movie_rating_idx"),
+            models.Index(fields=["-like_count", "-popularity", "-tmdb_id"], name="movie_likes_idx"),
+            models.Index(fields=["-review_count", "-popularity", "-tmdb_id"], name="movie_reviews_idx"),
+        ]
+
+    @property
+    def rating_avg(self):
+        if not self.review_count:
+            return None
+        return round(self.rating_sum / self.review_count, 1)
 
     def __str__(self):
         return self.title
@@ -56,6 +81,10 @@ class MovieGenre(models.Model):
         constraints = [
             models.UniqueConstraint(fields=["movie", "genre"], name="unique_movie_genre")
         ]
+        indexes = [
+            # 장르 필터: genre → movie 방향 조회
+            models.Index(fields=["genre", "movie"], name="moviegenre_genre_movie_idx"),
+        ]
 
 
 class MovieCredit(models.Model):
@@ -76,6 +105,110 @@ class MovieCredit(models.Model):
         constraints = [
             models.UniqueConstraint(fields=["movie", "person", "role_type"], name="unique_credit")
         ]
+        indexes = [
+            # 인물 필모그래피: person → role_type, order 순서 그대로 읽기
+            models.Index(fields=["person", "role_type", "order"], name="credit_person_role_order_idx"),
+        ]
+
+
+class SyncCursor(models.Model):
+    """
+    TMDB 증분 동기화 위치 기록
+    - name: 동기화 종류 (예: movie_changes)
+    - last_synced_at: 마지막으로 반영을 끝낸 시각 (다음 실행은 여기서부터)
+    - retry_ids: 재수집에 실패한 tmdb_id → 실패 횟수 (다음 실행에서 변경분과 같이 다시 시도)
+    """
+    name = models.CharField(max_length=50, unique=True)
+    last_synced_at = models.DateTimeField(null=True, blank=True)
+    retry_ids = models.JSONField(default=dict, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} @ {self.last_synced_at}"
+
+
+class SyncRun(models.Model):
+    """
+    대량 동기화 실행 기록 (페이지 단위 커밋 + --resume 이어받기)
+    - last_page: 마지막으로 커밋까지 끝난 페이지
+    - errors: 최근 실패 내역 일부 (tmdb_id/페이지 + 메시지)
+    """
+    STATUS_CHOICES = [
+        ("RUNNING", "Running"),
+        ("DONE", "Done"),
+        ("FAILED", "Failed"),
+    ]
+    MAX_ERRORS = 50
+
+    kind = models.CharField(max_length=30)
+    params = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default="RUNNING")
+
+    total_pages = models.PositiveIntegerField(default=0)
+    last_page = models.PositiveIntegerField(default=0)
+    movies_count = models.PositiveIntegerField(default=0)
+    failures_count = models.PositiveIntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)
+
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-started_at"]
+
+    def __str__(self):
+        return f"{self.kind} {self.status} {self.last_page}/{self.total_pages}"
+
+    def add_error(self, where, message):
+        self.failures_count += 1
+        self.errors = (self.errors + [{"where": str(where), "error": str(message)[:300]}])[-self.MAX_ERRORS:]
+
+
+class MovieNeighbor(models.Model):
+    """
+    비슷한 영화 top-K (movies.services.neighbors 배치가 계산)
+    - 장르 + 감독/출연진 겹침 + 좋아요 동시 발생을 합친 유사도 순 rank
+    """
+    movie = models.ForeignKey(Movie, on_delete=models.CASCADE, related_name="neighbors")
+    neighbor = models.ForeignKey(Movie, on_delete=models.CASCADE, related_name="neighbor_of")
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["movie", "rank"], name="unique_movie_neighbor_rank")
+        ]
+        ordering = ["rank"]
+
+    def __str__(self):
+        return f"{self.movie_id} -> {self.neighbor_id} (#{self.rank})"
+
+
+class SearchEntry(models.Model):
+    """
+    영화/인물 검색 색인 (movies.services.search)
+    - title_tokens: 제목/원제/이름, body_tokens: 줄거리 → n-gram 토큰을 공백으로 이어 붙인 값
+    - SQLite: FTS5 테이블(movies_search_fts)이 이 테이블을 content로 참조
+    - PostgreSQL: 두 컬럼의 tsvector GIN 인덱스
+    """
+    KIND_CHOICES = [
+        ("movie", "Movie"),
+        ("person", "Person"),
+    ]
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.PositiveIntegerField()  # Movie.pk / Person.pk
+    title_tokens = models.TextField(blank=True)
+    body_tokens = models.TextField(blank=True)
+    boost = models.FloatField(default=0)  # 인기도 가중치 (log 스케일)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "object_id"], name="unique_search_entry")
+        ]
+
+    def __str__(self):
+        return f"{self.kind}:{self.object_id}"
 
 
 class HomeSectionEntry(models.Model):
@@ -85,17 +218,36 @@ class HomeSectionEntry(models.Model):
         ("TOP_RATED", "Top Rated"),
     ]
     section = models.CharField(max_length=20, choices=SECTION_CHOICES)
+    # 동기화 1회 = 세대 1개. 화면에는 HomeSection.active_generation 세대만 노출
+    generation = models.PositiveIntegerField(default=0)
     movie = models.ForeignKey(Movie, on_delete=models.CASCADE, related_name="home_entries")
     rank = models.PositiveIntegerField(default=0)
     synced_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         constraints = [
-            models.UniqueConstraint(fields=["section", "movie"], name="unique_section_movie")
+            models.UniqueConstraint(fields=["section", "generation", "movie"], name="unique_section_generation_movie")
+        ]
+        indexes = [
+            models.Index(fields=["section", "generation", "rank"], name="home_entry_gen_rank_idx"),
         ]
         ordering = ["rank"]
 
 
+class HomeSection(models.Model):
+    """
+    홈 섹션별 현재 노출 중인 세대 포인터
+    - 새 세대를 다 써놓고 포인터만 바꿔서 교체(shadow swap)
+    - row가 없으면 세대 0
+    """
+    section = models.CharField(max_length=20, choices=HomeSectionEntry.SECTION_CHOICES, unique=True)
+    active_generation = models.PositiveIntegerField(default=0)
+    synced_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.section} (gen {self.active_generation})"
+
+
 
 
 
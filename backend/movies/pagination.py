@@ -0,0 +1,186 @@
+# backend/movies/pagination.py
+"""
+커서(keyset) 페이지네이션
+- 정렬 키 튜플 + 고유 키(tmdb_id / id)를 커서로 사용 → COUNT(*) / OFFSET 없이 몇 페이지를 넘겨도 일정한 비용
+- 정렬별 복합 인덱스(Movie.Meta.indexes, Review/ReviewComment.Meta.indexes)와 짝을 이룸
+- 영화 목록(MovieCursorPagination) / 리뷰·댓글 목록(reviews.pagination)이 같이 사용
+"""
+import base64
+import json
+from datetime import date, datetime
+
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param, remove_query_param
+
+# sort 파라미터 → 정렬 키 (모두 내림차순, 마지막 tmdb_id가 동점 처리)
+MOVIE_SORT_KEYS = {
+    "popular": ("popularity", "vote_count", "tmdb_id"),
+    "latest": ("release_date", "popularity", "tmdb_id"),
+    "rating": ("vote_average", "vote_count", "tmdb_id"),
+    "likes": ("like_count", "popularity", "tmdb_id"),
+    "reviews": ("review_count", "popularity", "tmdb_id"),
+}
+
+# 값이 비어있을 수 있는 키 (내림차순에서 항상 맨 뒤로)
+NULLABLE_KEYS = {"release_date"}
+
+
+def movie_sort_ordering(sort: str):
+    keys = MOVIE_SORT_KEYS.get(sort, MOVIE_SORT_KEYS["popular"])
+    return [F(k).desc(nulls_last=True) if k in NULLABLE_KEYS else F(k).desc() for k in keys]
+
+
+def keyset_ordering(keys, nullable=frozenset()):
+    # ("-created_at", "-id") → order_by 인자 ("-" 내림차순, 없으면 오름차순 / NULL은 항상 맨 뒤)
+    ordering = []
+    for key in keys:
+        name = key.lstrip("-")
+        expr = F(name).desc if key.startswith("-") else F(name).asc
+        ordering.append(expr(nulls_last=True) if name in nullable else expr())
+    return ordering
+
+
+def keyset_filter(keys, values, nullable=NULLABLE_KEYS) -> Q:
+    """
+    (k1, k2, k3) 다음 행 조건을 키별 방향("-"는 내림차순)에 맞게 풀어쓴 것
+    - nullable 키는 NULL이 맨 뒤라서: 값이 있으면 "다음 값이거나 NULL", NULL이면 "NULL 끼리만"
+    - 첫 키 범위 조건(<= / >=)을 따로 AND → 인덱스 탐색이 커서 위치에서 시작 (OR 조건만으로는 처음부터 훑음)
+    """
+    cond = None
+    equal = Q()
+    for key, value in zip(keys, values):
+        name = key.lstrip("-")
+        if value is None:
+            # NULL 구간 안에서는 다음 키로만 비교
+            equal &= Q(**{f"{name}__isnull": True})
+            continue
+        lookup = "lt" if key.startswith("-") else "gt"
+        after = Q(**{f"{name}__{lookup}": value})
+        if name in nullable:
+            after |= Q(**{f"{name}__isnull": True})
+        cond = equal & after if cond is None else cond | (equal & after)
+        equal &= Q(**{name: value})
+    return _leading_bound(keys, values, nullable) & cond
+
+
+def _leading_bound(keys, values, nullable) -> Q:
+    # 커서 값이 NULL인 앞쪽 키는 IS NULL, 그다음 키는 커서 값 이하(내림차순) / 이상(오름차순)
+    bound = Q()
+    for key, value in zip(keys, values):
+        name = key.lstrip("-")
+        if value is None:
+            bound &= Q(**{f"{name}__isnull": True})
+            continue
+        lookup = "lte" if key.startswith("-") else "gte"
+        after = Q(**{f"{name}__{lookup}": value})
+        if name in nullable:
+            after |= Q(**{f"{name}__isnull": True})
+        return bound & after
+    return bound
+
+
+class KeysetCursorPagination:
+    """
+    ?mode=cursor(첫 페이지) → 응답의 next(…?cursor=…)를 그대로 따라가면 다음 페이지
+    - sort_keys: sort 파라미터 → 정렬 키 튜플 ("-"는 내림차순, 마지막 키는 고유해야 함)
+    - 키 값은 모델 필드든 annotate 값이든 getattr로 읽음
+    """
+    sort_keys = {}
+    default_sort = None
+    nullable_keys = frozenset()
+    date_keys = frozenset()
+    datetime_keys = frozenset()
+
+    page_size = 20
+    max_page_size = 50
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "잘못된 커서입니다."
+
+    def paginate_queryset(self, queryset, request, sort: str):
+        self.request = request
+        self.keys = self.sort_keys.get(sort, self.sort_keys[self.default_sort])
+        self.page_size = self._get_page_size(request)
+
+        queryset = queryset.order_by(*keyset_ordering(self.keys, self.nullable_keys))
+        cursor = request.query_params.get(self.cursor_query_param)
+
+        # 한 개 더 가져와서 다음 페이지 유무 판단
+        if cursor:
+            try:
+                page = self._page_after(queryset, self._decode_cursor(cursor), self.page_size + 1)
+            except (ValueError, TypeError):
+                raise NotFound(self.invalid_cursor_message)
+        else:
+            page = list(queryset[: self.page_size + 1])
+        self.has_next = len(page) > self.page_size
+        self.page = page[: self.page_size]
+        return self.page
+
+    def _page_after(self, queryset, values, size) -> list:
+        first = self.keys[0].lstrip("-")
+        if first not in self.nullable_keys or values[0] is None:
+            return list(queryset.filter(keyset_filter(self.keys, values, self.nullable_keys))[:size])
+        # 첫 키에 "OR IS NULL"이 섞이면 범위 탐색을 못 하므로
+        # 값이 있는 구간에서 먼저 가져오고, 모자라면 맨 뒤 NULL 구간 처음부터 채움
+        page = list(queryset.filter(keyset_filter(self.keys, values, self.nullable_keys - {first}))[:size])
+        if len(page) < size:
+            page += list(queryset.filter(**{f"{first}__isnull": True})[: size - len(page)])
+        return page
+
+    def get_paginated_response(self, data):
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, "page")
+        return replace_query_param(url, self.cursor_query_param, self._encode_cursor(last))
+
+    def _get_page_size(self, request):
+        try:
+            size = int(request.query_params.get("page_size", self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def _encode_cursor(self, obj) -> str:
+        values = []
+        for key in self.keys:
+            value = getattr(obj, key.lstrip("-"))
+            values.append(value.isoformat() if isinstance(value, date) else value)
+        raw = json.dumps(values, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    def _decode_value(self, name, value):
+        if value is None:
+            return None
+        if name in self.datetime_keys:
+            return datetime.fromisoformat(value)
+        if name in self.date_keys:
+            return date.fromisoformat(value)
+        return value
+
+    def _decode_cursor(self, cursor: str):
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(raw)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.keys):
+            raise NotFound(self.invalid_cursor_message)
+        return [self._decode_value(k.lstrip("-"), v) for k, v in zip(self.keys, values)]
+
+
+class MovieCursorPagination(KeysetCursorPagination):
+    """
+    /api/movies/list/?mode=cursor&sort=popular → 첫 페이지
+    응답의 next(…?cursor=…)를 그대로 따라가면 다음 페이지
+    """
+    sort_keys = {sort: tuple(f"-{k}" for k in keys) for sort, keys in MOVIE_SORT_KEYS.items()}
+    default_sort = "popular"
+    nullable_keys = NULLABLE_KEYS
+    date_keys = frozenset({"release_date"})
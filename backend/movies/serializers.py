@@ -1,6 +1,8 @@
-from django.db.models import Count
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Manager, Prefetch, QuerySet, prefetch_related_objects
 from rest_framework import serializers
-from .models import Movie, Genre, Person, MovieCredit
+from .models import Movie, Genre, Person, MovieCredit, MovieGenre
+from .services.filmography import get_person_credits
 
 
 class GenreSerializer(serializers.ModelSerializer):
@@ -15,12 +17,38 @@ class PersonSerializer(serializers.ModelSerializer):
         fields = ["tmdb_id", "name", "profile_path", "known_for_department"]
 
 
+def movie_card_prefetches(prefix=""):
+    """
+    카드(MovieListSerializer) 직렬화에 필요한 prefetch 목록
+    - prefix: 리뷰 목록처럼 영화가 중첩된 경우 "movie__"
+    """
+    from reviews.models import MovieTopReview  # 필요할 때만 import (순환 방지)
+
+    return [
+        # 장르는 id 순 고정 (빠른 경로 serialize_movie_cards와 같은 순서)
+        Prefetch(f"{prefix}genres", queryset=Genre.objects.order_by("id")),
+        Prefetch(
+            f"{prefix}top_review",
+            queryset=MovieTopReview.objects.select_related("review__user"),
+        ),
+    ]
+
+
+class MovieCardListSerializer(serializers.ListSerializer):
+    # ✅ 카드 N장을 직렬화해도 쿼리 수가 일정하도록 한 번에 prefetch
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, Manager) else data)
+        prefetch_related_objects(items, *movie_card_prefetches())
+        return super().to_representation(items)
+
+
 class MovieListSerializer(serializers.ModelSerializer):
     genres = GenreSerializer(many=True, read_only=True)
     top_review = serializers.SerializerMethodField()
 
     class Meta:
         model = Movie
+        list_serializer_class = MovieCardListSerializer
         fields = [
             "tmdb_id",
             "title",
@@ -36,37 +64,136 @@ class MovieListSerializer(serializers.ModelSerializer):
         ]
 
     def get_top_review(self, obj):
-        # ✅ 안전하게: Review 객체에 annotate 붙여서 setter 문제 터지지 않게 values()로 처리
+        # ✅ MovieTopReview(미리 계산된 대표 리뷰)에서 읽기, 영화마다 집계 쿼리 X
         try:
-            from reviews.models import Review  # 필요할 때만 import (순환 방지)
-        except Exception:
-            return None
-
-        r = (
-            Review.objects.filter(movie=obj)
-            .annotate(likes_count=Count("likes"))
-            .select_related("user")
-            .order_by("-likes_count", "-created_at")
-            .values("id", "content", "rating", "likes_count", "created_at", "user__username")
-            .first()
-        )
-        if not r:
+            top = obj.top_review
+        except ObjectDoesNotExist:
             return None
 
+        r = top.review
         return {
-            "id": r["id"],
-            "content": r["content"],
-            "rating": r["rating"],
-            "like_count": r["likes_count"],  # 프론트 호환
-            "username": r["user__username"],
-            "created_at": r["created_at"],
+            "id": r.id,
+            "content": r.content,
+            "rating": r.rating,
+            "like_count": top.like_count,  # 프론트 호환
+            "username": r.user.username,
+            "created_at": r.created_at,
         }
 
 
+CARD_FIELDS = tuple(MovieListSerializer.Meta.fields)
+CARD_VALUE_FIELDS = tuple(f for f in CARD_FIELDS if f not in ("genres", "top_review"))
+
+
+def _float(value):
+    return float(value)
+
+
+def _date(value):
+    return value.isoformat()
+
+
+# DRF 필드의 to_representation과 같은 변환 (None은 DRF처럼 그대로 None)
+_CARD_CONVERTERS = {
+    "vote_average": _float,
+    "vote_count": int,
+    "popularity": _float,
+    "release_date": _date,
+}
+
+
+def parse_card_fields(request):
+    """
+    ?fields=tmdb_id,title,poster_path → 카드 필드 중 요청된 것만 (기본 순서 유지)
+    - 없거나 아는 필드가 하나도 없으면 None (= 전체)
+    """
+    raw = request.query_params.get("fields")
+    if not raw:
+        return None
+    wanted = {f.strip() for f in raw.split(",")}
+    fields = tuple(f for f in CARD_FIELDS if f in wanted)
+    return fields or None
+
+
+def card_rows(queryset, fields=None):
+    """
+    카드에 필요한 컬럼만 .values()로 (모델 객체 생성 X)
+    - 페이지네이터에 그대로 넘겨도 됨
+    """
+    fields = fields or CARD_FIELDS
+    return queryset.prefetch_related(None).values("id", *(f for f in CARD_VALUE_FIELDS if f in fields))
+
+
+def serialize_movie_cards(movies, fields=None) -> list:
+    """
+    MovieListSerializer(movies, many=True).data와 같은 결과를 DRF 필드 처리 없이 만들기
+    - movies: QuerySet / card_rows() 결과(dict) / 이미 읽은 Movie 목록
+    - 장르 맵 1번 + 대표 리뷰 맵 1번 (요청된 필드에 있을 때만)
+    """
+    from reviews.models import MovieTopReview  # 필요할 때만 import (순환 방지)
+
+    fields = fields or CARD_FIELDS
+    if isinstance(movies, QuerySet) and movies.model is Movie and movies._fields is None:
+        movies = card_rows(movies, fields)
+    rows = list(movies)
+    if rows and not isinstance(rows[0], dict):
+        rows = [{"id": m.id, **{f: getattr(m, f) for f in CARD_VALUE_FIELDS if f in fields}} for m in rows]
+    if not rows:
+        return []
+
+    ids = [row["id"] for row in rows]
+    genres = {}
+    if "genres" in fields:
+        for movie_id, tmdb_id, name in (
+            MovieGenre.objects.filter(movie_id__in=ids)
+            .order_by("movie_id", "genre_id")
+            .values_list("movie_id", "genre__tmdb_id", "genre__name")
+        ):
+            genres.setdefault(movie_id, []).append({"tmdb_id": tmdb_id, "name": name})
+
+    top_reviews = {}
+    if "top_review" in fields:
+        for movie_id, like_count, review_id, content, rating, username, created_at in (
+            MovieTopReview.objects.filter(movie_id__in=ids).values_list(
+                "movie_id",
+                "like_count",
+                "review_id",
+                "review__content",
+                "review__rating",
+                "review__user__username",
+                "review__created_at",
+            )
+        ):
+            top_reviews[movie_id] = {
+                "id": review_id,
+                "content": content,
+                "rating": rating,
+                "like_count": like_count,
+                "username": username,
+                "created_at": created_at,
+            }
+
+    converters = [(f, _CARD_CONVERTERS.get(f)) for f in fields]
+    data = []
+    for row in rows:
+        card = {}
+        for name, convert in converters:
+            if name == "genres":
+                card[name] = genres.get(row["id"], [])
+            elif name == "top_review":
+                card[name] = top_reviews.get(row["id"])
+            else:
+                value = row[name]
+                card[name] = convert(value) if convert is not None and value is not None else value
+        data.append(card)
+    return data
+
+
 class MovieDetailSerializer(serializers.ModelSerializer):
     genres = GenreSerializer(many=True, read_only=True)
     directors = serializers.SerializerMethodField()
     cast = serializers.SerializerMethodField()
+    rating_avg = serializers.FloatField(read_only=True)
 
     class Meta:
         model = Movie
@@ -82,17 +209,38 @@ class MovieDetailSerializer(serializers.ModelSerializer):
             "vote_average",
             "vote_count",
             "popularity",
+            "like_count",
+            "review_count",
+            "wish_count",
+            "rating_avg",
             "genres",
             "directors",
             "cast",
         ]
 
-    def _credits_qs(self, movie):
-        # 기본 reverse name이 moviecredit_set일 가능성 높아서 모델로 직접 조회
-        return MovieCredit.objects.filter(movie=movie).select_related("person")
+    def _credits(self, movie):
+        # ✅ 크레딧을 한 번만 읽어서 감독/배우로 나눔 (뷰에서 prefetch 했으면 추가 쿼리 0)
+        cached = getattr(movie, "_split_credits", None)
+        if cached is not None:
+            return cached
+
+        prefetched = getattr(movie, "_prefetched_objects_cache", {})
+        if "moviecredit_set" in prefetched:
+            credits = movie.moviecredit_set.all()
+        else:
+            credits = MovieCredit.objects.filter(movie=movie).select_related("person")
+
+        directors, cast = [], []
+        for c in sorted(credits, key=lambda c: c.order):
+            if c.role_type == "DIRECTOR":
+                directors.append(c)
+            elif c.role_type == "CAST":
+                cast.append(c)
+        movie._split_credits = (directors, cast)
+        return movie._split_credits
 
     def get_directors(self, obj):
-        qs = self._credits_qs(obj).filter(role_type="DIRECTOR").order_by("order")
+        directors, _ = self._credits(obj)
         return [
             {
                 "tmdb_id": c.person.tmdb_id,
@@ -101,11 +249,11 @@ class MovieDetailSerializer(serializers.ModelSerializer):
                 "known_for_department": c.person.known_for_department,
                 "job": getattr(c, "job", "") or "",
             }
-            for c in qs
+            for c in directors
         ]
 
     def get_cast(self, obj):
-        qs = self._credits_qs(obj).filter(role_type="CAST").order_by("order")
+        _, cast = self._credits(obj)
         return [
             {
                 "tmdb_id": c.person.tmdb_id,
@@ -115,7 +263,7 @@ class MovieDetailSerializer(serializers.ModelSerializer):
                 "character_name": getattr(c, "character_name", "") or "",
                 "order": c.order,
             }
-            for c in qs
+            for c in cast
         ]
 
 
@@ -127,25 +275,16 @@ class PersonDetailSerializer(serializers.ModelSerializer):
         fields = ["tmdb_id", "name", "profile_path", "known_for_department", "filmography"]
 
     def get_filmography(self, obj):
-        # ✅ 이 인물이 참여한 영화들(간단 리스트)
-        qs = (
-            MovieCredit.objects.filter(person=obj)
-            .select_related("movie")
-            .order_by("role_type", "order")
-        )
-        out = []
-        seen = set()
-        for c in qs:
-            m = c.movie
-            if not m or m.tmdb_id in seen:
-                continue
-            seen.add(m.tmdb_id)
-            out.append(
-                {
-                    "tmdb_id": m.tmdb_id,
-                    "title": m.title,
-                    "poster_path": m.poster_path,
-                    "role_type": c.role_type,
-                }
-            )
-        return out
+        # ✅ 이 인물이 참여한 영화들(간단 리스트) - person_detail과 같은 계산 결과 공유
+        credits = self.context.get("credits")
+        if credits is None:
+            credits = get_person_credits(obj.id)
+        return [
+            {
+                "tmdb_id": c["tmdb_id"],
+                "title": c["title"],
+                "poster_path": c["poster_path"],
+                "role_type": c["role_type"],
+            }
+            for c in credits
+        ]
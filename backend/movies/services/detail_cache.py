@@ -0,0 +1,41 @@
+# backend/movies/services/detail_cache.py
+"""
+영화 상세 응답(MovieDetailSerializer 결과) 캐시
+- 키: tmdb_id 별 1개 (공용 캐시)
+- TMDB 동기화 코드가 영화/장르/크레딧을 쓰거나, 반응 집계가 바뀌면 무효화
+- 무효화는 커밋 이후에 (커밋 전 옛 값을 다시 캐시에 넣는 것 방지)
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+DETAIL_KEY = "movies:detail:{tmdb_id}"
+
+
+def _key(tmdb_id: int) -> str:
+    return DETAIL_KEY.format(tmdb_id=tmdb_id)
+
+
+def get_cached_detail(tmdb_id: int):
+    # {"data": 직렬화 결과, "updated_at": Movie.updated_at, "refreshed_at": Movie.detail_refreshed_at} 또는 None
+    return cache.get(_key(tmdb_id))
+
+
+def set_cached_detail(tmdb_id: int, data: dict, updated_at, refreshed_at=None):
+    cache.set(
+        _key(tmdb_id),
+        {"data": data, "updated_at": updated_at, "refreshed_at": refreshed_at},
+        settings.MOVIE_DETAIL_CACHE_SECONDS,
+    )
+
+
+def invalidate_movie_details(tmdb_ids):
+    keys = [_key(tmdb_id) for tmdb_id in set(tmdb_ids)]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def invalidate_movie_details_by_pk(movie_ids):
+    from movies.models import Movie
+
+    invalidate_movie_details(Movie.objects.filter(pk__in=list(movie_ids)).values_list("tmdb_id", flat=True))
@@ -0,0 +1,192 @@
+# backend/movies/services/fake_tmdb.py
+"""
+오프라인 TMDB 대역 서버 (벤치마크/로컬 테스트용)
+- /discover/movie, /movie/{id}, /movie/{id}/credits, /genre/movie/list,
+  /movie/popular|now_playing|top_rated, /movie/changes
+- 같은 seed면 항상 같은 응답 (id 기반 난수)
+- latency: 응답마다 지연(초), error_rate: 이 확률로 429(Retry-After) 응답
+- ETag / If-None-Match(304) 지원
+"""
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+GENRES = [
+    (28, "액션"), (12, "모험"), (16, "애니메이션"), (35, "코미디"), (80, "범죄"),
+    (99, "다큐멘터리"), (18, "드라마"), (10751, "가족"), (14, "판타지"), (36, "역사"),
+    (27, "공포"), (10402, "음악"), (9648, "미스터리"), (10749, "로맨스"), (878, "SF"),
+    (10770, "TV 영화"), (53, "스릴러"), (10752, "전쟁"), (37, "서부"),
+]
+
+PAGE_SIZE = 20
+FIRST_MOVIE_ID = 1000
+PEOPLE_POOL = 5000
+
+
+class FakeTmdb:
+    def __init__(self, seed=42, total_pages=500):
+        self.seed = seed
+        self.total_pages = total_pages
+
+    def _rng(self, *key):
+        return random.Random(f"{self.seed}:{':'.join(map(str, key))}")
+
+    def movie_summary(self, movie_id: int) -> dict:
+        rng = self._rng("movie", movie_id)
+        rank = movie_id - FIRST_MOVIE_ID
+        return {
+            "id": movie_id,
+            "title": f"영화 {movie_id}",
+            "original_title": f"Movie {movie_id}",
+            "overview": f"가짜 줄거리 {movie_id}",
+            "release_date": f"{rng.randint(1970, 2025)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            "poster_path": f"/poster{movie_id}.jpg",
+            "backdrop_path": f"/backdrop{movie_id}.jpg",
+            "popularity": round(10000 / (rank + 1) + rng.random(), 3),
+            "vote_average": round(rng.uniform(4, 9), 1),
+            "vote_count": rng.randint(10, 20000),
+            "genre_ids": [g[0] for g in rng.sample(GENRES, rng.randint(1, 3))],
+        }
+
+    def movie_detail(self, movie_id: int) -> dict:
+        data = self.movie_summary(movie_id)
+        genre_names = dict(GENRES)
+        data["genres"] = [{"id": gid, "name": genre_names[gid]} for gid in data.pop("genre_ids")]
+        data["runtime"] = self._rng("runtime", movie_id).randint(80, 180)
+        return data
+
+    def credits(self, movie_id: int) -> dict:
+        rng = self._rng("credits", movie_id)
+        cast_ids = rng.sample(range(1, PEOPLE_POOL), 15)
+        director_id = PEOPLE_POOL + rng.randint(1, 500)
+        return {
+            "id": movie_id,
+            "cast": [
+                {
+                    "id": pid,
+                    "name": f"배우 {pid}",
+                    "character": f"역할 {order}",
+                    "order": order,
+                    "profile_path": f"/p{pid}.jpg",
+                    "known_for_department": "Acting",
+                }
+                for order, pid in enumerate(cast_ids)
+            ],
+            "crew": [
+                {
+                    "id": director_id,
+                    "name": f"감독 {director_id}",
+                    "job": "Director",
+                    "profile_path": f"/p{director_id}.jpg",
+                    "known_for_department": "Directing",
+                }
+            ],
+        }
+
+    def page(self, page: int, offset=0) -> dict:
+        start = FIRST_MOVIE_ID + offset + (page - 1) * PAGE_SIZE
+        return {
+            "page": page,
+            "total_pages": self.total_pages,
+            "total_results": self.total_pages * PAGE_SIZE,
+            "results": [self.movie_summary(i) for i in range(start, start + PAGE_SIZE)],
+        }
+
+    def route(self, path: str, query: dict):
+        page = int(query.get("page", ["1"])[0])
+
+        if path == "/genre/movie/list":
+            return {"genres": [{"id": gid, "name": name} for gid, name in GENRES]}
+        if path == "/discover/movie":
+            return self.page(page)
+        if path == "/movie/popular":
+            return self.page(page)
+        if path == "/movie/now_playing":
+            return self.page(page, offset=200)
+        if path == "/movie/top_rated":
+            return self.page(page, offset=400)
+        if path == "/movie/changes":
+            rng = self._rng("changes", query.get("start_date", [""])[0])
+            ids = rng.sample(range(FIRST_MOVIE_ID, FIRST_MOVIE_ID + 2000), 100)
+            return {"page": 1, "total_pages": 1, "results": [{"id": i, "adult": False} for i in ids]}
+
+        m = re.fullmatch(r"/movie/(\d+)/credits", path)
+        if m:
+            return self.credits(int(m.group(1)))
+        m = re.fullmatch(r"/movie/(\d+)", path)
+        if m:
+            data = self.movie_detail(int(m.group(1)))
+            if "credits" in query.get("append_to_response", [""])[0].split(","):
+                data["credits"] = self.credits(int(m.group(1)))
+            return data
+        return None
+
+
+def make_server(host="127.0.0.1", port=0, latency=0.0, error_rate=0.0, seed=42):
+    fake = FakeTmdb(seed=seed)
+    error_rng = random.Random(seed)
+    error_lock = threading.Lock()
+    stats = {"requests": 0, "throttled": 0, "not_modified": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"   # keep-alive
+
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, body=b"", headers=None):
+            self.send_response(status)
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if body:
+                self.wfile.write(body)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            path = re.sub(r"^/3", "", url.path)
+            query = parse_qs(url.query)
+
+            with error_lock:
+                stats["requests"] += 1
+                throttle = error_rate > 0 and error_rng.random() < error_rate
+                if throttle:
+                    stats["throttled"] += 1
+
+            if latency:
+                time.sleep(latency)
+            if throttle:
+                return self._send(429, b'{"status_code":25}', {"Retry-After": "0", "Content-Type": "application/json"})
+
+            data = fake.route(path, query)
+            if data is None:
+                return self._send(404, b'{"status_code":34}', {"Content-Type": "application/json"})
+
+            body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+            etag = '"' + hashlib.md5(body).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == etag:
+                with error_lock:
+                    stats["not_modified"] += 1
+                return self._send(304, headers={"ETag": etag})
+            self._send(200, body, {"Content-Type": "application/json;charset=utf-8", "ETag": etag})
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    server.stats = stats
+    return server
+
+
+def start_in_thread(**kwargs):
+    server = make_server(**kwargs)
+    thread = threading.Thread(target=server.serve_forever, name="fake-tmdb", daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    server.base_url = f"http://{host}:{port}/3"
+    return server
@@ -0,0 +1,63 @@
+# backend/movies/services/filmography.py
+"""
+인물 필모그래피 (person_detail)
+- MovieCredit(person, role_type, order) 인덱스로 한 번만 읽고, 영화 중복 제거한 결과를 인물별 캐시
+- 감독/출연 목록과 PersonDetailSerializer.filmography가 같은 결과를 같이 사용
+- 크레딧 동기화(apply_movie_credits)가 해당 인물의 크레딧을 바꾸면 무효화
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from movies.models import MovieCredit
+
+CREDITS_KEY = "movies:person:{person_id}:credits"
+
+
+def _key(person_id: int) -> str:
+    return CREDITS_KEY.format(person_id=person_id)
+
+
+def _load_person_credits(person_id: int) -> list[dict]:
+    rows = (
+        MovieCredit.objects.filter(person_id=person_id)
+        .order_by("role_type", "order")
+        .values_list(
+            "role_type", "character_name", "job",
+            "movie__tmdb_id", "movie__title", "movie__poster_path", "movie__release_date", "movie__vote_average",
+        )
+    )
+    # ✅ 중복 영화 제거(같은 사람이 같은 영화에 여러 credit 있을 수 있음)
+    seen = set()
+    out = []
+    for role_type, character_name, job, tmdb_id, title, poster_path, release_date, vote_average in rows:
+        if tmdb_id in seen:
+            continue
+        seen.add(tmdb_id)
+        out.append(
+            {
+                "tmdb_id": tmdb_id,
+                "title": title,
+                "poster_path": poster_path or "",
+                "release_date": release_date,
+                "vote_average": float(vote_average or 0),
+                "role_type": role_type,
+                "character_name": character_name or "",
+                "job": job or "",
+            }
+        )
+    return out
+
+
+def get_person_credits(person_id: int) -> list[dict]:
+    credits = cache.get(_key(person_id))
+    if credits is None:
+        credits = _load_person_credits(person_id)
+        cache.set(_key(person_id), credits, settings.PERSON_CREDITS_CACHE_SECONDS)
+    return credits
+
+
+def invalidate_person_credits(person_ids):
+    keys = [_key(pk) for pk in set(person_ids)]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
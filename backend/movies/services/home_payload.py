@@ -0,0 +1,112 @@
+# backend/movies/services/home_payload.py
+"""
+홈 응답(/api/movies/home/) 미리 렌더링
+- 홈 데이터는 sync_tmdb_home(세대 교체)이나 홈에 걸린 영화의 리뷰가 바뀔 때만 달라짐
+- 바뀔 때마다 공용 캐시의 버전만 올리고(invalidate_home_payload),
+  JSON 바이트 + ETag는 버전별로 한 번만 만들어 공용 캐시/프로세스 메모리에 보관
+- ?fields=로 카드 필드를 줄인 응답은 (버전, 필드 목록)별로 공용 캐시에만 보관
+"""
+import hashlib
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.renderers import JSONRenderer
+
+from movies.models import HomeSectionEntry, Movie
+
+HOME_VERSION_KEY = "movies:home:version"
+HOME_PAYLOAD_KEY = "movies:home:payload:{version}"
+HOME_FIELDS_PAYLOAD_KEY = "movies:home:payload:{version}:{fields}"
+HOME_PAYLOAD_TTL = 60 * 60 * 24
+
+HOME_SECTIONS = [
+    ("popular", "POPULAR"),
+    ("now_playing", "NOW_PLAYING"),
+    ("top_rated", "TOP_RATED"),
+]
+
+_memo = {"version": None, "body": None, "etag": None, "checked_at": 0.0}
+_memo_lock = threading.Lock()
+
+
+def invalidate_home_payload():
+    # 새 버전 토큰만 기록, 실제 렌더링은 다음 요청에서
+    cache.set(HOME_VERSION_KEY, uuid.uuid4().hex, None)
+    with _memo_lock:
+        _memo["checked_at"] = 0.0
+
+
+def invalidate_home_payload_for_movie(movie_id: int):
+    # 홈에 걸린 영화일 때만 (지난 세대 포함, 조금 더 자주 무효화돼도 무해)
+    if HomeSectionEntry.objects.filter(movie_id=movie_id).exists():
+        invalidate_home_payload()
+
+
+def render_home_payload(fields=None) -> bytes:
+    from movies.serializers import serialize_movie_cards
+    from movies.services.tmdb import active_home_generations
+
+    generations = active_home_generations()
+    data = {}
+    for key, section in HOME_SECTIONS:
+        # ✅ 현재 노출 중인 세대만 (교체 중인 새 세대/지난 세대 제외)
+        movies = (
+            Movie.objects.filter(
+                home_entries__section=section,
+                home_entries__generation=generations.get(section, 0),
+            )
+            .order_by("home_entries__rank")[:20]
+        )
+        data[key] = serialize_movie_cards(movies, fields)
+    return JSONRenderer().render(data)
+
+
+def _current_version() -> str:
+    version = cache.get(HOME_VERSION_KEY)
+    if version is None:
+        # 캐시가 비었으면(첫 실행/만료) 새 버전으로 시작
+        version = uuid.uuid4().hex
+        if not cache.add(HOME_VERSION_KEY, version, None):
+            version = cache.get(HOME_VERSION_KEY) or version
+    return version
+
+
+def _render_with_etag(fields=None) -> tuple[bytes, str]:
+    body = render_home_payload(fields)
+    return body, '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+
+
+def get_home_payload(fields=None) -> tuple[bytes, str]:
+    """
+    (JSON 바이트, ETag) 반환
+    - 평소에는 프로세스 메모리 사본을 그대로 사용
+    - HOME_PAYLOAD_CHECK_SECONDS마다 공용 캐시 버전을 확인해 바뀌었으면 다시 가져오거나 렌더링
+    - fields: parse_card_fields() 결과 (None이면 전체 필드)
+    """
+    if fields is not None:
+        key = HOME_FIELDS_PAYLOAD_KEY.format(version=_current_version(), fields=",".join(fields))
+        cached = cache.get(key)
+        if cached is None:
+            cached = _render_with_etag(fields)
+            cache.set(key, cached, HOME_PAYLOAD_TTL)
+        return cached
+
+    now = time.monotonic()
+    if _memo["body"] is not None and now - _memo["checked_at"] < settings.HOME_PAYLOAD_CHECK_SECONDS:
+        return _memo["body"], _memo["etag"]
+
+    with _memo_lock:
+        version = _current_version()
+        if version != _memo["version"] or _memo["body"] is None:
+            key = HOME_PAYLOAD_KEY.format(version=version)
+            cached = cache.get(key)
+            if cached is None:
+                cached = _render_with_etag()
+                cache.set(key, cached, HOME_PAYLOAD_TTL)
+            _memo["version"] = version
+            _memo["body"], _memo["etag"] = cached
+        _memo["checked_at"] = time.monotonic()
+        return _memo["body"], _memo["etag"]
@@ -0,0 +1,243 @@
+# backend/movies/services/neighbors.py
+"""
+비슷한 영화(MovieNeighbor) 배치 계산 - NumPy
+- 유사도 = 장르 one-hot 코사인 + 감독/출연진 겹침 코사인 + 좋아요 동시 발생 코사인 (가중 합)
+  + 동점 정리용 아주 작은 인기도 항
+- 감독/출연진/좋아요는 희소해서 행렬 곱 대신 역색인 + np.bincount로 후보별 겹침 수 계산
+- 증분: SyncCursor("movie_neighbors") 이후
+  · 갱신된 영화(updated_at) / 새로 좋아요 받은 영화 / 그 좋아요를 누른 유저의 다른 좋아요 영화
+  · 위 영화가 현재 k번째 이웃보다 가까워지는 영화 (새 영화가 기존 영화의 이웃으로 들어가는 경로)
+  · 위 영화를 이웃으로 갖고 있던 영화 / 아직 이웃이 없는 영화
+  만 다시 계산 (좋아요 취소는 시각이 안 남아서 --full에서 반영)
+"""
+import numpy as np
+from django.db import transaction
+from django.utils import timezone
+
+from movies.models import Movie, MovieCredit, MovieGenre, MovieLike, MovieNeighbor, SyncCursor
+
+CURSOR_NAME = "movie_neighbors"
+TOP_K = 20
+
+WEIGHTS = {
+    "genre": 1.0,
+    "director": 0.8,
+    "cast": 0.6,
+    "like": 0.8,
+    "popularity": 0.05,
+}
+
+
+class _Incidence:
+    """
+    행(영화) ↔ 열(인물/유저) 희소 관계를 CSR 비슷하게 보관
+    overlap(i): 영화 i와 열을 공유하는 모든 영화별 공유 개수 (길이 N 배열)
+    """
+
+    def __init__(self, pairs, n_rows):
+        pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+        rows, cols = pairs[:, 0], pairs[:, 1]
+        n_cols = int(cols.max()) + 1 if len(cols) else 0
+
+        order = np.argsort(rows, kind="stable")
+        self.row_cols = cols[order]
+        self.row_ptr = np.searchsorted(rows[order], np.arange(n_rows + 1))
+
+        order = np.argsort(cols, kind="stable")
+        self.col_rows = rows[order]
+        self.col_ptr = np.searchsorted(cols[order], np.arange(n_cols + 1))
+
+        self.degree = np.diff(self.row_ptr).astype(np.float64)
+        self.n_rows = n_rows
+
+    def cosine(self, i):
+        cols = self.row_cols[self.row_ptr[i]:self.row_ptr[i + 1]]
+        if len(cols) == 0:
+            return None
+        rows = np.concatenate([self.col_rows[self.col_ptr[c]:self.col_ptr[c + 1]] for c in cols])
+        overlap = np.bincount(rows, minlength=self.n_rows).astype(np.float64)
+        denom = np.sqrt(self.degree[i] * self.degree)
+        np.divide(overlap, denom, out=overlap, where=denom > 0)
+        return overlap
+
+
+def _load(movie_pks):
+    """
+    DB → 행렬 재료 (영화 pk를 0..N-1 행 번호로)
+    """
+    index = {pk: i for i, pk in enumerate(movie_pks)}
+    n = len(movie_pks)
+
+    genre_pairs = [(index[m], g) for m, g in MovieGenre.objects.values_list("movie_id", "genre_id") if m in index]
+    genre_ids = sorted({g for _, g in genre_pairs})
+    genre_col = {g: j for j, g in enumerate(genre_ids)}
+    genres = np.zeros((n, max(len(genre_ids), 1)), dtype=np.float32)
+    for i, g in genre_pairs:
+        genres[i, genre_col[g]] = 1.0
+    norms = np.linalg.norm(genres, axis=1, keepdims=True)
+    np.divide(genres, norms, out=genres, where=norms > 0)
+
+    credits = {"DIRECTOR": [], "CAST": []}
+    for m, p, role in MovieCredit.objects.values_list("movie_id", "person_id", "role_type"):
+        if m in index and role in credits:
+            credits[role].append((index[m], p))
+
+    likes = [(index[m], u) for m, u in MovieLike.objects.values_list("movie_id", "user_id") if m in index]
+
+    return {
+        "genres": genres,
+        "director": _Incidence(credits["DIRECTOR"], n),
+        "cast": _Incidence(credits["CAST"], n),
+        "like": _Incidence(likes, n),
+    }
+
+
+class _Scorer:
+    """
+    전체 영화 행렬을 한 번 올려두고 행 단위 점수 계산
+    rows(targets): (행 번호, 전체 영화에 대한 점수 배열) 을 batch 단위로
+    """
+
+    def __init__(self):
+        rows = list(Movie.objects.order_by("id").values_list("id", "popularity"))
+        self.movie_pks = np.array([pk for pk, _ in rows], dtype=np.int64)
+        popularity = np.log1p(np.maximum(np.array([p or 0 for _, p in rows], dtype=np.float64), 0))
+        self.popularity = popularity / popularity.max() if len(rows) and popularity.max() > 0 else popularity
+        self.index = {int(pk): i for i, pk in enumerate(self.movie_pks)}
+        self.data = _load(self.movie_pks.tolist()) if rows else None
+
+    def __len__(self):
+        return len(self.movie_pks)
+
+    def indices(self, pks):
+        return [self.index[pk] for pk in pks if pk in self.index]
+
+    def rows(self, targets, batch_size=256):
+        data = self.data
+        for start in range(0, len(targets), batch_size):
+            batch = targets[start:start + batch_size]
+            # 장르: (batch x G) @ (G x N) 한 번에
+            scores = WEIGHTS["genre"] * (data["genres"][batch] @ data["genres"].T).astype(np.float64)
+            scores += WEIGHTS["popularity"] * self.popularity
+
+            for row, i in enumerate(batch):
+                for block in ("director", "cast", "like"):
+                    cos = data[block].cosine(i)
+                    if cos is not None:
+                        scores[row] += WEIGHTS[block] * cos
+                scores[row, i] = -np.inf  # 자기 자신 제외
+                yield i, scores[row]
+
+    def top(self, scores, k):
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(int(self.movie_pks[j]), float(scores[j])) for j in top]
+
+
+def compute_neighbors(target_pks=None, top_k=TOP_K, batch_size=256):
+    """
+    target_pks(없으면 전체)의 top-K 이웃 계산 → {movie_pk: [(neighbor_pk, score), ...]}
+    """
+    scorer = _Scorer()
+    if not len(scorer):
+        return {}
+    targets = scorer.indices(target_pks if target_pks is not None else scorer.movie_pks.tolist())
+    k = min(top_k, len(scorer) - 1)
+    return {int(scorer.movie_pks[i]): scorer.top(scores, k) for i, scores in scorer.rows(targets, batch_size)}
+
+
+def _changed_movie_pks(since) -> set:
+    changed = set(Movie.objects.filter(updated_at__gte=since).values_list("id", flat=True))
+
+    recent_likes = MovieLike.objects.filter(created_at__gte=since)
+    changed |= set(recent_likes.values_list("movie_id", flat=True))
+    # 새 좋아요를 누른 유저의 다른 좋아요 영화도 동시 발생 점수가 바뀜
+    changed |= set(
+        MovieLike.objects.filter(user_id__in=recent_likes.values("user_id")).values_list("movie_id", flat=True)
+    )
+    return changed
+
+
+def _kth_scores(scorer, k):
+    """
+    영화별 현재 k번째 이웃 점수 (k개가 안 차 있으면 -inf → 어떤 후보든 들어갈 수 있음)
+    """
+    kth = np.full(len(scorer), -np.inf)
+    for movie_id, score in MovieNeighbor.objects.filter(rank=k).values_list("movie_id", "score"):
+        if movie_id in scorer.index:
+            kth[scorer.index[movie_id]] = score
+    return kth
+
+
+def compute_incremental_neighbors(since, top_k=TOP_K, batch_size=256):
+    """
+    since 이후 바뀐 영화 기준 증분 계산 → compute_neighbors와 같은 형태
+    1) 바뀐 영화: 새로 계산
+    2) 바뀐 영화가 현재 k번째 이웃보다 점수가 높아지는 영화 (장르/인물/좋아요를 공유하는 후보 중)
+       + 바뀐 영화를 이웃으로 두고 있던 영화 + 아직 이웃이 없는 영화: 다시 계산
+    """
+    changed = _changed_movie_pks(since)
+    others = set(
+        MovieNeighbor.objects.filter(neighbor_id__in=list(changed)).values_list("movie_id", flat=True)
+    )
+    others |= set(Movie.objects.filter(neighbors__isnull=True).values_list("id", flat=True))
+    if not changed and not others:
+        return {}
+
+    scorer = _Scorer()
+    if not len(scorer):
+        return {}
+    k = min(top_k, len(scorer) - 1)
+    kth = _kth_scores(scorer, k) if k > 0 else None
+
+    result = {}
+    for i, scores in scorer.rows(scorer.indices(sorted(changed)), batch_size):
+        result[int(scorer.movie_pks[i])] = scorer.top(scores, k)
+        if kth is None:
+            continue
+        # 유사도 부분은 대칭 → 상대 영화 j 기준 점수는 인기도 항만 i의 것으로 바꾸면 됨
+        reverse = scores + WEIGHTS["popularity"] * (scorer.popularity[i] - scorer.popularity)
+        others.update(int(pk) for pk in scorer.movie_pks[reverse > kth])
+
+    rest = scorer.indices(sorted(others - changed))
+    for i, scores in scorer.rows(rest, batch_size):
+        result[int(scorer.movie_pks[i])] = scorer.top(scores, k)
+    return result
+
+
+def _save_neighbors(result: dict, chunk=500):
+    movie_pks = list(result)
+    for i in range(0, len(movie_pks), chunk):
+        part = movie_pks[i:i + chunk]
+        with transaction.atomic():
+            MovieNeighbor.objects.filter(movie_id__in=part).delete()
+            MovieNeighbor.objects.bulk_create(
+                [
+                    MovieNeighbor(movie_id=pk, neighbor_id=neighbor_pk, rank=rank, score=score)
+                    for pk in part
+                    for rank, (neighbor_pk, score) in enumerate(result[pk], start=1)
+                ],
+                batch_size=1000,
+            )
+
+
+def build_movie_neighbors(full=False, top_k=TOP_K, batch_size=256) -> dict:
+    """
+    증분(기본) 또는 전체(full) 재계산 후 커서 이동
+    반환: {"targets": 다시 계산한 영화 수, "full": bool}
+    """
+    started_at = timezone.now()
+    cursor, _ = SyncCursor.objects.get_or_create(name=CURSOR_NAME)
+    full = full or cursor.last_synced_at is None
+
+    if full:
+        result = compute_neighbors(top_k=top_k, batch_size=batch_size)
+    else:
+        result = compute_incremental_neighbors(cursor.last_synced_at, top_k=top_k, batch_size=batch_size)
+    _save_neighbors(result)
+
+    cursor.last_synced_at = started_at
+    cursor.save(update_fields=["last_synced_at", "updated_at"])
+    return {"targets": len(result), "full": full}
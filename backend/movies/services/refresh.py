@@ -0,0 +1,63 @@
+# backend/movies/services/refresh.py
+"""
+영화 상세 백그라운드 갱신 (stale-while-revalidate)
+- 요청 스레드는 DB에 있는 값으로 바로 응답
+- 오래됐거나(updated_at) 상세/크레딧이 비어 있으면 movies.refresh_movie 작업만 등록
+  · 마지막 시도(detail_refreshed_at) 후 MOVIE_REFRESH_RETRY_MINUTES 안이면 예약 안 함
+    (TMDB에도 런타임/크레딧이 없거나 갱신이 실패해도 조회마다 다시 예약되지 않게)
+- 같은 tmdb_id로 대기/실행 중인 작업이 있으면 새로 만들지 않음(idempotency_key)
+"""
+import threading
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from jobs.services import enqueue
+
+# 같은 프로세스에서 방금 예약한 tmdb_id는 DB 확인도 건너뜀
+_recent = {}
+_recent_lock = threading.Lock()
+RECENT_TTL_SEC = 60
+
+
+def is_stale(runtime, updated_at, has_credits: bool, refreshed_at=None) -> bool:
+    now = timezone.now()
+    retry = timedelta(minutes=getattr(settings, "MOVIE_REFRESH_RETRY_MINUTES", 360))
+    if refreshed_at is not None and refreshed_at >= now - retry:
+        return False  # 최근에 시도함 (성공/실패, 값이 채워졌는지와 상관없이)
+    if not has_credits or runtime is None:
+        return True
+    max_age = timedelta(hours=getattr(settings, "MOVIE_REFRESH_MAX_AGE_HOURS", 24))
+    return updated_at is None or updated_at < now - max_age
+
+
+def is_movie_stale(movie, has_credits: bool) -> bool:
+    return is_stale(movie.runtime, movie.updated_at, has_credits, movie.detail_refreshed_at)
+
+
+def request_movie_refresh(movie, has_credits: bool) -> bool:
+    """
+    오래된 영화면 백그라운드 갱신 예약 (예약됐으면 True)
+    """
+    if not is_movie_stale(movie, has_credits):
+        return False
+    return schedule_movie_refresh(movie.tmdb_id)
+
+
+def schedule_movie_refresh(tmdb_id: int) -> bool:
+    now = time.monotonic()
+    with _recent_lock:
+        if now - _recent.get(tmdb_id, -RECENT_TTL_SEC) < RECENT_TTL_SEC:
+            return False
+        _recent[tmdb_id] = now
+        if len(_recent) > 10000:
+            _recent.clear()
+
+    enqueue(
+        "movies.refresh_movie",
+        {"tmdb_id": tmdb_id},
+        idempotency_key=f"movies.refresh_movie:{tmdb_id}",
+    )
+    return True
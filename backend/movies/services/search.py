@@ -0,0 +1,253 @@
+# backend/movies/services/search.py
+"""
+영화/인물 전문 검색 (icontains 전체 스캔 대체)
+- 토큰화: 한글(CJK)은 2글자 n-gram + 구간 마지막 글자, 나머지는 단어 단위 → 부분 일치 + 띄어쓰기 없는 한글 제목 대응
+- SQLite: FTS5(movies_search_fts) + bm25 / PostgreSQL: tsvector('simple') + GIN + ts_rank
+- 점수 = 관련도 × (1 + BOOST_WEIGHT × log(1 + 인기도))
+- 색인(SearchEntry)은 TMDB 동기화 코드가 영화/인물을 쓸 때 같이 갱신, 전체 재구성은 rebuild_search_index
+"""
+import math
+import re
+import unicodedata
+
+from django.db import connection
+from django.db.models import Count, Q
+
+from movies.models import Movie, MovieCredit, Person, SearchEntry
+
+FTS_TABLE = "movies_search_fts"
+TITLE_WEIGHT = 10.0
+BODY_WEIGHT = 1.0
+BOOST_WEIGHT = 0.2
+
+# PostgreSQL 검색 문서 (마이그레이션의 GIN 인덱스 식과 똑같아야 인덱스를 탐)
+PG_DOCUMENT = (
+    "(setweight(to_tsvector('simple', e.title_tokens), 'A') || "
+    "setweight(to_tsvector('simple', e.body_tokens), 'B'))"
+)
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+
+def _is_cjk(ch: str) -> bool:
+    o = ord(ch)
+    return (
+        0xAC00 <= o <= 0xD7A3      # 한글 음절
+        or 0x1100 <= o <= 0x11FF   # 한글 자모
+        or 0x3130 <= o <= 0x318F   # 호환 자모
+        or 0x3040 <= o <= 0x30FF   # 가나
+        or 0x4E00 <= o <= 0x9FFF   # 한자
+    )
+
+
+def _runs(text: str):
+    # 단어 → (연속 구간, CJK 여부) 목록. "아이언맨2" → [("아이언맨", True), ("2", False)]
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    for word in _WORD_RE.findall(text):
+        start = 0
+        for i in range(1, len(word) + 1):
+            if i == len(word) or _is_cjk(word[i]) != _is_cjk(word[start]):
+                yield word[start:i], _is_cjk(word[start])
+                start = i
+
+
+def _bigrams(run: str) -> list[str]:
+    if len(run) == 1:
+        return [run]
+    return [run[i:i + 2] for i in range(len(run) - 1)]
+
+
+def _cjk_tokens(run: str) -> list[str]:
+    # 색인용: n-gram + 마지막 글자 ("밀정" → 밀정, 정) → 1글자 접두어 검색이 끝 글자에도 걸림
+    if len(run) == 1:
+        return [run]
+    return _bigrams(run) + [run[-1]]
+
+
+def tokenize(*texts) -> str:
+    # 색인용: 중복 제거한 토큰을 공백으로 연결
+    tokens = []
+    for text in texts:
+        for run, cjk in _runs(text):
+            tokens.extend(_cjk_tokens(run) if cjk else [run])
+    return " ".join(dict.fromkeys(tokens))
+
+
+def _query_terms(q: str) -> list[tuple[str, bool]]:
+    """
+    검색어 → [(토큰, 접두어 검색 여부)]
+    - 한글 1글자는 접두어(그 글자로 시작하는 n-gram + 구간 끝 글자 토큰), 2글자 이상은 n-gram 전부 AND
+    - 마지막 영문/숫자 단어는 입력 중일 수 있어 접두어 검색
+    """
+    runs = list(_runs(q))
+    terms = []
+    for idx, (run, cjk) in enumerate(runs):
+        if cjk:
+            if len(run) == 1:
+                terms.append((run, True))
+            else:
+                terms.extend((gram, False) for gram in _bigrams(run))
+        else:
+            terms.append((run, idx == len(runs) - 1))
+    return list(dict.fromkeys(terms))
+
+
+def movie_entry_fields(title, original_title, overview, popularity) -> dict:
+    return {
+        "title_tokens": tokenize(title, original_title),
+        "body_tokens": tokenize(overview),
+        "boost": math.log1p(max(popularity or 0, 0)),
+    }
+
+
+def person_entry_fields(name, credits_count) -> dict:
+    return {
+        "title_tokens": tokenize(name),
+        "body_tokens": "",
+        "boost": math.log1p(credits_count or 0),
+    }
+
+
+def _save_entries(entries: list):
+    if entries:
+        SearchEntry.objects.bulk_create(
+            entries,
+            update_conflicts=True,
+            unique_fields=["kind", "object_id"],
+            update_fields=["title_tokens", "body_tokens", "boost"],
+        )
+
+
+def index_movies(movies):
+    # 이미 읽어온 Movie 객체로 색인 (추가 SELECT 없음)
+    _save_entries(
+        [
+            SearchEntry(
+                kind="movie",
+                object_id=m.id,
+                **movie_entry_fields(m.title, m.original_title, m.overview, m.popularity),
+            )
+            for m in movies
+        ]
+    )
+
+
+def index_people(person_ids):
+    person_ids = list(person_ids)
+    if not person_ids:
+        return
+    counts = dict(
+        MovieCredit.objects.filter(person_id__in=person_ids)
+        .order_by()
+        .values("person_id")
+        .annotate(n=Count("id"))
+        .values_list("person_id", "n")
+    )
+    _save_entries(
+        [
+            SearchEntry(kind="person", object_id=pk, **person_entry_fields(name, counts.get(pk, 0)))
+            for pk, name in Person.objects.filter(id__in=person_ids).values_list("id", "name")
+        ]
+    )
+
+
+def _fts_available() -> bool:
+    if connection.vendor == "postgresql":
+        return True
+    if connection.vendor != "sqlite":
+        return False
+    return FTS_TABLE in connection.introspection.table_names()
+
+
+def _search_ids_fts(kind: str, terms, offset: int, limit: int) -> list[int]:
+    entry_table = SearchEntry._meta.db_table
+    if connection.vendor == "postgresql":
+        tsquery = " & ".join(f"{token}:*" if prefix else token for token, prefix in terms)
+        sql = (
+            f"SELECT e.object_id FROM {entry_table} e "
+            f"WHERE e.kind = %s AND {PG_DOCUMENT} @@ to_tsquery('simple', %s) "
+            f"ORDER BY ts_rank({PG_DOCUMENT}, to_tsquery('simple', %s)) * (1 + %s * e.boost) DESC, e.id "
+            f"LIMIT %s OFFSET %s"
+        )
+        params = [kind, tsquery, tsquery, BOOST_WEIGHT, limit, offset]
+    else:
+        match = " ".join(f'"{token}"*' if prefix else f'"{token}"' for token, prefix in terms)
+        # bm25는 작을수록(음수) 관련도가 높음
+        sql = (
+            f"SELECT e.object_id FROM {FTS_TABLE} f JOIN {entry_table} e ON e.id = f.rowid "
+            f"WHERE {FTS_TABLE} MATCH %s AND e.kind = %s "
+            f"ORDER BY bm25({FTS_TABLE}, {TITLE_WEIGHT}, {BODY_WEIGHT}) * (1 + %s * e.boost), e.id "
+            f"LIMIT %s OFFSET %s"
+        )
+        params = [match, kind, BOOST_WEIGHT, limit, offset]
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [row[0] for row in cursor.fetchall()]
+
+
+def _search_ids_fallback(kind: str, q: str, offset: int, limit: int) -> list[int]:
+    # 색인을 못 쓰는 DB면 예전 방식(icontains)
+    if kind == "person":
+        qs = Person.objects.filter(name__icontains=q).order_by("name")
+    else:
+        qs = Movie.objects.filter(Q(title__icontains=q) | Q(original_title__icontains=q)).order_by("-popularity")
+    return list(qs.values_list("id", flat=True)[offset:offset + limit])
+
+
+def search_ids(kind: str, q: str, page=1, page_size=30):
+    """
+    관련도 순 pk 목록 한 페이지 → (ids, has_next)
+    """
+    offset = (max(page, 1) - 1) * page_size
+    terms = _query_terms(q)
+    if not terms:
+        return [], False
+
+    if _fts_available():
+        ids = _search_ids_fts(kind, terms, offset, page_size + 1)
+    else:
+        ids = _search_ids_fallback(kind, q, offset, page_size + 1)
+    return ids[:page_size], len(ids) > page_size
+
+
+def rebuild_search_index(batch_size=1000, on_batch=None) -> dict:
+    """
+    SearchEntry 전체 재구성 (삭제된 영화/인물 정리 + 인기도 가중치 갱신)
+    """
+    SearchEntry.objects.all().delete()
+    counts = {"movie": 0, "person": 0}
+
+    last_id = 0
+    while True:
+        movies = list(
+            Movie.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .only("id", "title", "original_title", "overview", "popularity")[:batch_size]
+        )
+        if not movies:
+            break
+        last_id = movies[-1].id
+        index_movies(movies)
+        counts["movie"] += len(movies)
+        if on_batch:
+            on_batch("movie", counts["movie"])
+
+    last_id = 0
+    while True:
+        person_ids = list(
+            Person.objects.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:batch_size]
+        )
+        if not person_ids:
+            break
+        last_id = person_ids[-1]
+        index_people(person_ids)
+        counts["person"] += len(person_ids)
+        if on_batch:
+            on_batch("person", counts["person"])
+
+    if connection.vendor == "sqlite" and _fts_available():
+        # external content 테이블 전체를 다시 읽어 FTS 색인 재작성
+        with connection.cursor() as cursor:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+    return counts
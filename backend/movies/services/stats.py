@@ -0,0 +1,110 @@
+# backend/movies/services/stats.py
+"""
+Movie 반응 집계 컬럼(like_count / review_count / wish_count / rating_sum) 관리
+- 평소: 좋아요/리뷰/보고싶어요 변경과 같은 트랜잭션에서 F()로 증감
+- 보정: recount_movie_stats 명령으로 실제 테이블 기준 재계산
+"""
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Greatest
+
+from movies.models import Movie, MovieLike
+from movies.services.detail_cache import invalidate_movie_details_by_pk
+
+STAT_FIELDS = ["like_count", "review_count", "wish_count", "rating_sum"]
+
+
+def review_stat_deltas(watched: bool, rating: int, sign: int = 1) -> dict:
+    # 리뷰 1개가 집계에 기여하는 양 (삭제/수정 전 값은 sign=-1)
+    if watched:
+        return {"review_count": sign, "rating_sum": sign * (rating or 0)}
+    return {"wish_count": sign}
+
+
+def merge_deltas(*deltas: dict) -> dict:
+    merged = {}
+    for d in deltas:
+        for field, value in d.items():
+            merged[field] = merged.get(field, 0) + value
+    return {field: value for field, value in merged.items() if value}
+
+
+def apply_movie_stats(movie_id: int, **deltas):
+    deltas = {field: value for field, value in deltas.items() if value}
+    if not deltas:
+        return
+    # 감소는 0 아래로 내려가지 않게 (드리프트가 있어도 요청이 실패하지 않도록)
+    Movie.objects.filter(pk=movie_id).update(
+        **{
+            field: F(field) + value if value > 0 else Greatest(F(field) + value, 0)
+            for field, value in deltas.items()
+        }
+    )
+    # 상세 응답에 집계가 들어가므로 캐시도 비움
+    invalidate_movie_details_by_pk([movie_id])
+
+
+def compute_movie_stats(movie_ids) -> dict:
+    # {movie_id: {field: value}} - 실제 테이블 기준
+    from reviews.models import Review  # 필요할 때만 import (순환 방지)
+
+    stats = {movie_id: dict.fromkeys(STAT_FIELDS, 0) for movie_id in movie_ids}
+
+    likes = (
+        MovieLike.objects.filter(movie_id__in=movie_ids)
+        .order_by()
+        .values("movie_id")
+        .annotate(n=Count("id"))
+    )
+    for row in likes:
+        stats[row["movie_id"]]["like_count"] = row["n"]
+
+    reviews = (
+        Review.objects.filter(movie_id__in=movie_ids)
+        .order_by()
+        .values("movie_id")
+        .annotate(
+            review_count=Count("id", filter=Q(watched=True)),
+            wish_count=Count("id", filter=Q(watched=False)),
+            rating_sum=Sum("rating", filter=Q(watched=True)),
+        )
+    )
+    for row in reviews:
+        s = stats[row["movie_id"]]
+        s["review_count"] = row["review_count"]
+        s["wish_count"] = row["wish_count"]
+        s["rating_sum"] = row["rating_sum"] or 0
+    return stats
+
+
+def recount_movie_stats(batch_size=1000, on_batch=None) -> dict:
+    """
+    전체 영화를 id 순으로 batch_size씩 재계산, 달라진 행만 bulk_update
+    반환: {"checked": n, "fixed": n}
+    """
+    checked = fixed = 0
+    last_id = 0
+    while True:
+        batch = list(
+            Movie.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .values("id", *STAT_FIELDS)[:batch_size]
+        )
+        if not batch:
+            break
+        last_id = batch[-1]["id"]
+
+        actual = compute_movie_stats([row["id"] for row in batch])
+        changed = []
+        for row in batch:
+            real = actual[row["id"]]
+            if any(row[field] != real[field] for field in STAT_FIELDS):
+                changed.append(Movie(id=row["id"], **real))
+        if changed:
+            Movie.objects.bulk_update(changed, STAT_FIELDS)
+            invalidate_movie_details_by_pk([m.id for m in changed])
+
+        checked += len(batch)
+        fixed += len(changed)
+        if on_batch:
+            on_batch(checked, fixed)
+    return {"checked": checked, "fixed": fixed}
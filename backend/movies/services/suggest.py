@@ -0,0 +1,211 @@
+# backend/movies/services/suggest.py
+"""
+검색어 자동완성 (/api/movies/suggest/?q=)
+- 프로세스 메모리에 (정규화된 키, 항목 번호) 정렬 배열을 두고 bisect로 접두어 범위 탐색
+- 키: 제목/원제/이름 전체 + 그 안의 각 단어 시작 위치부터의 문자열 ("엔드게임"으로도 "어벤져스: 엔드게임" 검색)
+- 후보가 SCAN_LIMIT개를 넘는 접두어는 (trie 노드처럼) 인기도 순 top-k를 미리 계산해 두고,
+  그 이하인 접두어만 요청 때 범위를 훑어서 순위 계산 → 어떤 검색어든 최대 SCAN_LIMIT개만 봄
+- TMDB 동기화가 카탈로그 버전(공용 캐시)을 올리면, SUGGEST_REFRESH_SECONDS마다 확인 후 백그라운드에서 재구성
+"""
+import bisect
+import heapq
+import logging
+import math
+import re
+import threading
+import time
+import unicodedata
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, transaction
+from django.db.models import Count
+
+from movies.models import Movie, MovieCredit, Person
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION_KEY = "movies:catalog:version"
+SCAN_LIMIT = 200
+TOP_K = 10
+
+_SPACE_RE = re.compile(r"\s+")
+_WORD_START_RE = re.compile(r"(?<![^\W_])[^\W_]")
+
+
+def normalize(text: str) -> str:
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def bump_catalog_version():
+    # 영화/인물 이름이 바뀌는 쓰기 후에 호출 (커밋 이후 반영)
+    transaction.on_commit(lambda: cache.set(CATALOG_VERSION_KEY, uuid.uuid4().hex, None))
+
+
+def _catalog_version():
+    return cache.get(CATALOG_VERSION_KEY)
+
+
+class SuggestIndex:
+    def __init__(self, items):
+        """
+        items: [(kind, score, 표시용 dict, [이름들])]
+        """
+        self.entries = []   # [(kind, dict)]
+        self.scores = []
+        keys = []
+        for kind, score, payload, names in items:
+            idx = len(self.entries)
+            self.entries.append((kind, payload))
+            self.scores.append(score)
+            seen = set()
+            for name in names:
+                name = normalize(name)
+                if not name:
+                    continue
+                for m in _WORD_START_RE.finditer(name):
+                    key = name[m.start():]
+                    if key not in seen:
+                        seen.add(key)
+                        keys.append((key, idx))
+        keys.sort()
+        self.keys = [k for k, _ in keys]
+        self.key_entries = [i for _, i in keys]
+
+        # 후보가 많은 접두어 → 종류별 인기도 순 top-k
+        self.top = {}
+        self._precompute(0, len(self.keys), 0)
+
+    def _precompute(self, lo, hi, depth):
+        # keys[lo:hi]는 길이 depth의 같은 접두어를 공유, 다음 글자별로 나눠 내려감
+        stack = [(lo, hi, depth)]
+        while stack:
+            lo, hi, depth = stack.pop()
+            # 접두어와 정확히 같은 키(더 짧은 키)는 맨 앞에 모여 있음
+            while lo < hi and len(self.keys[lo]) <= depth:
+                lo += 1
+            start = lo
+            while start < hi:
+                end = bisect.bisect_left(self.keys, self.keys[start][: depth + 1] + "\U0010ffff", start, hi)
+                if end - start > SCAN_LIMIT:
+                    prefix = self.keys[start][: depth + 1]
+                    self.top[prefix] = self._rank(set(self.key_entries[start:end]))
+                    stack.append((start, end, depth + 1))
+                start = end
+
+    def _range(self, prefix: str):
+        lo = bisect.bisect_left(self.keys, prefix)
+        hi = bisect.bisect_left(self.keys, prefix + "\U0010ffff", lo)
+        return set(self.key_entries[lo:hi])
+
+    def _rank(self, entry_ids) -> dict:
+        ranked = {}
+        for kind in ("movie", "person"):
+            ids = [i for i in entry_ids if self.entries[i][0] == kind]
+            ranked[kind] = heapq.nlargest(TOP_K, ids, key=lambda i: (self.scores[i], -i))
+        return ranked
+
+    def suggest(self, q: str, limit=5) -> dict:
+        prefix = normalize(q)
+        if not prefix:
+            return {"movies": [], "people": []}
+        ranked = self.top.get(prefix)
+        if ranked is None:
+            ranked = self._rank(self._range(prefix))
+        return {
+            "movies": [self.entries[i][1] for i in ranked["movie"][:limit]],
+            "people": [self.entries[i][1] for i in ranked["person"][:limit]],
+        }
+
+
+def build_suggest_index() -> SuggestIndex:
+    items = []
+    movies = Movie.objects.values_list(
+        "tmdb_id", "title", "original_title", "poster_path", "release_date", "popularity"
+    )
+    for tmdb_id, title, original_title, poster_path, release_date, popularity in movies.iterator():
+        payload = {
+            "tmdb_id": tmdb_id,
+            "title": title,
+            "original_title": original_title,
+            "poster_path": poster_path,
+            "year": release_date.year if release_date else None,
+        }
+        items.append(("movie", popularity or 0, payload, [title, original_title]))
+
+    credits = dict(
+        MovieCredit.objects.order_by().values("person_id").annotate(n=Count("id")).values_list("person_id", "n")
+    )
+    people = Person.objects.values_list("id", "tmdb_id", "name", "profile_path", "known_for_department")
+    for pk, tmdb_id, name, profile_path, department in people.iterator():
+        payload = {
+            "tmdb_id": tmdb_id,
+            "name": name,
+            "profile_path": profile_path,
+            "known_for_department": department,
+        }
+        items.append(("person", math.log1p(credits.get(pk, 0)), payload, [name]))
+    return SuggestIndex(items)
+
+
+_state = {"index": None, "version": None, "checked_at": 0.0, "building": False}
+_state_lock = threading.Lock()
+
+
+def _rebuild(version):
+    try:
+        index = build_suggest_index()
+        with _state_lock:
+            _state["index"], _state["version"] = index, version
+    except Exception:
+        logger.exception("suggest index rebuild failed")
+    finally:
+        with _state_lock:
+            _state["building"] = False
+        close_old_connections()
+
+
+def _start_rebuild(version, wait=False):
+    with _state_lock:
+        if _state["building"]:
+            return
+        _state["building"] = True
+    if wait:
+        _rebuild(version)
+    else:
+        threading.Thread(target=_rebuild, args=(version,), daemon=True, name="suggest-index").start()
+
+
+def warm_up():
+    # 워커 시작 시(gunicorn post_worker_init) 미리 구성
+    _state["checked_at"] = time.monotonic()
+    _start_rebuild(_catalog_version())
+
+
+def get_suggest_index() -> SuggestIndex | None:
+    """
+    현재 색인 반환
+    - 처음이면 그 자리에서 구성, 이후엔 카탈로그 버전이 바뀌었을 때만 백그라운드 재구성(그동안 기존 색인 사용)
+    """
+    now = time.monotonic()
+    if _state["index"] is None:
+        if not _state["building"]:
+            _start_rebuild(_catalog_version(), wait=True)
+        return _state["index"]
+
+    if now - _state["checked_at"] >= settings.SUGGEST_REFRESH_SECONDS:
+        _state["checked_at"] = now
+        version = _catalog_version()
+        if version != _state["version"]:
+            _start_rebuild(version)
+    return _state["index"]
+
+
+def suggest(q: str, limit=5) -> dict:
+    index = get_suggest_index()
+    if index is None:
+        # 워커 시작 직후 아직 구성 중
+        return {"movies": [], "people": []}
+    return index.suggest(q, limit=limit)
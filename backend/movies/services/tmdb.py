@@ -1,17 +1,157 @@
 # backend/movies/services/tmdb.py
+import re
 import requests
+import threading
 import time
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from django.conf import settings
 from django.db import transaction
+from django.utils import timezone
+from requests.adapters import HTTPAdapter
 
-from movies.models import Movie, Genre, MovieGenre, Person, MovieCredit, HomeSectionEntry
+from movies.models import Movie, Genre, MovieGenre, Person, MovieCredit, HomeSection, HomeSectionEntry, SyncCursor, SyncRun
+from movies.services.tmdb_cache import TmdbResponseCache
+from movies.services.detail_cache import invalidate_movie_details
+from movies.services.filmography import invalidate_person_credits
+from movies.services.home_payload import invalidate_home_payload
+from movies.services.search import index_movies, index_people
+from movies.services.suggest import bump_catalog_version
 
 
 TMDB_BASE_URL = "https://api.themoviedb.org/3"
 
 
-def _tmdb_get(path: str, params=None):
+class TokenBucket:
+    """
+    TMDB 요청 한도용 token bucket (스레드 안전)
+    - rate: 초당 충전되는 토큰 수
+    - burst: 한 번에 쌓아둘 수 있는 최대 토큰 수
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = max(float(rate), 0.1)
+        self.capacity = max(int(burst), 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+_session = None
+_limiter = None
+_init_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    # ✅ keep-alive 커넥션 풀 재사용 (요청마다 TCP/TLS 핸드셰이크 안 하게)
+    global _session
+    if _session is None:
+        with _init_lock:
+            if _session is None:
+                pool_size = max(int(getattr(settings, "TMDB_MAX_CONCURRENCY", 16)), 1)
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session = session
+    return _session
+
+
+def reset_client():
+    # 세션/rate limiter/캐시를 다시 만들게 함 (settings를 바꾼 뒤 - 벤치마크 등)
+    global _session, _limiter, _cache
+    with _init_lock:
+        _session = _limiter = _cache = None
+
+
+def _get_limiter() -> TokenBucket:
+    global _limiter
+    if _limiter is None:
+        with _init_lock:
+            if _limiter is None:
+                _limiter = TokenBucket(
+                    rate=getattr(settings, "TMDB_RATE_LIMIT", 40),
+                    burst=getattr(settings, "TMDB_RATE_BURST", 20),
+                )
+    return _limiter
+
+
+# path 패턴별 캐시 TTL(초). 0이면 캐시 안 함. settings.TMDB_CACHE_TTLS로 덮어쓰기 가능
+TMDB_CACHE_TTLS = {
+    r"^/genre/": 7 * 24 * 3600,
+    r"^/movie/changes": 0,
+    r"^/movie/\d+/credits$": 3 * 24 * 3600,
+    r"^/movie/\d+$": 24 * 3600,
+    r"^/discover/": 6 * 3600,
+    r"^/movie/(popular|now_playing|top_rated)": 3600,
+}
+TMDB_CACHE_DEFAULT_TTL = 3600
+
+_cache = None
+_cache_stats = {"hit": 0, "miss": 0, "revalidated": 0}
+_stats_lock = threading.Lock()
+
+
+def _get_cache():
+    global _cache
+    if not getattr(settings, "TMDB_CACHE_ENABLED", False):
+        return None
+    if _cache is None:
+        with _init_lock:
+            if _cache is None:
+                _cache = TmdbResponseCache(
+                    path=settings.TMDB_CACHE_PATH,
+                    max_bytes=getattr(settings, "TMDB_CACHE_MAX_MB", 200) * 1024 * 1024,
+                )
+    return _cache
+
+
+def _cache_ttl(path: str) -> int:
+    ttls = {**TMDB_CACHE_TTLS, **getattr(settings, "TMDB_CACHE_TTLS", {})}
+    for pattern, ttl in ttls.items():
+        if re.search(pattern, path):
+            return int(ttl)
+    return TMDB_CACHE_DEFAULT_TTL
+
+
+def _count(stat: str):
+    with _stats_lock:
+        _cache_stats[stat] += 1
+
+
+def cache_stats() -> dict:
+    with _stats_lock:
+        return dict(_cache_stats)
+
+
+def reset_cache_stats():
+    with _stats_lock:
+        for key in _cache_stats:
+            _cache_stats[key] = 0
+
+
+def format_cache_stats() -> str:
+    stats = cache_stats()
+    return f"TMDB 캐시: hit {stats['hit']} / 304 재검증 {stats['revalidated']} / miss {stats['miss']}"
+
+
+def _tmdb_get(path: str, params=None, retries=3, revalidate=False):
+    """
+    - revalidate=True: 캐시가 유효해도 ETag로 재검증 (바뀐 게 확실한 데이터용)
+    """
     if params is None:
         params = {}
     params = {
@@ -19,10 +159,50 @@ def _tmdb_get(path: str, params=None):
         "language": "ko-KR",
         **params,
     }
-    url = f"{TMDB_BASE_URL}{path}"
-    r = requests.get(url, params=params, timeout=15)
-    r.raise_for_status()
-    return r.json()
+
+    # ✅ 캐시가 아직 유효하면 네트워크 없이 반환
+    cache = _get_cache()
+    ttl = _cache_ttl(path) if cache else 0
+    key = cached = None
+    if ttl > 0:
+        key = TmdbResponseCache.make_key(path, params)
+        cached = cache.get(key)
+        if cached and cached[2] and not revalidate:
+            _count("hit")
+            return cached[0]
+
+    headers = {}
+    if cached and cached[1]:
+        headers["If-None-Match"] = cached[1]
+
+    url = f"{getattr(settings, 'TMDB_BASE_URL', TMDB_BASE_URL)}{path}"
+    session = _get_session()
+    limiter = _get_limiter()
+
+    for attempt in range(retries + 1):
+        limiter.acquire()
+        r = session.get(url, params=params, headers=headers, timeout=15)
+        # ✅ 한도 초과(429)면 Retry-After 만큼 쉬고 재시도
+        if r.status_code == 429 and attempt < retries:
+            try:
+                wait = float(r.headers.get("Retry-After") or 1)
+            except ValueError:
+                wait = 1.0
+            time.sleep(wait)
+            continue
+
+        # ✅ ETag가 그대로면(304) 보관 중인 응답 재사용
+        if r.status_code == 304 and cached:
+            cache.touch(key, ttl)
+            _count("revalidated")
+            return cached[0]
+
+        r.raise_for_status()
+        data = r.json()
+        if ttl > 0:
+            _count("miss")
+            cache.set(key, path, data, r.headers.get("ETag"), ttl)
+        return data
 
 
 def _parse_date(s):
@@ -34,127 +214,328 @@ def _parse_date(s):
         return None
 
 
+MOVIE_UPSERT_FIELDS = [
+    "title",
+    "original_title",
+    "overview",
+    "release_date",
+    "poster_path",
+    "backdrop_path",
+    "popularity",
+    "vote_average",
+    "vote_count",
+]
+
+
+def _movie_defaults(movie_json: dict) -> dict:
+    return {
+        "title": movie_json.get("title") or "",
+        "original_title": movie_json.get("original_title") or "",
+        "overview": movie_json.get("overview") or "",
+        "release_date": _parse_date(movie_json.get("release_date")),
+        "poster_path": movie_json.get("poster_path") or "",
+        "backdrop_path": movie_json.get("backdrop_path") or "",
+        "popularity": float(movie_json.get("popularity") or 0),
+        "vote_average": float(movie_json.get("vote_average") or 0),
+        "vote_count": int(movie_json.get("vote_count") or 0),
+    }
+
+
 @transaction.atomic
-def upsert_movie_from_tmdb(movie_json: dict) -> Movie:
-    movie, _ = Movie.objects.update_or_create(
-        tmdb_id=movie_json["id"],
-        defaults={
-            "title": movie_json.get("title") or "",
-            "original_title": movie_json.get("original_title") or "",
-            "overview": movie_json.get("overview") or "",
-            "release_date": _parse_date(movie_json.get("release_date")),
-            "poster_path": movie_json.get("poster_path") or "",
-            "backdrop_path": movie_json.get("backdrop_path") or "",
-            "popularity": float(movie_json.get("popularity") or 0),
-            "vote_average": float(movie_json.get("vote_average") or 0),
-            "vote_count": int(movie_json.get("vote_count") or 0),
-        },
+def bulk_upsert_movies(results: list, link_genres=True) -> list[Movie]:
+    """
+    TMDB 결과 페이지(results) 한 장을 몇 개의 쿼리로 반영
+    - Movie: 기존 제목 조회 1회 + bulk upsert 1회 + 재조회 1회
+    - MovieGenre: 장르 조회 1회 + 기존 매핑 조회 1회 + 삭제/추가 각 1회
+    반환값은 results 순서(중복 제거)대로의 Movie 목록
+    """
+    items = {}
+    for item in results:
+        tmdb_id = item.get("id")
+        if tmdb_id and tmdb_id not in items:
+            items[tmdb_id] = item
+    if not items:
+        return []
+
+    rows = {tmdb_id: _movie_defaults(item) for tmdb_id, item in items.items()}
+    # 자동완성 색인에 들어가는 이름이 그대로면 카탈로그 버전을 올리지 않음 (워커마다 색인 전체 재구성)
+    names_before = {
+        tmdb_id: (title, original_title)
+        for tmdb_id, title, original_title in Movie.objects.filter(tmdb_id__in=list(rows)).values_list(
+            "tmdb_id", "title", "original_title"
+        )
+    }
+    names_changed = any(
+        names_before.get(tmdb_id) != (row["title"], row["original_title"]) for tmdb_id, row in rows.items()
+    )
+
+    Movie.objects.bulk_create(
+        [Movie(tmdb_id=tmdb_id, **row) for tmdb_id, row in rows.items()],
+        update_conflicts=True,
+        unique_fields=["tmdb_id"],
+        update_fields=MOVIE_UPSERT_FIELDS + ["updated_at"],
     )
-    return movie
+    by_tmdb_id = Movie.objects.in_bulk(list(items), field_name="tmdb_id")
+
+    if link_genres:
+        links = {
+            by_tmdb_id[tmdb_id].id: item["genre_ids"]
+            for tmdb_id, item in items.items()
+            if tmdb_id in by_tmdb_id and item.get("genre_ids")
+        }
+        _sync_genre_links(links)
+
+    index_movies(by_tmdb_id.values())
+    if names_changed:
+        bump_catalog_version()
+    invalidate_movie_details(items)
+    return [by_tmdb_id[tmdb_id] for tmdb_id in items if tmdb_id in by_tmdb_id]
 
 
 @transaction.atomic
 def upsert_genres(genres_list: list):
     # genres_list: [{"id":..., "name":...}, ...]
-    for g in genres_list:
-        Genre.objects.update_or_create(
-            tmdb_id=g["id"],
-            defaults={"name": g.get("name") or ""},
+    genres = {g["id"]: Genre(tmdb_id=g["id"], name=g.get("name") or "") for g in genres_list}
+    if not genres:
+        return
+
+    # 이름까지 그대로인 장르는 건너뜀
+    existing = dict(Genre.objects.filter(tmdb_id__in=list(genres)).values_list("tmdb_id", "name"))
+    genres = {tmdb_id: g for tmdb_id, g in genres.items() if existing.get(tmdb_id) != g.name}
+    if not genres:
+        return
+    Genre.objects.bulk_create(
+        list(genres.values()),
+        update_conflicts=True,
+        unique_fields=["tmdb_id"],
+        update_fields=["name"],
+    )
+
+
+def _sync_genre_links(links: dict):
+    """
+    links: {movie_pk: [genre tmdb_id, ...]}
+    전부 지우고 다시 만드는 대신, 바뀐 매핑만 삭제/추가
+    """
+    if not links:
+        return
+
+    genre_tmdb_ids = {gid for ids in links.values() for gid in ids}
+    genre_pk_by_tmdb = dict(Genre.objects.filter(tmdb_id__in=genre_tmdb_ids).values_list("tmdb_id", "id"))
+    if not genre_pk_by_tmdb:
+        # Genre master가 아직 없으면 기존 매핑 유지
+        return
+
+    wanted = {
+        (movie_id, genre_pk_by_tmdb[gid])
+        for movie_id, ids in links.items()
+        for gid in ids
+        if gid in genre_pk_by_tmdb
+    }
+    existing = {
+        (movie_id, genre_id): pk
+        for pk, movie_id, genre_id in MovieGenre.objects.filter(movie_id__in=list(links)).values_list(
+            "id", "movie_id", "genre_id"
         )
+    }
 
+    stale_ids = [pk for pair, pk in existing.items() if pair not in wanted]
+    if stale_ids:
+        MovieGenre.objects.filter(id__in=stale_ids).delete()
 
-@transaction.atomic
-def set_movie_genres(movie: Movie, genre_ids: list[int]):
-    # 중복/정합성 단순화를 위해: 기존 매핑 삭제 후 재생성
-    MovieGenre.objects.filter(movie=movie).delete()
-    genres = Genre.objects.filter(tmdb_id__in=genre_ids)
-    for gen in genres:
-        MovieGenre.objects.create(movie=movie, genre=gen)
+    missing = [MovieGenre(movie_id=m, genre_id=g) for (m, g) in wanted if (m, g) not in existing]
+    if missing:
+        MovieGenre.objects.bulk_create(missing, ignore_conflicts=True)
 
 
 @transaction.atomic
-def sync_movie_credits(movie: Movie, cast_limit=10):
-    credits = _tmdb_get(f"/movie/{movie.tmdb_id}/credits")
+def set_movie_genres(movie: Movie, genre_ids: list[int]):
+    _sync_genre_links({movie.id: list(genre_ids)})
+    invalidate_movie_details([movie.tmdb_id])
 
-    # 기존 크레딧 제거 후 재생성(정합성 유지)
-    MovieCredit.objects.filter(movie=movie).delete()
 
-    # 감독(crew에서 job == Director)
-    for crew in credits.get("crew", []):
-        if crew.get("job") == "Director":
-            person, _ = Person.objects.update_or_create(
-                tmdb_id=crew["id"],
-                defaults={
-                    "name": crew.get("name") or "",
-                    "profile_path": crew.get("profile_path") or "",
-                    "known_for_department": crew.get("known_for_department") or "",
-                },
-            )
-            MovieCredit.objects.create(
-                movie=movie,
-                person=person,
-                role_type="DIRECTOR",
-                job="Director",
-                order=0,
-            )
+def _person_defaults(person_json: dict) -> dict:
+    return {
+        "name": (person_json.get("name") or "")[:100],
+        "profile_path": person_json.get("profile_path") or "",
+        "known_for_department": (person_json.get("known_for_department") or "")[:50],
+    }
 
-    # 출연진(cast 상위 N명)
-    for idx, cast in enumerate((credits.get("cast") or [])[:cast_limit]):
-        person, _ = Person.objects.update_or_create(
-            tmdb_id=cast["id"],
-            defaults={
-                "name": cast.get("name") or "",
-                "profile_path": cast.get("profile_path") or "",
-                "known_for_department": cast.get("known_for_department") or "",
-            },
-        )
-        MovieCredit.objects.create(
-            movie=movie,
-            person=person,
-            role_type="CAST",
-            character_name=cast.get("character") or "",
-            order=int(cast.get("order") or idx),
-        )
 
+def _bulk_upsert_people(people: dict) -> dict:
+    """
+    people: {person tmdb_id: defaults}
+    바뀐 사람만 update, 없는 사람만 insert → {tmdb_id: Person pk}
+    """
+    if not people:
+        return {}
+
+    fields = ["name", "profile_path", "known_for_department"]
+    existing = Person.objects.in_bulk(list(people), field_name="tmdb_id")
+
+    changed = []
+    for tmdb_id, person in existing.items():
+        defaults = people[tmdb_id]
+        if any(getattr(person, f) != defaults[f] for f in fields):
+            for f in fields:
+                setattr(person, f, defaults[f])
+            changed.append(person)
+    if changed:
+        Person.objects.bulk_update(changed, fields)
+
+    missing = [tmdb_id for tmdb_id in people if tmdb_id not in existing]
+    pk_by_tmdb_id = {tmdb_id: p.id for tmdb_id, p in existing.items()}
+    if missing:
+        Person.objects.bulk_create(
+            [Person(tmdb_id=tmdb_id, **people[tmdb_id]) for tmdb_id in missing],
+            ignore_conflicts=True,
+        )
+        pk_by_tmdb_id.update(Person.objects.filter(tmdb_id__in=missing).values_list("tmdb_id", "id"))
 
-@transaction.atomic
-def sync_home_section(section_code: str, tmdb_path: str, pages=1, with_credits=True):
-    # section_code: POPULAR / NOW_PLAYING / TOP_RATED
-    HomeSectionEntry.objects.filter(section=section_code).delete()
+    # 이름이 바뀌었거나 새로 생긴 인물만 검색 색인 갱신
+    reindex = [p.id for p in changed] + [pk_by_tmdb_id[t] for t in missing if t in pk_by_tmdb_id]
+    if reindex:
+        index_people(reindex)
+        bump_catalog_version()
+    return pk_by_tmdb_id
 
-    rank = 1
-    seen_tmdb_ids = set()   # ✅ 중복 방지
 
-    for page in range(1, pages + 1):
-        data = _tmdb_get(tmdb_path, params={"page": page})
-        results = data.get("results") or []
+@transaction.atomic
+def apply_movie_credits(movie: Movie, credits: dict, cast_limit=10):
+    """
+    기존 크레딧과 비교해서 바뀐 부분만 반영(diff)
+    - 그대로인 크레딧/인물은 SELECT만 하고 쓰기 없음
+    """
+    wanted = {}   # (person tmdb_id, role_type) -> 크레딧 필드
+    people = {}   # person tmdb_id -> 인물 필드
 
-        for item in results:
-            movie = upsert_movie_from_tmdb(item)
+    # 감독(crew에서 job == Director)
+    for crew in credits.get("crew") or []:
+        if crew.get("job") == "Director" and crew.get("id"):
+            key = (crew["id"], "DIRECTOR")
+            if key not in wanted:
+                wanted[key] = {"job": "Director", "character_name": "", "order": 0}
+                people.setdefault(crew["id"], _person_defaults(crew))
 
+    # 출연진(cast 상위 N명)
+    for idx, cast in enumerate((credits.get("cast") or [])[:cast_limit]):
+        if not cast.get("id"):
+            continue
+        key = (cast["id"], "CAST")
+        if key not in wanted:
+            wanted[key] = {
+                "job": "",
+                "character_name": (cast.get("character") or "")[:100],
+                "order": int(cast.get("order") or idx),
+            }
+            people.setdefault(cast["id"], _person_defaults(cast))
+
+    person_pks = _bulk_upsert_people(people)
+    wanted = {(person_pks[tmdb_id], role): row for (tmdb_id, role), row in wanted.items() if tmdb_id in person_pks}
+
+    fields = ["job", "character_name", "order"]
+    stale_ids, changed = [], []
+    existing_keys = set()
+    touched_people = set()
+    for credit in MovieCredit.objects.filter(movie=movie):
+        key = (credit.person_id, credit.role_type)
+        row = wanted.get(key)
+        if row is None:
+            stale_ids.append(credit.id)
+            touched_people.add(credit.person_id)
+            continue
+        existing_keys.add(key)
+        if any(getattr(credit, f) != row[f] for f in fields):
+            for f in fields:
+                setattr(credit, f, row[f])
+            changed.append(credit)
+            touched_people.add(credit.person_id)
+
+    if stale_ids:
+        MovieCredit.objects.filter(id__in=stale_ids).delete()
+    if changed:
+        MovieCredit.objects.bulk_update(changed, fields)
+
+    missing = [
+        MovieCredit(movie=movie, person_id=person_id, role_type=role, **row)
+        for (person_id, role), row in wanted.items()
+        if (person_id, role) not in existing_keys
+    ]
+    if missing:
+        MovieCredit.objects.bulk_create(missing)
+
+    if stale_ids or changed or missing:
+        invalidate_movie_details([movie.tmdb_id])
+        invalidate_person_credits(touched_people | {c.person_id for c in missing})
+
+
+def sync_home_section(section_code: str, tmdb_path: str, pages=1, with_credits=True, concurrency=1):
+    """
+    홈 섹션 재구성 (2단계)
+    1) TMDB 요청은 트랜잭션 없이 전부 먼저 받아두고
+    2) 영화/크레딧 반영 후, 새 세대 HomeSectionEntry를 짧은 트랜잭션 1번으로 교체
+    - 중간에 실패하면 기존 세대가 그대로 노출됨
+    """
+    # 1) fetch (DB 락 없음)
+    pages_results = [(_tmdb_get(tmdb_path, params={"page": page}).get("results") or []) for page in range(1, pages + 1)]
+
+    credits_by_tmdb_id = {}
+    if with_credits:
+        tmdb_ids = list(dict.fromkeys(item["id"] for results in pages_results for item in results if item.get("id")))
+        concurrency = max(1, min(int(concurrency), getattr(settings, "TMDB_MAX_CONCURRENCY", 16)))
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            extras = pool.map(lambda tmdb_id: _fetch_movie_extras(tmdb_id, with_detail=False, with_credits=True), tmdb_ids)
+            credits_by_tmdb_id = {tmdb_id: credits for tmdb_id, (_, credits, _) in zip(tmdb_ids, extras)}
+
+    # 2-a) 영화/크레딧 반영 (페이지/영화 단위의 짧은 트랜잭션)
+    ranked_movies = []
+    seen_tmdb_ids = set()   # ✅ 중복 방지
+    for results in pages_results:
+        for movie in bulk_upsert_movies(results):
             # ✅ 같은 섹션에 같은 영화가 또 나오면 스킵
             if movie.tmdb_id in seen_tmdb_ids:
                 continue
             seen_tmdb_ids.add(movie.tmdb_id)
+            ranked_movies.append(movie)
+
+    for movie in ranked_movies:
+        credits = credits_by_tmdb_id.get(movie.tmdb_id)
+        if credits is not None:
+            try:
+                apply_movie_credits(movie, credits, cast_limit=10)
+            except Exception:
+                pass
+
+    # 2-b) 새 세대 쓰고 포인터 교체
+    return swap_home_section(section_code, [m.id for m in ranked_movies])
+
+
+def swap_home_section(section_code: str, movie_ids: list[int]) -> int:
+    with transaction.atomic():
+        section, _ = HomeSection.objects.select_for_update().get_or_create(section=section_code)
+        generation = section.active_generation + 1
+
+        HomeSectionEntry.objects.bulk_create(
+            [
+                HomeSectionEntry(section=section_code, generation=generation, movie_id=movie_id, rank=rank)
+                for rank, movie_id in enumerate(movie_ids, start=1)
+            ]
+        )
+        section.active_generation = generation
+        section.synced_at = timezone.now()
+        section.save(update_fields=["active_generation", "synced_at"])
 
-            genre_ids = item.get("genre_ids") or []
-            if Genre.objects.exists():
-                set_movie_genres(movie, genre_ids)
+        # 직전 세대는 읽는 중인 요청을 위해 남겨두고, 그 이전 것만 정리
+        HomeSectionEntry.objects.filter(section=section_code, generation__lt=generation - 1).delete()
 
-            # ✅ create 대신 update_or_create (유니크 충돌 안전)
-            HomeSectionEntry.objects.update_or_create(
-                section=section_code,
-                movie=movie,
-                defaults={"rank": rank},
-            )
-            rank += 1
+        # 커밋된 뒤에 홈 응답 캐시 무효화 (새 세대 기준으로 다시 렌더링)
+        transaction.on_commit(invalidate_home_payload)
+    return generation
 
-            if with_credits:
-                try:
-                    sync_movie_credits(movie, cast_limit=10)
-                except Exception:
-                    pass
 
+def active_home_generations() -> dict:
+    # {section: active_generation}, 한 번도 교체 안 된 섹션은 0
+    return dict(HomeSection.objects.values_list("section", "active_generation"))
 
 
 def fetch_and_sync_genre_master():
@@ -164,38 +545,101 @@ def fetch_and_sync_genre_master():
     return genres
 
 
-def fetch_movie_detail_and_update(movie: Movie):
-    detail = _tmdb_get(f"/movie/{movie.tmdb_id}")
+def fetch_movie_detail(tmdb_id: int, with_credits=True, revalidate=False) -> dict:
+    # ✅ append_to_response=credits: 상세 + 크레딧을 요청 1번으로
+    params = {"append_to_response": "credits"} if with_credits else None
+    return _tmdb_get(f"/movie/{tmdb_id}", params=params, revalidate=revalidate)
+
+
+def sync_movie_detail(movie: Movie, cast_limit=10, revalidate=False):
+    detail = fetch_movie_detail(movie.tmdb_id, with_credits=True, revalidate=revalidate)
+    apply_movie_detail(movie, detail, cast_limit=cast_limit)
+
+
+@transaction.atomic
+def apply_movie_detail(movie: Movie, detail: dict, cast_limit=10):
+    """
+    상세 응답 반영: 영화 필드 + 장르 (+ credits가 같이 왔으면 크레딧까지)
+    """
+    # 상세 응답에 들어있는 기본 필드(제목/인기도/평점 등)도 같이 갱신
+    names_before = (movie.title, movie.original_title)
+    fields = []
+    for field, value in _movie_defaults(detail).items():
+        if field in detail and field != "overview":
+            setattr(movie, field, value)
+            fields.append(field)
+
     # 런타임 등 상세 정보 업데이트
     movie.runtime = detail.get("runtime") or movie.runtime
     movie.overview = detail.get("overview") or movie.overview
-    movie.save(update_fields=["runtime", "overview"])
+    movie.save(update_fields=fields + ["runtime", "overview", "updated_at"])
+    index_movies([movie])
+    if (movie.title, movie.original_title) != names_before:
+        bump_catalog_version()
+    invalidate_movie_details([movie.tmdb_id])
 
     # 상세의 genres는 [{"id","name"}] 형태라 master도 같이 업데이트 가능
     genres = detail.get("genres") or []
     upsert_genres(genres)
     set_movie_genres(movie, [g["id"] for g in genres])
 
+    if detail.get("credits") is not None:
+        apply_movie_credits(movie, detail["credits"], cast_limit=cast_limit)
 
-# backend/movies/services/tmdb.py
-
-import time
-from django.db import transaction
-from movies.models import Movie, Genre
-
-# ... (기존 코드 유지)
 
-@transaction.atomic
-def sync_bulk_movies(pages=25, sort_by="popularity.desc", with_credits=False, with_detail=False, sleep_sec=0.15):
+def _fetch_movie_extras(tmdb_id: int, with_detail: bool, with_credits: bool, revalidate=False):
+    """
+    워커 스레드에서 실행: 네트워크 요청만 하고 DB는 건드리지 않음
+    (DB 쓰기는 호출한 스레드에서 순서대로 처리)
+    - detail + credits 둘 다 필요하면 append_to_response로 1번만 요청
+    - 반환: (detail, credits, error) / 실패하면 error에 메시지
+    """
+    detail = credits = None
+    try:
+        if with_detail:
+            detail = fetch_movie_detail(tmdb_id, with_credits=with_credits, revalidate=revalidate)
+            credits = detail.pop("credits", None)
+        elif with_credits:
+            credits = _tmdb_get(f"/movie/{tmdb_id}/credits", revalidate=revalidate)
+    except Exception as e:
+        return detail, credits, f"{type(e).__name__}: {e}"
+    return detail, credits, None
+
+
+def find_resumable_run(kind: str, params: dict):
+    # 같은 조건으로 돌다가 끝나지 못한 가장 최근 실행
+    run = SyncRun.objects.filter(kind=kind).exclude(status="DONE").first()
+    if run and run.params == params:
+        return run
+    return None
+
+
+def sync_bulk_movies(pages=25, sort_by="popularity.desc", with_credits=False, with_detail=False, sleep_sec=0,
+                     concurrency=1, run=None, on_progress=None):
     """
     TMDB discover/movie로 영화 다량 upsert
     - pages=25 -> 500개(20개*25)
     - with_credits: True면 크레딧까지 저장(요청 수 폭증하니 보통 False 추천)
     - with_detail: True면 runtime/genres 보정까지 저장(역시 요청 수 증가)
+    - concurrency: TMDB 동시 요청 수 (요청 속도는 TMDB_RATE_LIMIT token bucket이 제한)
+    - sleep_sec: 페이지 사이 추가 대기(초). 기본 0 (rate limiter가 조절)
+    - run: 이어받을 SyncRun (없으면 새로 기록). 페이지마다 커밋하고 run.last_page 갱신
+    - on_progress(run): 페이지 커밋마다 호출
     """
-    total = 0
-    for page in range(1, pages + 1):
-        data = _tmdb_get(
+    concurrency = max(1, min(int(concurrency), getattr(settings, "TMDB_MAX_CONCURRENCY", 16)))
+
+    if run is None:
+        run = SyncRun.objects.create(
+            kind="bulk",
+            params={"sort_by": sort_by, "with_credits": with_credits, "with_detail": with_detail},
+        )
+    run.total_pages = pages
+    run.status = "RUNNING"
+    run.finished_at = None
+    run.save()
+
+    def fetch_page(page):
+        return _tmdb_get(
             "/discover/movie",
             params={
                 "sort_by": sort_by,
@@ -204,31 +648,195 @@ def sync_bulk_movies(pages=25, sort_by="popularity.desc", with_credits=False, wi
                 "include_video": False,
             },
         )
-        results = data.get("results") or []
 
-        for item in results:
-            movie = upsert_movie_from_tmdb(item)
+    def fetch_extras(tmdb_id):
+        return _fetch_movie_extras(tmdb_id, with_detail, with_credits)
 
-            # 장르 연결(Genre master가 있어야 함)
-            genre_ids = item.get("genre_ids") or []
-            if Genre.objects.exists() and genre_ids:
-                set_movie_genres(movie, genre_ids)
+    has_genres = Genre.objects.exists()
+    next_pages = iter(range(run.last_page + 1, pages + 1))
+    page_futures = deque()
 
-            if with_detail:
-                try:
-                    fetch_movie_detail_and_update(movie)
-                except Exception:
-                    pass
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        # ✅ 페이지 요청은 몇 장 앞서서 미리 받고, DB 반영은 페이지 순서대로
+        for page in next_pages:
+            page_futures.append((page, pool.submit(fetch_page, page)))
+            if len(page_futures) >= concurrency * 2:
+                break
+
+        while page_futures:
+            page, future = page_futures.popleft()
+            data = future.result()
+            results = data.get("results") or []
+            tmdb_ids = [item["id"] for item in results if item.get("id")]
+
+            extras_by_tmdb_id = {}
+            if with_detail or with_credits:
+                extras_by_tmdb_id = dict(zip(tmdb_ids, pool.map(fetch_extras, tmdb_ids)))
+
+            nxt = next(next_pages, None)
+            if nxt is not None:
+                page_futures.append((nxt, pool.submit(fetch_page, nxt)))
+
+            # ✅ 페이지 단위 커밋: 실패해도 여기까지는 남고 --resume으로 이어받기
+            with transaction.atomic():
+                # 장르 연결은 Genre master가 있을 때만
+                movies = bulk_upsert_movies(results, link_genres=has_genres)
+
+                for movie in movies:
+                    detail, credits, error = extras_by_tmdb_id.get(movie.tmdb_id, (None, None, None))
+                    if error:
+                        run.add_error(movie.tmdb_id, error)
+                    if detail is None and credits is None:
+                        continue  # 적용할 게 없으면 savepoint도 열지 않음
+                    try:
+                        with transaction.atomic():
+                            if detail is not None:
+                                apply_movie_detail(movie, detail)
+                            if credits is not None:
+                                apply_movie_credits(movie, credits, cast_limit=10)
+                    except Exception as e:
+                        run.add_error(movie.tmdb_id, f"{type(e).__name__}: {e}")
+
+                run.last_page = page
+                run.movies_count += len(movies)
+                run.save()
+
+            if on_progress:
+                on_progress(run)
+
+            if sleep_sec:
+                time.sleep(sleep_sec)
+    except BaseException as e:
+        pool.shutdown(wait=False, cancel_futures=True)
+        run.status = "FAILED"
+        run.add_error(f"page {run.last_page + 1}", f"{type(e).__name__}: {e}")
+        run.finished_at = timezone.now()
+        run.save()
+        raise
+    else:
+        pool.shutdown()
+
+    run.status = "DONE"
+    run.finished_at = timezone.now()
+    run.save()
+    return run.movies_count
+
+
+# TMDB /movie/changes는 최대 14일 범위만 조회 가능 (더 길면 구간을 나눠서 조회)
+TMDB_CHANGES_MAX_DAYS = 14
+# 증분 동기화에서 계속 실패하는 영화는 이 횟수까지만 다시 시도
+CHANGES_MAX_RETRIES = 5
+
+
+def fetch_changed_movie_ids(start_date, end_date) -> set[int]:
+    ids = set()
+    page = 1
+    while True:
+        data = _tmdb_get(
+            "/movie/changes",
+            params={
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+                "page": page,
+            },
+        )
+        for item in data.get("results") or []:
+            if item.get("id"):
+                ids.add(item["id"])
+        if page >= int(data.get("total_pages") or 1):
+            break
+        page += 1
+    return ids
 
-            if with_credits:
-                try:
-                    sync_movie_credits(movie, cast_limit=10)
-                except Exception:
-                    pass
 
-            total += 1
+def _refresh_changed_movies(tmdb_ids, concurrency, cast_limit):
+    """
+    change feed 구간 1개 처리: 우리가 가진 영화만 detail + credits 재수집
+    반환: (보유 영화 수, 갱신 수, 실패한 tmdb_id 목록)
+    """
+    # ✅ SQLite 파라미터 수 제한 때문에 나눠서 조회
+    tmdb_ids = sorted(tmdb_ids)
+    movies = []
+    for i in range(0, len(tmdb_ids), 500):
+        movies += list(Movie.objects.filter(tmdb_id__in=tmdb_ids[i:i + 500]))
+
+    refreshed = 0
+    failed_ids = []
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        extras = pool.map(
+            # 변경된 영화라 캐시가 남아 있어도 ETag 재검증
+            lambda tmdb_id: _fetch_movie_extras(tmdb_id, with_detail=True, with_credits=True, revalidate=True),
+            [m.tmdb_id for m in movies],
+        )
+        for movie, (detail, credits, error) in zip(movies, extras):
+            if error or detail is None or credits is None:
+                failed_ids.append(movie.tmdb_id)
+                continue
+            try:
+                with transaction.atomic():
+                    apply_movie_detail(movie, detail)
+                    apply_movie_credits(movie, credits, cast_limit=cast_limit)
+                refreshed += 1
+            except Exception:
+                failed_ids.append(movie.tmdb_id)
+    return len(movies), refreshed, failed_ids
 
-        # TMDB 요청 과열 방지(너무 빠르면 막힘/에러 날 수 있음)
-        time.sleep(sleep_sec)
 
-    return total
+def sync_changed_movies(days=None, concurrency=1, cursor_name="movie_changes", cast_limit=10):
+    """
+    TMDB change feed 기반 증분 동기화
+    - SyncCursor(cursor_name) 이후 바뀐 영화 id를 받아와서
+    - 우리 DB에 있는 영화만 detail + credits 재수집
+    - days를 주면 커서 대신 최근 N일을 다시 훑음
+    - /movie/changes는 한 번에 14일까지라 커서가 더 오래됐으면 14일씩 끊어서 지금까지 차례로 훑고,
+      구간마다 커서 저장 → 중간에 실패해도 끝낸 구간부터 이어감 (오래 멈춰 있어도 건너뛰는 변경분 없음)
+    - 실패한 영화는 cursor.retry_ids에 남겨 다음 구간/실행에서 다시 시도 (CHANGES_MAX_RETRIES번까지)
+      → 커서는 실패와 상관없이 전진해도 누락되지 않음
+    """
+    now = timezone.now()
+    cursor, _ = SyncCursor.objects.get_or_create(name=cursor_name)
+
+    if days:
+        start = now - timedelta(days=days)
+    else:
+        start = cursor.last_synced_at or (now - timedelta(days=1))
+
+    concurrency = max(1, min(int(concurrency), getattr(settings, "TMDB_MAX_CONCURRENCY", 16)))
+    retry = {int(tmdb_id): attempts for tmdb_id, attempts in (cursor.retry_ids or {}).items()}
+    result = {"windows": 0, "changed": 0, "matched": 0, "refreshed": 0, "failed": 0, "retried": len(retry), "gave_up": 0}
+    pending = set(retry)  # 지난번 실패분은 첫 구간에서 같이 재시도
+
+    window_start = start
+    while True:
+        window_end = min(window_start + timedelta(days=TMDB_CHANGES_MAX_DAYS), now)
+        changed_ids = fetch_changed_movie_ids(window_start.date(), window_end.date())
+        tmdb_ids = changed_ids | pending
+        pending = set()
+
+        matched, refreshed, failed_ids = _refresh_changed_movies(tmdb_ids, concurrency, cast_limit)
+        failed = set(failed_ids)
+        for tmdb_id in tmdb_ids:
+            if tmdb_id not in failed:
+                retry.pop(tmdb_id, None)
+                continue
+            retry[tmdb_id] = retry.get(tmdb_id, 0) + 1
+            if retry[tmdb_id] >= CHANGES_MAX_RETRIES:
+                del retry[tmdb_id]
+                result["gave_up"] += 1
+
+        result["windows"] += 1
+        result["changed"] += len(changed_ids)
+        result["matched"] += matched
+        result["refreshed"] += refreshed
+        result["failed"] += len(failed_ids)
+
+        # 구간마다 저장 (--days로 과거를 다시 훑을 때는 커서를 뒤로 돌리지 않음)
+        if cursor.last_synced_at is None or window_end > cursor.last_synced_at:
+            cursor.last_synced_at = window_end
+        cursor.retry_ids = {str(tmdb_id): attempts for tmdb_id, attempts in retry.items()}
+        cursor.save(update_fields=["last_synced_at", "retry_ids", "updated_at"])
+
+        if window_end >= now:
+            return result
+        window_start = window_end
@@ -0,0 +1,108 @@
+# backend/movies/services/tmdb_cache.py
+"""
+TMDB 응답 디스크 캐시 (sqlite3 파일 1개)
+- key: path + params (api_key 제외)
+- 만료(expires_at)가 지나도 ETag와 함께 보관 → If-None-Match 재검증에 사용
+- 전체 크기가 max_bytes를 넘으면 가장 오래 안 쓴 항목부터 삭제(LRU)
+- 워커 스레드마다 별도 커넥션 사용 (Django DB 커넥션과는 무관)
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+
+class TmdbResponseCache:
+    # set() 몇 번마다 용량 검사할지
+    EVICT_EVERY = 50
+
+    def __init__(self, path, max_bytes):
+        self.path = str(path)
+        self.max_bytes = int(max_bytes)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " path TEXT NOT NULL,"
+                " etag TEXT,"
+                " body BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " last_access REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def make_key(path: str, params: dict) -> str:
+        items = sorted((k, str(v)) for k, v in (params or {}).items() if k != "api_key")
+        raw = json.dumps([path, items], ensure_ascii=False)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """
+        (data, etag, is_fresh) 또는 None
+        """
+        conn = self._conn()
+        row = conn.execute("SELECT body, etag, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+        body, etag, expires_at = row
+        return json.loads(body), etag, expires_at > now
+
+    def set(self, key, path, data, etag, ttl):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        now = time.time()
+        self._conn().execute(
+            "INSERT OR REPLACE INTO entries (key, path, etag, body, size, expires_at, last_access)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, path, etag, body, len(body), now + ttl, now),
+        )
+        with self._lock:
+            self._writes += 1
+            should_evict = self._writes % self.EVICT_EVERY == 0
+        if should_evict:
+            self.evict()
+
+    def touch(self, key, ttl):
+        # 304(Not Modified)로 재검증된 항목 만료 연장
+        now = time.time()
+        self._conn().execute(
+            "UPDATE entries SET expires_at = ?, last_access = ? WHERE key = ?",
+            (now + ttl, now, key),
+        )
+
+    def evict(self):
+        conn = self._conn()
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+
+        # 오래 안 쓴 것부터 용량의 90%까지 줄임
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        rows = conn.execute("SELECT key, size FROM entries ORDER BY last_access").fetchall()
+        doomed = []
+        for key, size in rows:
+            if total <= target:
+                break
+            doomed.append((key,))
+            total -= size
+            removed += 1
+        conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+        return removed
+
+    def clear(self):
+        self._conn().execute("DELETE FROM entries")
@@ -0,0 +1,31 @@
+# backend/movies/tasks.py
+from django.utils import timezone
+
+from jobs.registry import task
+
+from .models import Movie
+from .services.detail_cache import invalidate_movie_details
+from .services.tmdb import sync_movie_detail, sync_changed_movies
+
+
+@task("movies.refresh_movie")
+def refresh_movie(tmdb_id: int):
+    # 상세 + 크레딧 재수집 (movie_detail에서 오래된 영화일 때 예약)
+    # 시도 시각은 TMDB 요청 전에 기록 → 실패하거나 TMDB에도 값이 없어도 재시도 간격을 지킴
+    if not Movie.objects.filter(tmdb_id=tmdb_id).update(detail_refreshed_at=timezone.now()):
+        return
+    invalidate_movie_details([tmdb_id])
+    sync_movie_detail(Movie.objects.get(tmdb_id=tmdb_id), cast_limit=10)
+
+
+@task("movies.sync_changes")
+def sync_changes(days=None, concurrency=8):
+    sync_changed_movies(days=days, concurrency=concurrency)
+
+
+@task("movies.build_neighbors")
+def build_neighbors(full=False):
+    # numpy는 이 작업에서만 필요해서 여기서 import
+    from .services.neighbors import build_movie_neighbors
+
+    build_movie_neighbors(full=full)
@@ -1,3 +1,938 @@
-from django.test import TestCase
+import hashlib
+import json
+import os
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+import requests
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from jobs.models import Job
+from jobs.services import claim_next, run_job
+from reviews.models import Review
+from reviews.services.top_reviews import rebuild_top_reviews
+
+from .models import (
+    Genre,
+    HomeSectionEntry,
+    Movie,
+    MovieCredit,
+    MovieGenre,
+    MovieNeighbor,
+    Person,
+    SyncCursor,
+    SyncRun,
+)
+from .pagination import MovieCursorPagination
+from .serializers import CARD_FIELDS, MovieListSerializer, serialize_movie_cards
+from .services import home_payload, refresh, suggest, tmdb
+from .services.fake_tmdb import FakeTmdb, start_in_thread
+from .services.neighbors import build_movie_neighbors
+from .services.search import index_movies, search_ids
+
+User = get_user_model()
+
+
+class FakeResponse:
+    def __init__(self, status_code, data=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._data = data
+
+    def json(self):
+        return self._data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)
+
+
+class FakeTmdbSession:
+    """
+    requests.Session 대역: movies.services.fake_tmdb.FakeTmdb 응답을 네트워크 없이 돌려줌
+    - calls: 받은 요청 [(path, params)]
+    - respond(path, params): (status, data)를 반환하면 기본 응답 대신 사용 (429 / 500 / 변경 목록 등)
+    - ETag / If-None-Match(304) 지원
+    """
+
+    base_url = "http://fake-tmdb/3"
+
+    def __init__(self, respond=None):
+        self.fake = FakeTmdb(total_pages=5)
+        self.calls = []
+        self.respond = respond or (lambda path, params: None)
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        path = url[len(self.base_url):]
+        params = dict(params or {})
+        self.calls.append((path, params))
+
+        override = self.respond(path, params)
+        if override is not None:
+            status, data = override
+            return FakeResponse(status, data, {"Retry-After": "0"} if status == 429 else {})
+
+        data = self.fake.route(path, {k: [str(v)] for k, v in params.items()})
+        if data is None:
+            return FakeResponse(404, {"status_code": 34})
+        body = json.dumps(data, sort_keys=True, ensure_ascii=False)
+        etag = '"' + hashlib.md5(body.encode("utf-8")).hexdigest() + '"'
+        if (headers or {}).get("If-None-Match") == etag:
+            return FakeResponse(304, None, {"ETag": etag})
+        return FakeResponse(200, json.loads(body), {"ETag": etag})
+
+    def requested(self, path):
+        return [params for p, params in self.calls if p == path]
+
+
+@override_settings(TMDB_BASE_URL=FakeTmdbSession.base_url, TMDB_API_KEY="test", TMDB_CACHE_ENABLED=False)
+class TmdbTestCase(TestCase):
+    """
+    TMDB 호출을 FakeTmdbSession으로 돌리는 테스트 (rate limiter는 사실상 무제한)
+    """
+
+    def setUp(self):
+        tmdb.reset_client()
+        self.addCleanup(tmdb.reset_client)
+        self.session = FakeTmdbSession()
+        tmdb._session = self.session
+        tmdb._limiter = tmdb.TokenBucket(rate=10000, burst=10000)
+
+
+class FakeClock:
+    """
+    movies.services.tmdb의 time 모듈 대역: sleep하면 monotonic이 그만큼 흐름
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TmdbClientTests(TmdbTestCase):
+    """
+    token bucket 요청 속도 제한 / 429 재시도 / 동시 요청으로 sync_bulk_movies
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.clock = FakeClock()
+        patcher = mock.patch.object(tmdb, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        tmdb._limiter = tmdb.TokenBucket(rate=10000, burst=10000)  # 가짜 시계 기준으로 다시
+
+    def test_token_bucket_allows_burst_then_rate(self):
+        bucket = tmdb.TokenBucket(rate=10, burst=2)
+        for _ in range(5):
+            bucket.acquire()
+        # 2개는 바로, 나머지 3개는 0.1초 간격
+        self.assertAlmostEqual(self.clock.now, 0.3)
+
+    def test_429_retries_after_retry_after(self):
+        answers = [(429, {}), (429, {})]
+        self.session.respond = lambda path, params: answers.pop(0) if answers else None
+
+        data = tmdb._tmdb_get("/movie/1000")
+        self.assertEqual(data["id"], 1000)
+        self.assertEqual(len(self.session.requested("/movie/1000")), 3)
+        self.assertEqual(self.clock.sleeps, [0.0, 0.0])
+
+    def test_429_gives_up_after_retries(self):
+        self.session.respond = lambda path, params: (429, {})
+        with self.assertRaises(requests.HTTPError):
+            tmdb._tmdb_get("/movie/1000", retries=2)
+        self.assertEqual(len(self.session.calls), 3)
+
+    def test_concurrent_bulk_sync(self):
+        count = tmdb.sync_bulk_movies(pages=3, with_detail=True, with_credits=True, concurrency=4)
+
+        self.assertEqual(count, 60)
+        self.assertEqual([p["page"] for p in self.session.requested("/discover/movie")], [1, 2, 3])
+        # 상세 + 크레딧은 영화마다 요청 1번 (append_to_response)
+        detail_calls = [path for path, _ in self.session.calls if path.startswith("/movie/")]
+        self.assertEqual(len(detail_calls), 60)
+        self.assertEqual(len(set(detail_calls)), 60)
+        self.assertFalse(Movie.objects.filter(runtime__isnull=True).exists())
+        self.assertEqual(MovieCredit.objects.filter(role_type="DIRECTOR").values("movie").distinct().count(), 60)
+
+
+class TmdbCacheTests(TmdbTestCase):
+    """
+    _tmdb_get 디스크 캐시 - 유효하면 요청 없음 / 만료·revalidate면 If-None-Match → 304 재사용
+    """
+
+    def setUp(self):
+        super().setUp()
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        settings_override = override_settings(
+            TMDB_CACHE_ENABLED=True, TMDB_CACHE_PATH=os.path.join(cache_dir.name, "tmdb.sqlite3")
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        tmdb.reset_cache_stats()
+
+    def test_fresh_entry_skips_network(self):
+        first = tmdb._tmdb_get("/movie/1000")
+        second = tmdb._tmdb_get("/movie/1000")
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.session.calls), 1)
+        self.assertEqual(tmdb.cache_stats(), {"hit": 1, "miss": 1, "revalidated": 0})
+
+    def test_expired_or_revalidate_uses_etag(self):
+        data = tmdb._tmdb_get("/movie/1000")
+        self.assertEqual(tmdb._tmdb_get("/movie/1000", revalidate=True), data)
+
+        tmdb._get_cache()._conn().execute("UPDATE entries SET expires_at = 0")
+        self.assertEqual(tmdb._tmdb_get("/movie/1000"), data)
+        self.assertEqual(len(self.session.calls), 3)
+        self.assertEqual(tmdb.cache_stats(), {"hit": 0, "miss": 1, "revalidated": 2})
+        # 304로 만료가 연장됨
+        tmdb._tmdb_get("/movie/1000")
+        self.assertEqual(len(self.session.calls), 3)
+
+    def test_params_and_ttl_zero_paths(self):
+        tmdb._tmdb_get("/discover/movie", {"page": 1})
+        tmdb._tmdb_get("/discover/movie", {"page": 2})
+        self.assertEqual(len(self.session.calls), 2)
+
+        # 변경 목록은 캐시하지 않음
+        tmdb._tmdb_get("/movie/changes", {"start_date": "2026-01-01"})
+        tmdb._tmdb_get("/movie/changes", {"start_date": "2026-01-01"})
+        self.assertEqual(len(self.session.requested("/movie/changes")), 2)
+
+
+@override_settings(TMDB_API_KEY="test", TMDB_CACHE_ENABLED=False, TMDB_RATE_LIMIT=10000, TMDB_RATE_BURST=10000)
+class FakeTmdbServerTests(TestCase):
+    """
+    fake_tmdb_server / bench_tmdb_sync용 대역 서버 - 실제 HTTP로 _tmdb_get이 그대로 동작하는지
+    """
+
+    def _start(self, **kwargs):
+        server = start_in_thread(**kwargs)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        settings_override = override_settings(TMDB_BASE_URL=server.base_url)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        tmdb.reset_client()
+        self.addCleanup(tmdb.reset_client)
+        return server
+
+    def test_serves_deterministic_pages_and_etags(self):
+        server = self._start()
+        page = tmdb._tmdb_get("/discover/movie", {"page": 2})
+        self.assertEqual(page, FakeTmdb().page(2))
+        self.assertEqual(tmdb._tmdb_get("/movie/1000", {"append_to_response": "credits"})["credits"]["id"], 1000)
+
+        etag = '"' + hashlib.md5(json.dumps(page, ensure_ascii=False).encode("utf-8")).hexdigest() + '"'
+        res = requests.get(f"{server.base_url}/discover/movie?page=2", headers={"If-None-Match": etag}, timeout=5)
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(server.stats, {"requests": 3, "throttled": 0, "not_modified": 1})
+
+    def test_throttled_requests_are_retried(self):
+        server = self._start(error_rate=1.0)
+        with self.assertRaises(requests.HTTPError) as ctx:
+            tmdb._tmdb_get("/movie/1000", retries=2)
+        self.assertEqual(ctx.exception.response.status_code, 429)
+        self.assertEqual(server.stats["throttled"], 3)
+
+
+class BulkUpsertTests(TestCase):
+    """
+    bulk_upsert_movies - 다시 넣어도 같은 결과 / 바뀐 장르 매핑만 교체 / 쿼리 수가 페이지 크기와 무관
+    """
+
+    def setUp(self):
+        self.fake = FakeTmdb()
+        tmdb.upsert_genres(self.fake.route("/genre/movie/list", {})["genres"])
+
+    def _links(self):
+        return set(MovieGenre.objects.values_list("id", "movie__tmdb_id", "genre__tmdb_id"))
+
+    def test_upsert_is_idempotent(self):
+        results = self.fake.page(1)["results"]
+        first = tmdb.bulk_upsert_movies(results)
+        links = self._links()
+
+        again = tmdb.bulk_upsert_movies(results + results[:3])
+        self.assertEqual([m.id for m in again], [m.id for m in first])
+        self.assertEqual(Movie.objects.count(), 20)
+        self.assertEqual(self._links(), links)
+        self.assertEqual(len(links), sum(len(item["genre_ids"]) for item in results))
+
+    def test_changed_genres_replace_only_their_links(self):
+        results = self.fake.page(1)["results"]
+        tmdb.bulk_upsert_movies(results)
+        before = self._links()
+
+        changed = dict(results[0], title="새 제목", genre_ids=[99])
+        tmdb.bulk_upsert_movies([changed] + results[1:])
+        after = self._links()
+        self.assertEqual(Movie.objects.get(tmdb_id=changed["id"]).title, "새 제목")
+        self.assertEqual({g for _, m, g in after if m == changed["id"]}, {99})
+        # 다른 영화의 매핑 행은 그대로 (삭제 후 재생성하지 않음)
+        untouched = {row for row in before if row[1] != changed["id"]}
+        self.assertEqual({row for row in after if row[1] != changed["id"]}, untouched)
+
+    def test_query_count_does_not_grow_with_page(self):
+        small, large = self.fake.page(1)["results"][:5], self.fake.page(2)["results"]
+        with CaptureQueriesContext(connection) as small_queries:
+            tmdb.bulk_upsert_movies(small)
+        with CaptureQueriesContext(connection) as large_queries:
+            tmdb.bulk_upsert_movies(large)
+        self.assertEqual(len(large_queries), len(small_queries))
+
+
+class CreditsSyncTests(TmdbTestCase):
+    """
+    상세 + 크레딧 요청 1번 / 크레딧은 바뀐 행만 쓰기(diff)
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.movie = Movie.objects.create(tmdb_id=1000, title="영화")
+
+    def _credits(self):
+        return {
+            (person_tmdb_id, role): (pk, character_name)
+            for pk, person_tmdb_id, role, character_name in MovieCredit.objects.filter(movie=self.movie).values_list(
+                "id", "person__tmdb_id", "role_type", "character_name"
+            )
+        }
+
+    def test_detail_and_credits_in_one_request(self):
+        tmdb.sync_movie_detail(self.movie, cast_limit=10)
+        self.assertEqual(self.session.calls, [("/movie/1000", mock.ANY)])
+        self.assertEqual(self.session.calls[0][1]["append_to_response"], "credits")
+
+        credits = self._credits()
+        self.assertEqual(len(credits), 11)
+        self.assertEqual(sum(role == "DIRECTOR" for _, role in credits), 1)
+        self.movie.refresh_from_db()
+        self.assertIsNotNone(self.movie.runtime)
+
+    def test_unchanged_credits_are_not_written(self):
+        credits = self.session.fake.credits(1000)
+        tmdb.apply_movie_credits(self.movie, credits)
+
+        with CaptureQueriesContext(connection) as queries:
+            tmdb.apply_movie_credits(self.movie, credits)
+        writes = [q["sql"] for q in queries if q["sql"].split()[0] in ("INSERT", "UPDATE", "DELETE")]
+        self.assertEqual(writes, [])
+
+    def test_changed_credits_are_merged(self):
+        credits = self.session.fake.credits(1000)
+        tmdb.apply_movie_credits(self.movie, credits)
+        before = self._credits()
+
+        dropped, renamed = credits["cast"][0]["id"], credits["cast"][1]["id"]
+        credits["cast"] = credits["cast"][1:]
+        credits["cast"][0] = dict(credits["cast"][0], character="새 역할")
+        tmdb.apply_movie_credits(self.movie, credits)
+        after = self._credits()
+
+        self.assertNotIn((dropped, "CAST"), after)
+        self.assertEqual(after[(renamed, "CAST")], (before[(renamed, "CAST")][0], "새 역할"))
+        # 그대로인 크레딧은 행이 유지됨
+        kept = set(before) - {(dropped, "CAST")}
+        self.assertEqual({key: after[key][0] for key in kept}, {key: before[key][0] for key in kept})
+        self.assertEqual(len(after), 11)  # cast_limit 10 → 빠진 자리에 11번째 배우
+
+
+@override_settings(JOBS_EAGER=False)
+class MovieDetailCacheTests(APITestCase):
+    """
+    movie_detail - 크레딧 수와 상관없는 쿼리 수 / 두 번째부터 캐시 / 동기화·반응 변경 때 무효화
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.fake = FakeTmdb()
+
+    def _movie(self, tmdb_id, cast_limit):
+        movie = Movie.objects.create(tmdb_id=tmdb_id, title=f"영화 {tmdb_id}", runtime=120)
+        tmdb.apply_movie_credits(movie, self.fake.credits(tmdb_id), cast_limit=cast_limit)
+        return movie
+
+    def _detail_queries(self, tmdb_id):
+        with CaptureQueriesContext(connection) as queries:
+            data = self.client.get(f"/api/movies/{tmdb_id}/").json()
+        return data, len(queries)
+
+    def test_single_pass_then_cached(self):
+        self._movie(1000, cast_limit=2)
+        self._movie(1001, cast_limit=10)
+        small, small_queries = self._detail_queries(1000)
+        large, large_queries = self._detail_queries(1001)
+        self.assertEqual((len(small["cast"]), len(large["cast"])), (2, 10))
+        self.assertEqual(small_queries, large_queries)
+
+        cached, cached_queries = self._detail_queries(1001)
+        self.assertEqual(cached, large)
+        self.assertEqual(cached_queries, 0)
+        self.assertFalse(Job.objects.exists())  # 새 영화라 갱신 예약도 없음
+
+    def test_sync_and_reactions_invalidate(self):
+        movie = self._movie(1000, cast_limit=2)
+        self.client.get("/api/movies/1000/")
+
+        credits = self.fake.credits(1000)
+        credits["cast"][0] = dict(credits["cast"][0], character="새 역할")
+        with self.captureOnCommitCallbacks(execute=True):
+            tmdb.apply_movie_credits(movie, credits, cast_limit=2)
+        data = self.client.get("/api/movies/1000/").json()
+        self.assertEqual(data["cast"][0]["character_name"], "새 역할")
+
+        user = User.objects.create(username="fan", email="fan@example.com")
+        self.client.force_authenticate(user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(self.client.post("/api/movies/1000/like/").json()["liked"])
+        self.assertEqual(self.client.get("/api/movies/1000/").json()["like_count"], 1)
+
+
+@override_settings(JOBS_EAGER=False, MOVIE_REFRESH_RETRY_MINUTES=360)
+class MovieRefreshTests(TmdbTestCase):
+    """
+    movie_detail은 DB 값으로 바로 응답하고 갱신은 movies.refresh_movie 작업으로 (같은 영화는 한 번만 예약)
+    """
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        refresh._recent.clear()
+        self.movie = Movie.objects.create(tmdb_id=1000, title="영화")
+
+    def _detail(self):
+        res = self.client.get("/api/movies/1000/")
+        self.assertEqual(res.status_code, 200)
+        return res.json()
+
+    def test_detail_schedules_one_refresh(self):
+        data = self._detail()
+        self.assertEqual((data["title"], data["runtime"]), ("영화", None))
+        self.assertEqual(self.session.calls, [])  # 요청 안에서는 TMDB 호출 없음
+
+        self._detail()
+        refresh._recent.clear()
+        self._detail()  # 프로세스 메모리를 비워도 대기 중인 작업이 있으면 그대로
+        self.assertEqual(list(Job.objects.values_list("name", "payload")), [("movies.refresh_movie", {"tmdb_id": 1000})])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(run_job(claim_next("w1")))
+        data = self._detail()
+        self.assertEqual(data["title"], "영화 1000")
+        self.assertIsNotNone(data["runtime"])
+        self.assertTrue(data["cast"])
+        self.assertEqual(Job.objects.filter(status="QUEUED").count(), 0)
+
+    def test_failed_refresh_is_not_rescheduled(self):
+        self.session.respond = lambda path, params: (500, {})
+        self._detail()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertFalse(run_job(claim_next("w1")))
+        Job.objects.update(status="FAILED")
+
+        # 실패해도 시도 시각이 남아 다음 조회에서 다시 예약하지 않음
+        refresh._recent.clear()
+        self._detail()
+        self.movie.refresh_from_db()
+        self.assertIsNotNone(self.movie.detail_refreshed_at)
+        self.assertEqual(Job.objects.exclude(status="FAILED").count(), 0)
+
+
+class HomeSectionSwapTests(TmdbTestCase):
+    """
+    sync_home_section - TMDB를 다 받은 뒤 새 세대를 쓰고 포인터 교체 / 실패하면 기존 세대 유지
+    """
+
+    def _entries(self):
+        entries = {}
+        for generation, tmdb_id in (
+            HomeSectionEntry.objects.filter(section="POPULAR")
+            .order_by("generation", "rank")
+            .values_list("generation", "movie__tmdb_id")
+        ):
+            entries.setdefault(generation, []).append(tmdb_id)
+        return entries
+
+    def test_swap_keeps_previous_generation(self):
+        self.assertEqual(tmdb.sync_home_section("POPULAR", "/movie/popular", with_credits=False), 1)
+        self.assertEqual(tmdb.active_home_generations(), {"POPULAR": 1})
+        self.assertEqual(self._entries()[1], list(range(1000, 1020)))
+
+        self.assertEqual(tmdb.sync_home_section("POPULAR", "/movie/popular", with_credits=False), 2)
+        self.assertEqual(sorted(self._entries()), [1, 2])  # 읽는 중인 요청용으로 직전 세대는 남김
+        tmdb.sync_home_section("POPULAR", "/movie/popular", with_credits=False)
+        self.assertEqual(sorted(self._entries()), [2, 3])
+        self.assertEqual(tmdb.active_home_generations(), {"POPULAR": 3})
+
+    def test_failed_fetch_keeps_active_generation(self):
+        tmdb.sync_home_section("POPULAR", "/movie/popular", with_credits=False)
+        self.session.respond = lambda path, params: (500, {}) if params.get("page") == 2 else None
+
+        with self.assertRaises(requests.HTTPError):
+            tmdb.sync_home_section("POPULAR", "/movie/popular", pages=2, with_credits=False)
+        self.assertEqual(tmdb.active_home_generations(), {"POPULAR": 1})
+        self.assertEqual(list(self._entries()), [1])
+
+    def test_credits_are_written_before_swap(self):
+        tmdb.sync_home_section("POPULAR", "/movie/popular", with_credits=True, concurrency=4)
+        self.assertEqual(len(self.session.requested("/movie/popular")), 1)
+        self.assertEqual(
+            MovieCredit.objects.filter(role_type="DIRECTOR", movie__home_entries__generation=1).count(), 20
+        )
+
+
+class ResumableBulkSyncTests(TmdbTestCase):
+    """
+    sync_tmdb_bulk - 페이지마다 커밋 / 실패하면 SyncRun FAILED + last_page / --resume으로 다음 페이지부터
+    """
+
+    def _sync(self, *args):
+        call_command("sync_tmdb_bulk", "--pages", "5", "--concurrency", "2", *args, stdout=StringIO())
+
+    def test_resume_after_failed_page(self):
+        self.session.respond = lambda path, params: (500, {}) if params.get("page") == 3 else None
+        with self.assertRaises(requests.HTTPError):
+            self._sync()
+        run = SyncRun.objects.get()
+        self.assertEqual((run.status, run.last_page, run.movies_count), ("FAILED", 2, 40))
+        self.assertEqual(run.errors[-1]["where"], "page 3")
+        self.assertEqual(Movie.objects.count(), 40)
+
+        # 조건이 다르면 이어받지 않음
+        self.assertIsNone(tmdb.find_resumable_run("bulk", dict(run.params, with_detail=True)))
+
+        self.session.respond = lambda path, params: None
+        self.session.calls.clear()
+        self._sync("--resume")
+        self.assertEqual([p["page"] for p in self.session.requested("/discover/movie")], [3, 4, 5])
+        run.refresh_from_db()
+        self.assertEqual((run.status, run.last_page, run.movies_count), ("DONE", 5, 100))
+        self.assertEqual(SyncRun.objects.count(), 1)
+        self.assertEqual(Movie.objects.count(), 100)
+
+    def test_movie_failure_is_recorded_and_page_continues(self):
+        self.session.respond = lambda path, params: (500, {}) if path == "/movie/1005" else None
+        self._sync("--with-detail")
+
+        run = SyncRun.objects.get()
+        self.assertEqual((run.status, run.failures_count), ("DONE", 1))
+        self.assertEqual(run.errors[0]["where"], "1005")
+        self.assertEqual(Movie.objects.filter(runtime__isnull=True).count(), 1)
+
+
+@override_settings(HOME_PAYLOAD_CHECK_SECONDS=0)
+class HomePayloadTests(TestCase):
+    """
+    /api/movies/home/ - 미리 렌더링한 바이트 + ETag(304) / 세대 교체·홈 영화 리뷰 변경 때만 다시 렌더링
+    """
+
+    def setUp(self):
+        cache.clear()
+        home_payload.invalidate_home_payload()
+        self.movies = [Movie.objects.create(tmdb_id=i + 1, title=f"영화 {i}", popularity=10 - i) for i in range(3)]
+        with self.captureOnCommitCallbacks(execute=True):
+            tmdb.swap_home_section("POPULAR", [m.id for m in self.movies[:2]])
+
+    def test_etag_and_not_modified(self):
+        res = self.client.get("/api/movies/home/")
+        self.assertEqual([m["tmdb_id"] for m in res.json()["popular"]], [1, 2])
+        etag = res["ETag"]
+
+        # 렌더링된 바이트를 그대로 씀 (DB 조회 없음)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get("/api/movies/home/").content, res.content)
+        self.assertEqual(self.client.get("/api/movies/home/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self.client.get("/api/movies/home/", HTTP_IF_NONE_MATCH=f"W/{etag}").status_code, 304)
+        self.assertEqual(self.client.get("/api/movies/home/", HTTP_IF_NONE_MATCH='"stale"').status_code, 200)
+
+    def test_swap_and_home_movie_changes_rerender(self):
+        etag = self.client.get("/api/movies/home/")["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tmdb.swap_home_section("POPULAR", [m.id for m in self.movies])
+        res = self.client.get("/api/movies/home/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual([m["tmdb_id"] for m in res.json()["popular"]], [1, 2, 3])
+
+        etag = res["ETag"]
+        home_payload.invalidate_home_payload_for_movie(Movie.objects.create(tmdb_id=99, title="홈 밖").id)
+        self.assertEqual(self.client.get("/api/movies/home/", HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        Movie.objects.filter(pk=self.movies[0].pk).update(title="바뀐 제목")
+        home_payload.invalidate_home_payload_for_movie(self.movies[0].id)
+        res = self.client.get("/api/movies/home/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(res.json()["popular"][0]["title"], "바뀐 제목")
+
+    def test_fields_payload(self):
+        res = self.client.get("/api/movies/home/?fields=tmdb_id,title")
+        self.assertEqual(res.json()["popular"][0], {"tmdb_id": 1, "title": "영화 0"})
+        self.assertEqual(
+            self.client.get("/api/movies/home/?fields=tmdb_id,title", HTTP_IF_NONE_MATCH=res["ETag"]).status_code, 304
+        )
+
+
+class MovieCursorPaginationTests(TestCase):
+    """
+    커서로 끝까지 넘긴 결과가 전체 정렬과 같은지 (동점 / release_date NULL 구간 경계 포함)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        movies = []
+        for i in range(23):
+            movies.append(Movie(
+                tmdb_id=i + 1,
+                title=f"영화 {i}",
+                popularity=float(i % 4),
+                vote_count=i % 3,
+                release_date=None if i % 5 == 0 else date(2020, 1, 1) + timedelta(days=i % 7),
+            ))
+        Movie.objects.bulk_create(movies)
+
+    def _walk(self, sort):
+        factory = APIRequestFactory()
+        params = {"page_size": 4}
+        ids = []
+        while True:
+            paginator = MovieCursorPagination()
+            request = Request(factory.get("/api/movies/list/", params))
+            ids += [m.tmdb_id for m in paginator.paginate_queryset(Movie.objects.all(), request, sort)]
+            if not paginator.has_next:
+                return ids
+            params["cursor"] = paginator._encode_cursor(paginator.page[-1])
+
+    def test_walk_matches_full_ordering(self):
+        for sort in ("popular", "latest", "rating"):
+            keys = MovieCursorPagination.sort_keys[sort]
+            expected = sorted(
+                Movie.objects.all(),
+                key=lambda m: tuple(
+                    (getattr(m, k.lstrip("-")) is not None, getattr(m, k.lstrip("-")) or 0) for k in keys
+                ),
+                reverse=True,
+            )
+            self.assertEqual(self._walk(sort), [m.tmdb_id for m in expected], sort)
+
+
+class MovieCardFieldsTests(APITestCase):
+    """
+    카드 빠른 경로(serialize_movie_cards)가 MovieListSerializer와 같은 JSON / ?fields=로 필요한 것만
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        drama = Genre.objects.create(tmdb_id=18, name="드라마")
+        action = Genre.objects.create(tmdb_id=28, name="액션")
+        writer = User.objects.create(username="writer", email="writer@example.com")
+        for i in range(4):
+            movie = Movie.objects.create(
+                tmdb_id=i + 1,
+                title=f"영화 {i}",
+                popularity=10 - i,
+                vote_average=7.5,
+                release_date=date(2020, 1, i + 1) if i % 2 else None,
+            )
+            for genre in (action, drama)[: i % 3]:
+                MovieGenre.objects.create(movie=movie, genre=genre)
+            if i % 2 == 0:
+                Review.objects.create(user=writer, movie=movie, content="리뷰", watched=True, rating=4)
+        rebuild_top_reviews()
+
+    def test_fast_path_matches_serializer(self):
+        qs = Movie.objects.order_by("id")
+        renderer = JSONRenderer()
+        self.assertEqual(
+            renderer.render(serialize_movie_cards(qs)), renderer.render(MovieListSerializer(qs, many=True).data)
+        )
+
+    def test_sparse_fields(self):
+        with CaptureQueriesContext(connection) as queries:
+            res = self.client.get("/api/movies/list/?fields=title,tmdb_id,unknown")
+        self.assertEqual(res.json()["results"][0], {"tmdb_id": 1, "title": "영화 0"})
+        # 장르/대표 리뷰를 안 읽음
+        self.assertFalse(any("moviegenre" in q["sql"] or "movietopreview" in q["sql"] for q in queries))
+
+        full = self.client.get("/api/movies/list/?fields=unknown").json()["results"][0]
+        self.assertEqual(list(full), list(CARD_FIELDS))
+
+
+class MovieSearchTests(TestCase):
+    """
+    한글 1글자 검색이 제목 중간/끝 글자에도 걸리는지 (예전 icontains와 같은 결과)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.spy = Movie.objects.create(tmdb_id=1, title="밀정", popularity=5)
+        cls.iron = Movie.objects.create(tmdb_id=2, title="아이언맨2", popularity=9)
+        cls.other = Movie.objects.create(tmdb_id=3, title="기생충", popularity=1)
+        index_movies([cls.spy, cls.iron, cls.other])
+
+    def _ids(self, q):
+        return set(search_ids("movie", q)[0])
+
+    def test_single_syllable_matches_any_position(self):
+        self.assertEqual(self._ids("정"), {self.spy.id})
+        self.assertEqual(self._ids("밀"), {self.spy.id})
+        self.assertEqual(self._ids("맨"), {self.iron.id})
+        self.assertEqual(self._ids("언"), {self.iron.id})
+
+    def test_multi_syllable_still_needs_all_bigrams(self):
+        self.assertEqual(self._ids("언맨"), {self.iron.id})
+        self.assertEqual(self._ids("정밀"), set())
+
+
+class ChangesSyncTests(TmdbTestCase):
+    """
+    sync_changed_movies - 14일 구간 나누기 / 구간마다 커서 저장 / 실패분 retry_ids
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.changes = {}
+        self.broken = set()
+
+        def respond(path, params):
+            if path == "/movie/changes":
+                if params["start_date"] in self.broken:
+                    return 500, {}
+                ids = self.changes.get(params["start_date"], [])
+                return 200, {"page": 1, "total_pages": 1, "results": [{"id": i} for i in ids]}
+            if path.startswith("/movie/") and int(path.split("/")[2]) in self.broken:
+                return 500, {}
+            return None
+
+        self.session.respond = respond
+        self.cursor = SyncCursor.objects.create(name="movie_changes", last_synced_at=timezone.now() - timedelta(days=30))
+        self.movie = Movie.objects.create(tmdb_id=1001, title="예전 제목")
+
+    def _windows(self):
+        return [(p["start_date"], p["end_date"]) for p in self.session.requested("/movie/changes")]
+
+    def test_walks_old_cursor_in_windows(self):
+        start = self.cursor.last_synced_at
+        middle = (start + timedelta(days=14)).date().isoformat()
+        self.changes[middle] = [1001, 9999]
+
+        result = tmdb.sync_changed_movies()
+
+        today = timezone.now().date()
+        self.assertEqual(self._windows(), [
+            (start.date().isoformat(), middle),
+            (middle, (start + timedelta(days=28)).date().isoformat()),
+            ((start + timedelta(days=28)).date().isoformat(), today.isoformat()),
+        ])
+        self.assertEqual((result["windows"], result["changed"], result["refreshed"]), (3, 2, 1))
+        self.movie.refresh_from_db()
+        self.assertEqual(self.movie.title, "영화 1001")
+        self.cursor.refresh_from_db()
+        self.assertEqual(self.cursor.last_synced_at.date(), today)
+
+    def test_failed_window_keeps_earlier_progress(self):
+        start = self.cursor.last_synced_at
+        self.broken.add((start + timedelta(days=14)).date().isoformat())
+
+        with self.assertRaises(requests.HTTPError):
+            tmdb.sync_changed_movies()
+        self.cursor.refresh_from_db()
+        self.assertEqual(self.cursor.last_synced_at, start + timedelta(days=14))
+
+        # 다음 실행은 저장된 구간부터
+        self.broken.clear()
+        self.session.calls.clear()
+        self.assertEqual(tmdb.sync_changed_movies()["windows"], 2)
+        self.assertEqual(self._windows()[0][0], (start + timedelta(days=14)).date().isoformat())
+
+    def test_failed_movies_are_retried(self):
+        SyncCursor.objects.filter(pk=self.cursor.pk).update(last_synced_at=timezone.now() - timedelta(hours=1))
+        self.changes[timezone.now().date().isoformat()] = [1001]
+        self.broken.add(1001)
+
+        result = tmdb.sync_changed_movies()
+        self.assertEqual((result["failed"], result["gave_up"]), (1, 0))
+        self.cursor.refresh_from_db()
+        self.assertEqual(self.cursor.retry_ids, {"1001": 1})
+
+        # 변경 목록에 다시 없어도 retry_ids로 재시도 → 성공하면 비움
+        self.changes.clear()
+        self.broken.clear()
+        result = tmdb.sync_changed_movies()
+        self.assertEqual((result["retried"], result["refreshed"]), (1, 1))
+        self.cursor.refresh_from_db()
+        self.assertEqual(self.cursor.retry_ids, {})
+
+    def test_gives_up_after_max_retries(self):
+        SyncCursor.objects.filter(pk=self.cursor.pk).update(
+            last_synced_at=timezone.now() - timedelta(hours=1), retry_ids={"1001": tmdb.CHANGES_MAX_RETRIES - 1}
+        )
+        self.broken.add(1001)
+        self.assertEqual(tmdb.sync_changed_movies()["gave_up"], 1)
+        self.cursor.refresh_from_db()
+        self.assertEqual(self.cursor.retry_ids, {})
+
+
+class SuggestTests(TestCase):
+    """
+    자동완성 - 단어 시작 위치 매칭 / 미리 계산한 top-k가 범위 탐색과 같은 결과 / 이름이 바뀔 때만 카탈로그 버전 변경
+    """
+
+    def setUp(self):
+        cache.clear()
+        state = dict(suggest._state)
+        self.addCleanup(suggest._state.update, state)
+        suggest._state.update(index=None, version=None, checked_at=0.0, building=False)
+
+    def test_word_start_prefix(self):
+        Movie.objects.create(tmdb_id=1, title="어벤져스: 엔드게임", original_title="Avengers: Endgame", popularity=9)
+        Movie.objects.create(tmdb_id=2, title="엔드 오브 왓치", popularity=5)
+        Movie.objects.create(tmdb_id=3, title="프렌드", popularity=7)  # 단어 중간("드")은 안 걸림
+        res = self.client.get("/api/movies/suggest/?q=엔드")
+        self.assertEqual([m["tmdb_id"] for m in res.json()["movies"]], [1, 2])
+        self.assertEqual([m["tmdb_id"] for m in suggest.suggest("endg")["movies"]], [1])
+
+    def test_precomputed_prefixes_match_scan(self):
+        items = [
+            ("movie", float(i % 37), {"tmdb_id": i}, [f"a{i % 7} movie {i}"]) for i in range(suggest.SCAN_LIMIT * 3)
+        ]
+        index = suggest.SuggestIndex(items)
+        self.assertIn("a", index.top)
+        for prefix in ("a", "a1", "mov", "movie 1", "zz"):
+            matched = [
+                i for i, (_, _, _, [name]) in enumerate(items)
+                if any(" ".join(name.split(" ")[j:]).startswith(prefix) for j in range(3))
+            ]
+            expected = sorted(matched, key=lambda i: (-items[i][1], i))[:5]
+            self.assertEqual(index.suggest(prefix)["movies"], [items[i][2] for i in expected], prefix)
+
+    def test_catalog_version_bumps_only_on_name_change(self):
+        results = FakeTmdb().page(1)["results"]
+        with self.captureOnCommitCallbacks(execute=True):
+            tmdb.bulk_upsert_movies(results)
+        version = cache.get(suggest.CATALOG_VERSION_KEY)
+        self.assertIsNotNone(version)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tmdb.bulk_upsert_movies([dict(item, popularity=1) for item in results])
+        self.assertEqual(cache.get(suggest.CATALOG_VERSION_KEY), version)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            tmdb.bulk_upsert_movies([dict(results[0], title="새 제목")])
+        self.assertNotEqual(cache.get(suggest.CATALOG_VERSION_KEY), version)
+
+    @override_settings(SUGGEST_REFRESH_SECONDS=0)
+    def test_index_rebuilds_when_version_changes(self):
+        Movie.objects.create(tmdb_id=1, title="기생충")
+        index = suggest.get_suggest_index()
+        self.assertEqual(suggest.get_suggest_index(), index)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            suggest.bump_catalog_version()
+        with mock.patch.object(suggest, "_start_rebuild") as rebuild:
+            self.assertIs(suggest.get_suggest_index(), index)  # 재구성되는 동안은 기존 색인
+        rebuild.assert_called_once_with(cache.get(suggest.CATALOG_VERSION_KEY))
+
+
+class PersonDetailTests(APITestCase):
+    """
+    person_detail - 영화 중복 없는 필모그래피를 한 번 계산해서 캐시 / 크레딧 동기화 때 무효화
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.person = Person.objects.create(tmdb_id=7, name="감독 겸 배우")
+        self.movies = [Movie.objects.create(tmdb_id=i + 1, title=f"영화 {i}") for i in range(3)]
+        for order, movie in enumerate(self.movies):
+            MovieCredit.objects.create(movie=movie, person=self.person, role_type="CAST", order=order)
+        MovieCredit.objects.create(movie=self.movies[0], person=self.person, role_type="DIRECTOR", job="Director")
+
+    def _detail(self):
+        res = self.client.get("/api/movies/people/7/")
+        self.assertEqual(res.status_code, 200)
+        return res.json()
+
+    def test_filmography_is_deduplicated(self):
+        data = self._detail()
+        self.assertEqual([m["tmdb_id"] for m in data["filmography"]], [1, 2, 3])
+        listed = [m["movie_tmdb_id"] for m in data["directors"] + data["cast"]]
+        self.assertEqual(sorted(listed), [1, 2, 3])
+
+    def test_cached_until_credits_change(self):
+        self._detail()
+        with self.assertNumQueries(1):  # 인물 조회만
+            self._detail()
+
+        credits = {"cast": [], "crew": [{"id": 7, "name": "감독 겸 배우", "job": "Director"}]}
+        with self.captureOnCommitCallbacks(execute=True):
+            tmdb.apply_movie_credits(self.movies[1], credits)
+        data = self._detail()
+        roles = {m["movie_tmdb_id"]: m["role_type"] for m in data["directors"] + data["cast"]}
+        self.assertEqual(roles, {1: "CAST", 2: "DIRECTOR", 3: "CAST"})
+
+
+class MovieNeighborTests(APITestCase):
+    """
+    build_movie_neighbors 증분 경로 + movie_similar의 MovieNeighbor 조회
+    """
+
+    def setUp(self):
+        self.drama = Genre.objects.create(tmdb_id=18, name="드라마")
+        self.comedy = Genre.objects.create(tmdb_id=35, name="코미디")
+        self.a = self._movie(1, self.drama, popularity=10)
+        self.b = self._movie(2, self.drama, popularity=5)
+        self.c = self._movie(3, self.comedy, popularity=8)
+        self.d = self._movie(4, self.comedy, popularity=1)
+
+    def _movie(self, tmdb_id, genre, popularity):
+        movie = Movie.objects.create(tmdb_id=tmdb_id, title=f"영화 {tmdb_id}", popularity=popularity)
+        MovieGenre.objects.create(movie=movie, genre=genre)
+        return movie
+
+    def _neighbors(self, movie):
+        return list(MovieNeighbor.objects.filter(movie=movie).order_by("rank").values_list("neighbor__tmdb_id", flat=True))
+
+    def test_incremental_adds_new_movie_to_existing_lists(self):
+        self.assertEqual(build_movie_neighbors(top_k=1), {"targets": 4, "full": True})
+        self.assertEqual(self._neighbors(self.a), [2])
+
+        # 새 영화: a와 장르가 같고 b보다 인기 → a의 이웃 1위가 바뀌어야 함 (아직 아무도 새 영화를 가리키지 않음)
+        e = self._movie(5, self.drama, popularity=7)
+
+        result = build_movie_neighbors(top_k=1)
+        self.assertFalse(result["full"])
+        self.assertEqual(self._neighbors(self.a), [5])
+        self.assertEqual(self._neighbors(e), [1])
+        # 새 영화가 k번째 점수를 못 넘는 영화는 그대로 (e, a만 다시 계산)
+        self.assertEqual(result["targets"], 2)
+        self.assertEqual([self._neighbors(m) for m in (self.b, self.c, self.d)], [[1], [4], [3]])
+
+    def test_similar_reads_neighbor_rows(self):
+        build_movie_neighbors(top_k=3)
+        res = self.client.get("/api/movies/1/similar/")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual([m["tmdb_id"] for m in res.data], self._neighbors(self.a))
+        self.assertEqual(res.data[0]["tmdb_id"], 2)
+
+    def test_similar_falls_back_to_genre_overlap(self):
+        res = self.client.get("/api/movies/1/similar/")
+        self.assertEqual([m["tmdb_id"] for m in res.data], [2])
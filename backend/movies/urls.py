@@ -6,6 +6,7 @@ urlpatterns = [
     path("list/", views.movie_list),
     path("genres/", views.genre_list),
     path("search/", views.search),
+    path("suggest/", views.suggest),
 
     # ✅ movie detail & similar & like
     path("<int:tmdb_id>/", views.movie_detail),
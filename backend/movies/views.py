@@ -1,23 +1,38 @@
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, authentication_classes, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.pagination import PageNumberPagination
+from django.db import transaction
 from django.db.models import Prefetch
+from django.http import HttpResponse
+from django.utils.http import parse_etags
 from .models import Movie, MovieCredit
 from django.db.models import Q, Count
 
 from rest_framework.permissions import IsAuthenticated # 마이페이지 
 
-from .models import Movie, Genre, Person, HomeSectionEntry, MovieCredit, PersonLike, GenreLike, MovieLike, LikedPerson # 마이페이지  # 영화상세 
+from .models import Movie, Genre, MovieGenre, Person, HomeSectionEntry, MovieCredit, PersonLike, GenreLike, MovieLike, LikedPerson # 마이페이지  # 영화상세 
 from .serializers import (
-    MovieListSerializer,
     MovieDetailSerializer,
     GenreSerializer,
     PersonSerializer,
     PersonDetailSerializer,
+    card_rows,
+    parse_card_fields,
+    serialize_movie_cards,
 )
-from .services.tmdb import fetch_movie_detail_and_update, sync_movie_credits
+from .services.detail_cache import get_cached_detail, set_cached_detail
+from .services.filmography import get_person_credits
+from .services.refresh import is_stale, request_movie_refresh, schedule_movie_refresh
+from .pagination import MovieCursorPagination, movie_sort_ordering
+from .services.home_payload import get_home_payload
+from .services.search import search_ids
+from .services.suggest import suggest as suggest_titles
+from .services.stats import apply_movie_stats
+
+
+SEARCH_PAGE_SIZE = 30
 
 
 class MoviePagination(PageNumberPagination):
@@ -29,29 +44,17 @@ class MoviePagination(PageNumberPagination):
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def home(request):
-    popular = (
-        Movie.objects.filter(home_entries__section="POPULAR")
-        .order_by("home_entries__rank")
-        .prefetch_related("genres")[:20]
-    )
-    now_playing = (
-        Movie.objects.filter(home_entries__section="NOW_PLAYING")
-        .order_by("home_entries__rank")
-        .prefetch_related("genres")[:20]
-    )
-    top_rated = (
-        Movie.objects.filter(home_entries__section="TOP_RATED")
-        .order_by("home_entries__rank")
-        .prefetch_related("genres")[:20]
-    )
+    # ✅ 미리 렌더링된 JSON 바이트 그대로 응답 (동기화/리뷰 변경 때만 다시 만듦)
+    body, etag = get_home_payload(parse_card_fields(request))
 
-    return Response(
-        {
-            "popular": MovieListSerializer(popular, many=True).data,
-            "now_playing": MovieListSerializer(now_playing, many=True).data,
-            "top_rated": MovieListSerializer(top_rated, many=True).data,
-        }
-    )
+    if_none_match = request.headers.get("If-None-Match")
+    # 압축 등으로 약한 ETag(W/"...")로 바뀌어 돌아와도 같은 것으로 취급
+    if if_none_match and etag in {e.removeprefix("W/") for e in parse_etags(if_none_match)}:
+        response = HttpResponse(status=304)
+    else:
+        response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = etag
+    return response
 
 
 @api_view(["GET"])
@@ -60,30 +63,45 @@ def movie_list(request):
     """
     /api/movies/list/?sort=popular|latest|rating&genre=28&page=1
     - genre: Genre.tmdb_id
+    - mode=cursor(또는 cursor=...): 무한 스크롤용 커서 페이지네이션 (COUNT/OFFSET 없음)
+    - fields=tmdb_id,title,poster_path: 카드 필드 일부만 (다른 카드 목록 API도 동일)
     """
-    qs = Movie.objects.all().prefetch_related("genres")
+    fields = parse_card_fields(request)
+    qs = Movie.objects.all()
 
     genre_tmdb_id = request.query_params.get("genre")
     if genre_tmdb_id:
-        qs = qs.filter(genres__tmdb_id=int(genre_tmdb_id))
+        # ✅ MovieGenre(genre, movie) 인덱스로 영화 id만 뽑아서 필터
+        qs = qs.filter(
+            id__in=MovieGenre.objects.filter(genre__tmdb_id=int(genre_tmdb_id)).values("movie_id")
+        )
 
     sort = request.query_params.get("sort", "popular")
-    if sort == "latest":
-        qs = qs.order_by("-release_date", "-popularity")
-    elif sort == "rating":
-        qs = qs.order_by("-vote_average", "-vote_count")
-    else:
-        qs = qs.order_by("-popularity", "-vote_count")
+
+    if request.query_params.get("mode") == "cursor" or "cursor" in request.query_params:
+        paginator = MovieCursorPagination()
+        page = paginator.paginate_queryset(qs, request, sort)
+        return paginator.get_paginated_response(serialize_movie_cards(page, fields))
 
     paginator = MoviePagination()
-    page = paginator.paginate_queryset(qs, request)
-    data = MovieListSerializer(page, many=True).data
-    return paginator.get_paginated_response(data)
+    # ✅ 모델 객체 대신 필요한 컬럼만 dict로 읽어서 바로 카드 생성
+    page = paginator.paginate_queryset(card_rows(qs.order_by(*movie_sort_ordering(sort)), fields), request)
+    return paginator.get_paginated_response(serialize_movie_cards(page, fields))
 
 
 @api_view(["GET"])
+@authentication_classes([])  # 유저별 내용이 없어서 토큰 확인(유저 조회 쿼리)도 생략
 @permission_classes([AllowAny])
 def movie_detail(request, tmdb_id: int):
+    # ✅ 캐시에 있으면 SQL 없이 응답 (동기화/반응 변경 때 무효화됨)
+    cached = get_cached_detail(tmdb_id)
+    if cached is not None:
+        data = cached["data"]
+        has_credits = bool(data["directors"] or data["cast"])
+        if is_stale(data["runtime"], cached["updated_at"], has_credits, cached.get("refreshed_at")):
+            schedule_movie_refresh(tmdb_id)
+        return Response(data)
+
     movie = (
         Movie.objects.filter(tmdb_id=tmdb_id)
         .prefetch_related("genres")
@@ -101,20 +119,13 @@ def movie_detail(request, tmdb_id: int):
             status=status.HTTP_404_NOT_FOUND,
         )
 
-    # ✅ runtime/genres 등 상세 보정
-    try:
-        fetch_movie_detail_and_update(movie)
-    except Exception:
-        pass
-
-    # ✅ 크레딧(감독/배우) DB가 비어있으면 요청 시 자동 동기화
-    if not MovieCredit.objects.filter(movie=movie).exists():
-        try:
-            sync_movie_credits(movie, cast_limit=10)
-        except Exception:
-            pass
+    data = MovieDetailSerializer(movie).data
+    set_cached_detail(tmdb_id, data, movie.updated_at, movie.detail_refreshed_at)
 
-    return Response(MovieDetailSerializer(movie).data)
+    # ✅ DB 값으로 바로 응답, 오래됐거나 크레딧이 없으면 백그라운드 갱신만 예약
+    # (캐시 저장 뒤에 예약해야 갱신 작업의 캐시 무효화가 이 저장을 덮음)
+    request_movie_refresh(movie, has_credits=bool(movie.moviecredit_set.all()))
+    return Response(data)
 
 
 @api_view(["GET"])
@@ -128,13 +139,10 @@ def movie_credits(request, tmdb_id: int):
     if not movie:
         return Response({"detail": "영화를 찾을 수 없습니다."}, status=404)
 
-    if not MovieCredit.objects.filter(movie=movie).exists():
-        try:
-            sync_movie_credits(movie, cast_limit=10)
-        except Exception:
-            pass
-
     qs = MovieCredit.objects.filter(movie=movie).select_related("person").order_by("order")
+    if not qs.exists():
+        request_movie_refresh(movie, has_credits=False)
+
     directors = qs.filter(role_type="DIRECTOR")
     cast = qs.filter(role_type="CAST").order_by("order")
 
@@ -179,39 +187,28 @@ from .serializers import PersonDetailSerializer
 def person_detail(request, tmdb_id: int):
     person = get_object_or_404(Person, tmdb_id=tmdb_id)
 
-    credits = (
-        MovieCredit.objects.filter(person=person)
-        .select_related("movie")
-        .order_by("role_type", "order")
-    )
+    # ✅ 필모그래피는 한 번만 계산(인물별 캐시)해서 감독/출연/filmography가 같이 사용
+    credits = get_person_credits(person.id)
 
-    # ✅ 중복 영화 제거(같은 사람이 같은 영화에 여러 credit 있을 수 있음)
-    seen = set()
     directors, cast = [], []
-
     for c in credits:
-        m = c.movie
-        if m.tmdb_id in seen:
-            continue
-        seen.add(m.tmdb_id)
-
         item = {
-            "movie_tmdb_id": m.tmdb_id,
-            "movie_title": m.title,
-            "poster_path": m.poster_path or "",
-            "release_date": m.release_date,
-            "vote_average": float(m.vote_average or 0),
-            "role_type": c.role_type,
-            "character_name": c.character_name or "",
-            "job": c.job or "",
+            "movie_tmdb_id": c["tmdb_id"],
+            "movie_title": c["title"],
+            "poster_path": c["poster_path"],
+            "release_date": c["release_date"],
+            "vote_average": c["vote_average"],
+            "role_type": c["role_type"],
+            "character_name": c["character_name"],
+            "job": c["job"],
         }
 
-        if c.role_type == "DIRECTOR":
+        if c["role_type"] == "DIRECTOR":
             directors.append(item)
         else:
             cast.append(item)
 
-    data = PersonDetailSerializer(person).data
+    data = PersonDetailSerializer(person, context={"credits": credits}).data
     data["directors"] = directors
     data["cast"] = cast
     return Response(data)
@@ -222,7 +219,8 @@ def person_detail(request, tmdb_id: int):
 @permission_classes([AllowAny])
 def search(request):
     """
-    /api/movies/search/?q=...&type=movie|person
+    /api/movies/search/?q=...&type=movie|person&page=1
+    - 검색 색인(movies.services.search) 관련도 + 인기도 순
     """
     q = (request.query_params.get("q") or "").strip()
     search_type = request.query_params.get("type", "movie")
@@ -230,20 +228,46 @@ def search(request):
     if not q:
         return Response({"detail": "q가 비었습니다."}, status=status.HTTP_400_BAD_REQUEST)
 
+    try:
+        page = max(int(request.query_params.get("page", 1)), 1)
+    except ValueError:
+        page = 1
+
     if search_type == "person":
-        people = Person.objects.filter(name__icontains=q).order_by("name")[:30]
-        return Response({"type": "person", "results": PersonSerializer(people, many=True).data})
+        ids, has_next = search_ids("person", q, page=page, page_size=SEARCH_PAGE_SIZE)
+        by_id = Person.objects.in_bulk(ids)
+        people = [by_id[pk] for pk in ids if pk in by_id]
+        return Response(
+            {"type": "person", "page": page, "has_next": has_next, "results": PersonSerializer(people, many=True).data}
+        )
 
-    movies = (
-        Movie.objects.filter(Q(title__icontains=q) | Q(original_title__icontains=q))
-        .prefetch_related("genres")
-        .order_by("-popularity")[:30]
+    fields = parse_card_fields(request)
+    ids, has_next = search_ids("movie", q, page=page, page_size=SEARCH_PAGE_SIZE)
+    by_id = {row["id"]: row for row in card_rows(Movie.objects.filter(id__in=ids), fields)}
+    rows = [by_id[pk] for pk in ids if pk in by_id]
+    return Response(
+        {"type": "movie", "page": page, "has_next": has_next, "results": serialize_movie_cards(rows, fields)}
     )
-    return Response({"type": "movie", "results": MovieListSerializer(movies, many=True).data})
 
 
 
 
+@api_view(["GET"])
+@authentication_classes([])
+@permission_classes([AllowAny])
+def suggest(request):
+    """
+    /api/movies/suggest/?q=...&limit=5
+    - 검색창 자동완성: 프로세스 메모리 색인에서 바로 응답 (DB 조회 없음)
+    """
+    q = (request.query_params.get("q") or "").strip()
+    try:
+        limit = min(max(int(request.query_params.get("limit", 5)), 1), 10)
+    except ValueError:
+        limit = 5
+    return Response({"q": q, **suggest_titles(q, limit=limit)})
+
+
 # 마이페이지 좋아요 목록 API
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
@@ -270,7 +294,7 @@ def my_likes_list(request):
     elif like_type == "movie": # [추가됨] 영화 좋아요 목록
         likes = MovieLike.objects.filter(user=request.user).select_related("movie")
         movies = [l.movie for l in likes]
-        return Response(MovieListSerializer(movies, many=True).data)
+        return Response(serialize_movie_cards(movies, parse_card_fields(request)))
     
         
     return Response([])
@@ -296,10 +320,21 @@ def my_movie_likes(request):
 def movie_similar(request, tmdb_id: int):
     """
     [비슷한 작품 추천 로직]
-    1. 해당 영화의 장르들을 가져옵니다.
+    0. MovieNeighbor(장르 + 감독/출연진 + 좋아요 유사도 top-K)가 있으면 그대로 사용
+    1. 없으면 해당 영화의 장르들을 가져옵니다.
     2. 그 장르를 포함하는 다른 영화들을 찾습니다.
     3. 겹치는 장르가 많은 순서 + 인기도 순으로 정렬하여 20개를 뽑습니다.
     """
+    fields = parse_card_fields(request)
+
+    # ✅ 배치(build_movie_neighbors)로 미리 계산된 이웃이 있으면 인덱스 조회 1번
+    similar_movies = list(
+        card_rows(Movie.objects.filter(neighbor_of__movie__tmdb_id=tmdb_id).order_by("neighbor_of__rank"), fields)[:20]
+    )
+    if similar_movies:
+        return Response(serialize_movie_cards(similar_movies, fields))
+
+    # 아직 계산 전인 영화는 예전 방식(장르 겹침 수 + 인기도)
     movie = get_object_or_404(Movie, tmdb_id=tmdb_id)
     movie_genres = movie.genres.all()
 
@@ -316,7 +351,7 @@ def movie_similar(request, tmdb_id: int):
             .distinct()[:20]
         )
 
-    return Response(MovieListSerializer(similar_movies, many=True).data)
+    return Response(serialize_movie_cards(similar_movies, fields))
 
 
 @api_view(["POST"])
@@ -328,16 +363,16 @@ def movie_like_toggle(request, tmdb_id: int):
     movie = get_object_or_404(Movie, tmdb_id=tmdb_id)
     user = request.user
 
-    # 이미 좋아요 했으면 취소
-    like_obj = MovieLike.objects.filter(user=user, movie=movie).first()
-    
-    if like_obj:
-        like_obj.delete()
-        liked = False
-    else:
-        MovieLike.objects.create(user=user, movie=movie)
-        liked = True
-    
+    with transaction.atomic():
+        # 이미 좋아요 했으면 취소 (실제로 지워졌을 때만 카운터 감소)
+        deleted, _ = MovieLike.objects.filter(user=user, movie=movie).delete()
+        if deleted:
+            liked = False
+        else:
+            MovieLike.objects.create(user=user, movie=movie)
+            liked = True
+        apply_movie_stats(movie.id, like_count=1 if liked else -1)
+
     return Response({"liked": liked, "tmdb_id": tmdb_id})
 
 
@@ -5,7 +5,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from django.db.models import Q, Count, Avg, Prefetch
 from movies.models import Movie, Genre, Person
-from movies.serializers import MovieListSerializer, PersonSerializer
+from movies.serializers import PersonSerializer, parse_card_fields, serialize_movie_cards
 
 from reviews.models import Review
 try:
@@ -199,7 +199,7 @@ def ai_taste(request):
 
     qs_final = qs_final[:12]
 
-    serialized = MovieListSerializer(qs_final, many=True).data
+    serialized = serialize_movie_cards(qs_final)
 
     # (선택) AI가 준 recommended_reasons가 있으면 title 기준으로 매핑해서 tmdb_id 키로 내려주기
     reasons_by_title = data.get("recommended_reasons") or {}
@@ -231,8 +231,8 @@ def genre_recommend(request):
     if not genre_tmdb_id:
         genres = Genre.objects.all().order_by("name")
         return Response({"genres": [{"tmdb_id": g.tmdb_id, "name": g.name} for g in genres]})
-    qs = Movie.objects.filter(genres__tmdb_id=int(genre_tmdb_id)).prefetch_related("genres").order_by("-popularity")[:24]
-    return Response({"results": MovieListSerializer(qs, many=True).data})
+    qs = Movie.objects.filter(genres__tmdb_id=int(genre_tmdb_id)).order_by("-popularity")[:24]
+    return Response({"results": serialize_movie_cards(qs, parse_card_fields(request))})
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
@@ -310,4 +310,4 @@ def taste_summary(request):
     if top_genre_names: rec_qs = rec_qs.filter(genres__name__in=top_genre_names).distinct()
     if tmdb_ids: rec_qs = rec_qs.exclude(tmdb_id__in=tmdb_ids)
     rec_qs = rec_qs.order_by("-popularity")[:12]
-    return Response({"watched_count": watched_count, "top_genre": top_genre, "avg_rating": avg_rating, "recent_movie_title": recent_movie_title, "genre_scores": genre_scores, "watched_movies": watched_data, "recommended_movies": MovieListSerializer(rec_qs, many=True).data})
\ No newline at end of file
+    return Response({"watched_count": watched_count, "top_genre": top_genre, "avg_rating": avg_rating, "recent_movie_title": recent_movie_title, "genre_scores": genre_scores, "watched_movies": watched_data, "recommended_movies": serialize_movie_cards(rec_qs)})
\ No newline at end of file
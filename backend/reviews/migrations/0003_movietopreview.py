@@ -0,0 +1,48 @@
+# Generated by Django 5.2.9 on 2026-10-18 19:36
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_top_reviews(apps, schema_editor):
+    Review = apps.get_model("reviews", "Review")
+    MovieTopReview = apps.get_model("reviews", "MovieTopReview")
+
+    best = {}
+    rows = (
+        Review.objects.annotate(likes_count=Count("likes"))
+        .order_by("movie_id", "-likes_count", "-created_at")
+        .values_list("movie_id", "id", "likes_count")
+    )
+    for movie_id, review_id, likes_count in rows.iterator():
+        best.setdefault(movie_id, (review_id, likes_count))
+
+    MovieTopReview.objects.bulk_create(
+        [
+            MovieTopReview(movie_id=movie_id, review_id=review_id, like_count=likes_count)
+            for movie_id, (review_id, likes_count) in best.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0007_syncrun'),
+        ('reviews', '0002_reviewcomment'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MovieTopReview',
+            fields=[
+                ('movie', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='top_review', serialize=False, to='movies.movie')),
+                ('like_count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('review', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='reviews.review')),
+            ],
+        ),
+        migrations.RunPython(backfill_top_reviews, migrations.RunPython.noop),
+    ]
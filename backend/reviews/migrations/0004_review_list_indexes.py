@@ -0,0 +1,24 @@
+# Generated by Django 5.2.9 on 2026-10-18 19:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0012_credit_person_index'),
+        ('reviews', '0003_movietopreview'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['movie', 'watched', 'created_at'], name='review_movie_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='reviewcomment',
+            index=models.Index(fields=['review', 'created_at'], name='comment_review_recent_idx'),
+        ),
+    ]
@@ -0,0 +1,69 @@
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_like_count(apps, schema_editor):
+    Review = apps.get_model("reviews", "Review")
+    ReviewLike = apps.get_model("reviews", "ReviewLike")
+    counts = (
+        ReviewLike.objects.filter(review_id=OuterRef("pk"))
+        .order_by()
+        .values("review_id")
+        .annotate(n=Count("id"))
+        .values("n")
+    )
+    Review.objects.update(like_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0004_review_list_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        # 자동 M2M 테이블(reviews_review_likes)을 그대로 ReviewLike 모델로 (DB 변경 없음)
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='ReviewLike',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('review', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='reviews.review')),
+                        ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+                    ],
+                    options={
+                        'db_table': 'reviews_review_likes',
+                        'unique_together': {('review', 'user')},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='review',
+                    name='likes',
+                    field=models.ManyToManyField(blank=True, related_name='liked_reviews', through='reviews.ReviewLike', to=settings.AUTH_USER_MODEL),
+                ),
+            ],
+            database_operations=[],
+        ),
+        migrations.AddField(
+            model_name='reviewlike',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='review',
+            name='like_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_like_count, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['movie', 'watched', 'like_count', 'created_at'], name='review_movie_likes_idx'),
+        ),
+    ]
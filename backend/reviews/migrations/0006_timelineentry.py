@@ -0,0 +1,78 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_timelines(apps, schema_editor):
+    # 기존 팔로우 관계마다 작성자의 최근 리뷰로 타임라인 채우기
+    Follow = apps.get_model("accounts", "Follow")
+    Review = apps.get_model("reviews", "Review")
+    TimelineEntry = apps.get_model("reviews", "TimelineEntry")
+    limit = getattr(settings, "FEED_BACKFILL_LIMIT", 100)
+    max_followers = getattr(settings, "FEED_FANOUT_MAX_FOLLOWERS", 1000)
+
+    pairs = Follow.objects.filter(to_user__followers_count__lte=max_followers).values_list("from_user_id", "to_user_id")
+    for user_id, author_id in pairs.iterator():
+        recent = (
+            Review.objects.filter(user_id=author_id, watched=True)
+            .order_by("-created_at", "-id")
+            .values_list("id", "created_at")[:limit]
+        )
+        TimelineEntry.objects.bulk_create(
+            [TimelineEntry(user_id=user_id, review_id=pk, author_id=author_id, created_at=at) for pk, at in recent],
+            ignore_conflicts=True,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_followers_count'),
+        ('movies', '0012_credit_person_index'),
+        ('reviews', '0005_reviewlike'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TimelineEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField()),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['user', 'watched', 'created_at'], name='review_user_recent_idx'),
+        ),
+        migrations.AddField(
+            model_name='timelineentry',
+            name='author',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='timelineentry',
+            name='review',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='reviews.review'),
+        ),
+        migrations.AddField(
+            model_name='timelineentry',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='timelineentry',
+            index=models.Index(fields=['user', 'created_at', 'review'], name='timeline_user_recent_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='timelineentry',
+            index=models.Index(fields=['user', 'author'], name='timeline_user_author_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='timelineentry',
+            constraint=models.UniqueConstraint(fields=('user', 'review'), name='uniq_timeline_user_review'),
+        ),
+        migrations.RunPython(backfill_timelines, migrations.RunPython.noop),
+    ]
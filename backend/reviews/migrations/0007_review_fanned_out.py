@@ -0,0 +1,33 @@
+# Generated by Django 5.2.9 on 2026-10-18 20:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def mark_fanned_out(apps, schema_editor):
+    # 0006에서 타임라인을 채운 작성자(팔로워 수가 기준 이하)의 감상 리뷰는 분배된 것으로 표시
+    Review = apps.get_model("reviews", "Review")
+    max_followers = getattr(settings, "FEED_FANOUT_MAX_FOLLOWERS", 1000)
+    Review.objects.filter(watched=True, user__followers_count__lte=max_followers).update(fanned_out=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('movies', '0015_searchentry_trailing_unigram'),
+        ('reviews', '0006_timelineentry'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='review',
+            name='fanned_out',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.RunPython(mark_fanned_out, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(condition=models.Q(('fanned_out', False), ('watched', True)), fields=['user', 'created_at'], name='review_unfanned_recent_idx'),
+        ),
+    ]
@@ -20,8 +20,12 @@ class Review(models.Model):
     rating = models.PositiveSmallIntegerField()  # 1~5
 
     likes = models.ManyToManyField(
-        settings.AUTH_USER_MODEL, related_name="liked_reviews", blank=True
+        settings.AUTH_USER_MODEL, through="ReviewLike", related_name="liked_reviews", blank=True
     )
+    # ✅ ReviewLike 수 (reviews.services.likes.toggle_review_like에서 F()로 증감, recount_review_likes로 보정)
+    like_count = models.PositiveIntegerField(default=0)
+    # ✅ 팔로워 타임라인(TimelineEntry)에 분배됐는지 → False인 감상 리뷰는 팔로잉 피드를 읽을 때 합침
+    fanned_out = models.BooleanField(default=False)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -30,14 +34,39 @@ class Review(models.Model):
         constraints = [
             models.UniqueConstraint(fields=["user", "movie"], name="uniq_user_movie_review")
         ]
+        # ✅ 영화별 리뷰 목록(최신순 / 좋아요순 커서 페이지네이션)
+        indexes = [
+            models.Index(fields=["movie", "watched", "created_at"], name="review_movie_recent_idx"),
+            models.Index(fields=["movie", "watched", "like_count", "created_at"], name="review_movie_likes_idx"),
+            # ✅ 작성자별 최신 리뷰 (팔로우 시 타임라인 채우기 / 피드에서 팔로워 많은 작성자 리뷰 합치기)
+            models.Index(fields=["user", "watched", "created_at"], name="review_user_recent_idx"),
+            # ✅ 분배 안 된 감상 리뷰만 (팔로워 많은 작성자 / 분배 대기 중) → 피드 읽을 때 합치는 쪽
+            models.Index(
+                fields=["user", "created_at"],
+                condition=models.Q(watched=True, fanned_out=False),
+                name="review_unfanned_recent_idx",
+            ),
+        ]
         ordering = ["-created_at"]
 
     def __str__(self):
         return f"{self.movie.tmdb_id} / {self.user} ({self.rating})"
 
-    @property
-    def like_count(self):
-        return self.likes.count()
+
+class ReviewLike(models.Model):
+    """
+    리뷰 좋아요 (Review.likes의 through 테이블, 예전 자동 M2M 테이블을 그대로 사용)
+    """
+    review = models.ForeignKey(Review, on_delete=models.CASCADE)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "reviews_review_likes"
+        unique_together = [("review", "user")]
+
+    def __str__(self):
+        return f"{self.user_id} likes review {self.review_id}"
 # backend/reviews/models.py
 
 # ... (기존 Review 모델 코드 아래에 추가)
@@ -54,5 +83,55 @@ class ReviewComment(models.Model):
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # ✅ 리뷰별 댓글 목록(시간순 커서 페이지네이션)
+        indexes = [
+            models.Index(fields=["review", "created_at"], name="comment_review_recent_idx"),
+        ]
+
+    def __str__(self):
+        return f"Reply by {self.user} on Review {self.review.id}"
+
+
+class MovieTopReview(models.Model):
+    """
+    영화별 대표 리뷰(좋아요 많은 순 → 최신순 1개)를 미리 계산해둔 테이블
+    - 카드 목록(MovieListSerializer.top_review)이 영화마다 집계 쿼리를 돌지 않게
+    - 리뷰 작성/수정/삭제, 좋아요 토글 때 reviews.services.top_reviews로 갱신
+    """
+    movie = models.OneToOneField(
+        "movies.Movie", on_delete=models.CASCADE, primary_key=True, related_name="top_review"
+    )
+    review = models.ForeignKey(Review, on_delete=models.CASCADE, related_name="+")
+    like_count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.movie_id} -> review {self.review_id} ({self.like_count})"
+
+
+class TimelineEntry(models.Model):
+    """
+    팔로잉 피드(/api/reviews/feed/)용 유저별 타임라인 (fan-out on write)
+    - 리뷰 작성 시 작성자의 팔로워마다 1행 (reviews.services.timeline)
+    - 팔로우하면 작성자의 최근 리뷰로 채우고, 언팔로우하면 그 작성자 행만 지움
+    - created_at은 리뷰 작성 시각 복사본 → (user, created_at, review) 인덱스 범위 스캔 한 번으로 피드 한 페이지
+    - 리뷰가 지워지면 CASCADE로 같이 삭제
+    """
+    # (user, ...) 복합 인덱스들이 user_id 단일 인덱스 역할을 대신함
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+", db_index=False)
+    review = models.ForeignKey(Review, on_delete=models.CASCADE, related_name="+")
+    author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+")
+    created_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "review"], name="uniq_timeline_user_review")
+        ]
+        indexes = [
+            models.Index(fields=["user", "created_at", "review"], name="timeline_user_recent_idx"),
+            models.Index(fields=["user", "author"], name="timeline_user_author_idx"),
+        ]
+
     def __str__(self):
-        return f"Reply by {self.user} on Review {self.review.id}"
\ No newline at end of file
+        return f"{self.user_id} <- review {self.review_id}"
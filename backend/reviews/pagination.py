@@ -0,0 +1,67 @@
+# backend/reviews/pagination.py
+"""
+리뷰 / 댓글 목록 / 팔로잉 피드 커서 페이지네이션 (movies.pagination.KeysetCursorPagination 재사용)
+"""
+from rest_framework.exceptions import NotFound
+
+from movies.pagination import KeysetCursorPagination
+
+
+class ReviewCursorPagination(KeysetCursorPagination):
+    """
+    /api/reviews/movie/<tmdb_id>/?sort=likes|recent&cursor=...
+    - likes: 좋아요 많은 순(like_count 컬럼) → 최신순, Review(movie, watched, like_count, created_at) 인덱스
+    - recent: 최신순, Review(movie, watched, created_at) 인덱스를 그대로 탐
+    """
+    sort_keys = {
+        "likes": ("-like_count", "-created_at", "-id"),
+        "recent": ("-created_at", "-id"),
+    }
+    default_sort = "likes"
+    datetime_keys = frozenset({"created_at"})
+
+
+class CommentCursorPagination(KeysetCursorPagination):
+    """
+    /api/reviews/<review_id>/comments/?sort=oldest|recent&cursor=...
+    - ReviewComment(review, created_at) 인덱스
+    """
+    sort_keys = {
+        "oldest": ("created_at", "id"),
+        "recent": ("-created_at", "-id"),
+    }
+    default_sort = "oldest"
+    page_size = 30
+    max_page_size = 100
+    datetime_keys = frozenset({"created_at"})
+
+
+class FeedCursorPagination(KeysetCursorPagination):
+    """
+    /api/reviews/feed/?cursor=... - 팔로잉 피드 (최신순, 처음부터 커서 모드)
+    - 타임라인 + 팔로워 많은 작성자 리뷰를 합친 결과라 쿼리셋 하나로 못 자름
+      → 커서 값만 풀어서 fetch(after, 개수)에 넘김 (reviews.services.timeline.following_feed)
+    """
+    sort_keys = {"recent": ("-created_at", "-id")}
+    default_sort = "recent"
+    datetime_keys = frozenset({"created_at"})
+
+    def paginate_feed(self, fetch, request):
+        self.request = request
+        self.keys = self.sort_keys[self.default_sort]
+        self.page_size = self._get_page_size(request)
+
+        after = None
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            try:
+                after = self._decode_cursor(cursor)
+                after[1] = int(after[1])
+            except (ValueError, TypeError):
+                raise NotFound(self.invalid_cursor_message)
+
+        # 한 개 더 가져와서 다음 페이지 유무 판단
+        page = fetch(after, self.page_size + 1)
+        self.has_next = len(page) > self.page_size
+        self.page = page[: self.page_size]
+        return self.page
@@ -1,8 +1,10 @@
 # backend/reviews/serializers.py
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
-from .models import Review
-from movies.serializers import MovieListSerializer
+from .models import Review, ReviewComment, ReviewLike
+from django.db.models import Count, Exists, Manager, OuterRef, Subquery, Value, prefetch_related_objects
+from django.db.models.functions import Coalesce
+from movies.serializers import MovieListSerializer, movie_card_prefetches
 
 User = get_user_model()
 
@@ -12,6 +14,50 @@ class ReviewUserSerializer(serializers.ModelSerializer):
         model = User
         fields = ["id", "username", "profile_image"]
 
+def _count_subquery(queryset):
+    return Coalesce(Subquery(queryset.order_by().values("review_id").annotate(n=Count("id")).values("n")), 0)
+
+
+def annotate_review_counts(queryset):
+    """
+    comments_count를 리뷰별 서브쿼리로 계산 (좋아요 수는 Review.like_count 컬럼)
+    - JOIN + GROUP BY 없이 → 정렬/커서 조건이 Review 인덱스를 그대로 탐
+    """
+    return queryset.annotate(
+        comments_count=_count_subquery(ReviewComment.objects.filter(review_id=OuterRef("pk"))),
+    )
+
+
+def annotate_is_liked(queryset, user):
+    """
+    리뷰 쿼리에 현재 유저의 좋아요 여부(is_liked)를 Exists로 같이 계산
+    - 시리얼라이저가 리뷰마다 exists() 쿼리를 날리지 않게
+    - 비로그인이면 False 고정
+    """
+    if user is None or not user.is_authenticated:
+        return queryset.annotate(is_liked=Value(False))
+    likes = ReviewLike.objects.filter(review_id=OuterRef("pk"), user_id=user.id)
+    return queryset.annotate(is_liked=Exists(likes))
+
+
+def _is_liked(serializer, obj):
+    # annotate_is_liked 값이 있으면 그대로, 없을 때만 DB 조회
+    annotated = getattr(obj, "is_liked", None)
+    if annotated is not None:
+        return bool(annotated)
+    request = serializer.context.get("request")
+    if not request or not request.user.is_authenticated:
+        return False
+    return obj.likes.filter(id=request.user.id).exists()
+
+
+class ReviewListSerializer(serializers.ListSerializer):
+    # ✅ 리뷰마다 붙는 영화 카드(장르/대표 리뷰)를 한 번에 prefetch
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, Manager) else data)
+        prefetch_related_objects(items, *movie_card_prefetches("movie__"))
+        return super().to_representation(items)
+
 class ReviewCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Review
@@ -38,15 +84,16 @@ class ReviewSerializer(serializers.ModelSerializer):
     movie = MovieListSerializer(read_only=True)
     user_username = serializers.ReadOnlyField(source='user.username')
 
-    # ✅ DB annotate 수치와 프론트 사용 필드명(like_count) 통일
-    likes_count = serializers.IntegerField(read_only=True)
-    like_count = serializers.SerializerMethodField()
+    # ✅ Review.like_count 컬럼 그대로 (프론트는 likes_count, 예전 필드명 like_count도 유지)
+    likes_count = serializers.IntegerField(source="like_count", read_only=True)
+    like_count = serializers.IntegerField(read_only=True)
     is_liked = serializers.SerializerMethodField()
     
     comments_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Review
+        list_serializer_class = ReviewListSerializer
         fields = [
             "id",
             "movie",
@@ -64,31 +111,23 @@ class ReviewSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "movie", "user", "likes_count", "created_at", "updated_at"]
 
-    def get_like_count(self, obj):
-        # annotate된 값이 있으면 쓰고, 없으면 DB 직접 조회
-        if hasattr(obj, "likes_count") and obj.likes_count is not None:
-            return obj.likes_count
-        return obj.likes.count()
-
     def get_is_liked(self, obj):
-        request = self.context.get("request")
-        if not request or not request.user.is_authenticated:
-            return False
-        return obj.likes.filter(id=request.user.id).exists()
+        return _is_liked(self, obj)
 
 class RecentReviewSerializer(serializers.ModelSerializer):
     user = ReviewUserSerializer(read_only=True)
     # 홈 화면 카드용 영화 정보
     movie = MovieListSerializer(read_only=True)
     
-    likes_count = serializers.IntegerField(read_only=True)
-    like_count = serializers.SerializerMethodField()
+    likes_count = serializers.IntegerField(source="like_count", read_only=True)
+    like_count = serializers.IntegerField(read_only=True)
     is_liked = serializers.SerializerMethodField()
     # ✅ [필수] 이 줄이 없으면 프론트에서 댓글 개수를 못 읽어서 카드가 안 뜰 수 있음!
     comments_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Review
+        list_serializer_class = ReviewListSerializer
         fields = [
             "id",
             "user",
@@ -102,14 +141,6 @@ class RecentReviewSerializer(serializers.ModelSerializer):
             "comments_count",
         ]
 
-    def get_like_count(self, obj):
-        if hasattr(obj, "likes_count") and obj.likes_count is not None:
-            return obj.likes_count
-        return obj.likes.count()
-
     def get_is_liked(self, obj):
-        request = self.context.get("request")
-        if not request or not request.user.is_authenticated:
-            return False
-        return obj.likes.filter(id=request.user.id).exists()
+        return _is_liked(self, obj)
     
\ No newline at end of file
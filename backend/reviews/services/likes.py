@@ -0,0 +1,71 @@
+# backend/reviews/services/likes.py
+"""
+리뷰 좋아요 (ReviewLike + Review.like_count)
+- 토글: 삭제 시도 → 지운 게 없으면 삽입, 같은 트랜잭션에서 like_count를 F()로 증감 (존재 확인 SELECT / COUNT 없음)
+- 보정: recount_review_likes (recount_movie_stats --review-likes)
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+
+from reviews.models import Review, ReviewLike
+
+
+def toggle_review_like(review_id: int, user_id: int) -> tuple[bool, int]:
+    """
+    좋아요 토글 → (liked, 새 like_count)
+    """
+    with transaction.atomic():
+        deleted, _ = ReviewLike.objects.filter(review_id=review_id, user_id=user_id).delete()
+        if deleted:
+            liked, delta = False, -1
+        else:
+            liked, delta = True, 1
+            try:
+                with transaction.atomic():
+                    ReviewLike.objects.create(review_id=review_id, user_id=user_id)
+            except IntegrityError:
+                # 동시에 두 번 눌러서 다른 요청이 먼저 넣음 → 좋아요 상태 그대로, 카운트는 그쪽에서 증가
+                delta = 0
+
+        qs = Review.objects.filter(pk=review_id)
+        if delta > 0:
+            qs.update(like_count=F("like_count") + 1)
+        elif delta < 0:
+            # 0 아래로 내려가지 않게 (드리프트가 있어도 요청이 실패하지 않도록)
+            qs.update(like_count=Greatest(F("like_count") - 1, 0))
+        like_count = qs.values_list("like_count", flat=True).first() or 0
+    return liked, like_count
+
+
+def recount_review_likes(batch_size=1000, on_batch=None) -> dict:
+    """
+    Review.like_count를 ReviewLike 기준으로 재계산, 달라진 행만 bulk_update
+    반환: {"checked": n, "fixed": n}
+    """
+    checked = fixed = 0
+    last_id = 0
+    while True:
+        batch = list(
+            Review.objects.filter(id__gt=last_id).order_by("id").values_list("id", "like_count")[:batch_size]
+        )
+        if not batch:
+            break
+        last_id = batch[-1][0]
+
+        actual = dict(
+            ReviewLike.objects.filter(review_id__in=[pk for pk, _ in batch])
+            .order_by()
+            .values("review_id")
+            .annotate(n=Count("id"))
+            .values_list("review_id", "n")
+        )
+        changed = [Review(id=pk, like_count=actual.get(pk, 0)) for pk, count in batch if count != actual.get(pk, 0)]
+        if changed:
+            Review.objects.bulk_update(changed, ["like_count"])
+
+        checked += len(batch)
+        fixed += len(changed)
+        if on_batch:
+            on_batch(checked, fixed)
+    return {"checked": checked, "fixed": fixed}
@@ -0,0 +1,158 @@
+# backend/reviews/services/recent_feed.py
+"""
+최근 리뷰 피드(/api/reviews/recent/) 링 버퍼
+- 최신 리뷰 카드 RECENT_REVIEWS_BUFFER_SIZE개를 공용 캐시에 보관 (워커끼리 공유)
+- 리뷰 작성/수정/삭제, 좋아요/댓글 변경 때 해당 카드만 갱신 (커밋 이후, cache.add 락으로 직렬화)
+- 요청은 프로세스 메모리 사본을 잘라서 응답 + 로그인 유저의 좋아요 여부만 따로 1번 조회
+- 카드의 프로필 이미지는 /media/... 경로로 보관하고 응답 때 요청 호스트 기준 절대 URL로 바꿈
+- 카드 안의 영화 정보(대표 리뷰 등)는 RECENT_REVIEWS_TTL마다 전체 재구성으로 맞춤
+"""
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from reviews.models import Review, ReviewLike
+
+RECENT_FEED_KEY = "reviews:recent:feed"
+RECENT_VERSION_KEY = "reviews:recent:version"
+RECENT_LOCK_KEY = "reviews:recent:lock"
+LOCK_TIMEOUT = 5
+LOCK_WAIT = 1.0
+
+_memo = {"version": None, "cards": None, "checked_at": 0.0}
+_memo_lock = threading.Lock()
+
+
+def _render(queryset) -> list:
+    # [(정렬 키, 카드)] - 카드의 is_liked는 False로 두고 요청 때 덮어씀
+    from reviews.serializers import RecentReviewSerializer, annotate_is_liked, annotate_review_counts
+
+    qs = annotate_is_liked(annotate_review_counts(queryset.select_related("user", "movie")), None)
+    reviews = list(qs)
+    cards = RecentReviewSerializer(reviews, many=True).data
+    return [((r.created_at.timestamp(), r.id), dict(card)) for r, card in zip(reviews, cards)]
+
+
+def build_recent_feed() -> dict:
+    size = settings.RECENT_REVIEWS_BUFFER_SIZE
+    entries = _render(Review.objects.filter(watched=True).order_by("-created_at", "-id")[:size])
+    return {"version": uuid.uuid4().hex, "entries": entries}
+
+
+def _save(feed):
+    feed["version"] = uuid.uuid4().hex
+    cache.set(RECENT_FEED_KEY, feed, settings.RECENT_REVIEWS_TTL)
+    # 버전도 같은 TTL → 만료되면 프로세스 사본도 새 피드로 교체
+    cache.set(RECENT_VERSION_KEY, feed["version"], settings.RECENT_REVIEWS_TTL)
+    # 이 프로세스는 다음 요청에서 바로 새 버전 확인 (_current_cards가 락을 잡은 채 부를 수 있어 락 없이)
+    _memo["checked_at"] = 0.0
+
+
+def _load() -> dict:
+    feed = cache.get(RECENT_FEED_KEY)
+    if feed is None:
+        feed = build_recent_feed()
+        _save(feed)
+    return feed
+
+
+def _drop():
+    # 피드와 버전을 같이 지움 → 모든 프로세스가 다음 확인 때 새로 만든 피드로 교체
+    cache.delete_many([RECENT_FEED_KEY, RECENT_VERSION_KEY])
+
+
+def _locked_update(func):
+    """
+    공용 캐시의 피드를 읽고-고치고-쓰기 (다른 워커와 겹치지 않게 cache.add 락)
+    - 락을 못 잡으면 피드를 지워서 다음 요청이 새로 만들게 함
+    """
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + LOCK_WAIT
+    while not cache.add(RECENT_LOCK_KEY, token, LOCK_TIMEOUT):
+        if time.monotonic() >= deadline:
+            _drop()
+            return
+        time.sleep(0.02)
+    try:
+        feed = cache.get(RECENT_FEED_KEY)
+        if feed is None:
+            return  # 아직 없으면 다음 요청에서 통째로 만듦
+        if func(feed) is False:
+            _drop()
+        else:
+            _save(feed)
+    finally:
+        if cache.get(RECENT_LOCK_KEY) == token:
+            cache.delete(RECENT_LOCK_KEY)
+
+
+def _refresh(review_id: int):
+    rendered = _render(Review.objects.filter(pk=review_id, watched=True))
+
+    def apply(feed):
+        entries = feed["entries"]
+        was_in = any(key[1] == review_id for key, _ in entries)
+        entries[:] = [(key, card) for key, card in entries if key[1] != review_id]
+        if not rendered:
+            # 버퍼에서 빠졌으면 뒤를 채워야 해서 다시 만듦
+            return False if was_in else None
+        entry = rendered[0]
+        size = settings.RECENT_REVIEWS_BUFFER_SIZE
+        if len(entries) >= size and entry[0] < entries[-1][0]:
+            return None  # 버퍼보다 오래된 리뷰
+        entries.append(entry)
+        entries.sort(key=lambda e: e[0], reverse=True)
+        del entries[size:]
+
+    _locked_update(apply)
+
+
+def recent_review_changed(review_id: int):
+    # 리뷰 작성/수정/삭제, 좋아요 토글, 댓글 작성/삭제 후 호출 (커밋 이후 반영)
+    transaction.on_commit(lambda: _refresh(review_id))
+
+
+def _current_cards() -> list:
+    now = time.monotonic()
+    if _memo["cards"] is not None and now - _memo["checked_at"] < settings.RECENT_REVIEWS_CHECK_SECONDS:
+        return _memo["cards"]
+
+    with _memo_lock:
+        version = cache.get(RECENT_VERSION_KEY)
+        if _memo["cards"] is None or version is None or version != _memo["version"]:
+            feed = _load()
+            _memo["version"] = feed["version"]
+            _memo["cards"] = [card for _, card in feed["entries"]]
+        _memo["checked_at"] = time.monotonic()
+        return _memo["cards"]
+
+
+def _absolute_media(card, request):
+    # 캐시된 카드는 요청 없이 렌더링해서 ImageField가 상대 경로 → 다른 출처의 프론트를 위해 절대 URL로
+    image = card["user"].get("profile_image")
+    if not image or "://" in image:
+        return card
+    return {**card, "user": {**card["user"], "profile_image": request.build_absolute_uri(image)}}
+
+
+def get_recent_reviews(request, limit: int) -> list:
+    """
+    최신 리뷰 카드 limit개 (limit은 버퍼 크기까지)
+    - 로그인 유저면 좋아요 여부만 한 번에 조회해서 덮어씀
+    """
+    limit = max(1, min(limit, settings.RECENT_REVIEWS_BUFFER_SIZE))
+    cards = [_absolute_media(card, request) for card in _current_cards()[:limit]]
+    user = request.user
+    if user is None or not user.is_authenticated or not cards:
+        return cards
+
+    liked = set(
+        ReviewLike.objects.filter(user_id=user.id, review_id__in=[c["id"] for c in cards]).values_list(
+            "review_id", flat=True
+        )
+    )
+    return [{**card, "is_liked": True} if card["id"] in liked else card for card in cards]
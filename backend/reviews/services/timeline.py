@@ -0,0 +1,193 @@
+# backend/reviews/services/timeline.py
+"""
+팔로잉 피드(/api/reviews/feed/) 타임라인 (TimelineEntry)
+- 리뷰 작성(또는 보고싶어요 → 감상으로 수정) → 커밋 이후 reviews.fan_out_review 작업이 팔로워마다 1행씩 넣고
+  Review.fanned_out=True (fan-out on write) / 감상 → 보고싶어요로 수정하면 그 행들을 지움 (retract_review)
+- 팔로워가 FEED_FANOUT_MAX_FOLLOWERS보다 많은 작성자는 넣지 않음 → fanned_out=False로 남아 피드를 읽을 때 합침
+  (읽기는 현재 팔로워 수가 아니라 리뷰별 fanned_out 기준 → 기준을 넘나들어도 빠지는 리뷰 없음)
+- 팔로우: 작성자의 분배된 최근 리뷰 FEED_BACKFILL_LIMIT개로 채움 / 언팔로우: 그 작성자 행만 삭제
+- 읽기: (user, created_at, review) 인덱스 범위 스캔 한 번 → 리뷰 id로 카드 데이터 조회
+- followers_count가 어긋나면 recount_followers로 보정 (python manage.py recount_followers)
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, Value
+
+from accounts.models import Follow
+from jobs.services import enqueue
+from movies.pagination import keyset_filter, keyset_ordering
+from reviews.models import Review, TimelineEntry
+
+User = get_user_model()
+
+# 피드 정렬 키 (작성 시각 → 리뷰 id, 둘 다 내림차순) / 커서 값은 [created_at, 리뷰 id]
+TIMELINE_KEYS = ("-created_at", "-review_id")
+REVIEW_KEYS = ("-created_at", "-id")
+
+
+def is_fan_out_author(followers_count: int) -> bool:
+    # 팔로워가 너무 많은 작성자는 쓰기 분배 대신 읽을 때 합침
+    return followers_count <= settings.FEED_FANOUT_MAX_FOLLOWERS
+
+
+def schedule_fan_out(review):
+    # 리뷰 작성 / 감상으로 수정 후 호출 (커밋 이후 작업 등록 → 팔로워 수만큼의 INSERT는 워커가 처리)
+    if not review.watched:
+        return
+    transaction.on_commit(
+        lambda: enqueue(
+            "reviews.fan_out_review",
+            {"review_id": review.id},
+            idempotency_key=f"reviews.fan_out_review:{review.id}",
+        )
+    )
+
+
+def fan_out_review(review_id: int) -> int:
+    """
+    리뷰 1개를 작성자 팔로워들의 타임라인에 넣음 (팔로워 id 순 배치, 이미 있으면 무시)
+    - 다 넣은 뒤 fanned_out=True → 그 전까지는 읽을 때 합쳐서 보여줌 (중간에 실패해도 빠지지 않음)
+    반환: 넣은 팔로워 수
+    """
+    review = (
+        Review.objects.filter(pk=review_id, watched=True)
+        .values("user_id", "created_at", "user__followers_count")
+        .first()
+    )
+    if review is None or not is_fan_out_author(review["user__followers_count"]):
+        return 0
+
+    author_id = review["user_id"]
+    batch_size = settings.FEED_FANOUT_BATCH_SIZE
+    total = 0
+    last_id = 0
+    while True:
+        follower_ids = list(
+            Follow.objects.filter(to_user_id=author_id, from_user_id__gt=last_id)
+            .order_by("from_user_id")
+            .values_list("from_user_id", flat=True)[:batch_size]
+        )
+        if not follower_ids:
+            break
+        last_id = follower_ids[-1]
+        TimelineEntry.objects.bulk_create(
+            [
+                TimelineEntry(user_id=uid, review_id=review_id, author_id=author_id, created_at=review["created_at"])
+                for uid in follower_ids
+            ],
+            ignore_conflicts=True,
+        )
+        total += len(follower_ids)
+    Review.objects.filter(pk=review_id, watched=True).update(fanned_out=True)
+    return total
+
+
+def retract_review(review_id: int) -> int:
+    # 감상 → 보고싶어요로 수정: 팔로워 타임라인에 넣었던 행 삭제 (다시 감상으로 바뀌면 schedule_fan_out부터)
+    deleted, _ = TimelineEntry.objects.filter(review_id=review_id).delete()
+    Review.objects.filter(pk=review_id).update(fanned_out=False)
+    return deleted
+
+
+def add_author_to_timeline(user_id: int, author_id: int) -> int:
+    """
+    팔로우 직후: 작성자의 최근 리뷰로 내 타임라인 채우기
+    - 분배된(fanned_out) 리뷰만 → 나머지는 읽을 때 합침
+    """
+    recent = (
+        Review.objects.filter(user_id=author_id, watched=Value(True), fanned_out=True)
+        .order_by(*keyset_ordering(REVIEW_KEYS))
+        .values_list("id", "created_at")[: settings.FEED_BACKFILL_LIMIT]
+    )
+    entries = [
+        TimelineEntry(user_id=user_id, review_id=pk, author_id=author_id, created_at=created_at)
+        for pk, created_at in recent
+    ]
+    TimelineEntry.objects.bulk_create(entries, ignore_conflicts=True)
+    return len(entries)
+
+
+def remove_author_from_timeline(user_id: int, author_id: int) -> int:
+    # 언팔로우 직후: 내 타임라인에서 그 작성자 행만 삭제 ((user, author) 인덱스)
+    deleted, _ = TimelineEntry.objects.filter(user_id=user_id, author_id=author_id).delete()
+    return deleted
+
+
+def drop_user_timelines(user_id: int):
+    # 탈퇴: 내 타임라인 + 다른 사람 타임라인에 들어간 내 리뷰
+    TimelineEntry.objects.filter(user_id=user_id).delete()
+    TimelineEntry.objects.filter(author_id=user_id).delete()
+
+
+def following_feed(user, after=None, limit: int = 20) -> list:
+    """
+    팔로잉 피드 limit개 (after=[created_at, 리뷰 id] 커서 다음부터)
+    - 타임라인: (user, created_at, review) 커버링 인덱스 범위 스캔
+    - 분배 안 된 리뷰(팔로워 많은 작성자 / 분배 대기 중): 부분 인덱스(review_unfanned_recent_idx)로
+      팔로우한 작성자의 같은 구간만 가져와 합침
+    - 반환 리뷰에는 카드용 select_related / 댓글 수 / is_liked까지 붙임
+    """
+    from reviews.serializers import annotate_is_liked, annotate_review_counts
+
+    entries = TimelineEntry.objects.filter(user_id=user.id)
+    if after:
+        entries = entries.filter(keyset_filter(TIMELINE_KEYS, after, frozenset()))
+    keys = list(entries.order_by(*keyset_ordering(TIMELINE_KEYS)).values_list("created_at", "review_id")[:limit])
+
+    following = Follow.objects.filter(from_user_id=user.id).values("to_user_id")
+    merged = Review.objects.filter(user_id__in=following, watched=True, fanned_out=False)
+    if after:
+        merged = merged.filter(keyset_filter(REVIEW_KEYS, after, frozenset()))
+    keys += merged.order_by(*keyset_ordering(REVIEW_KEYS)).values_list("created_at", "id")[:limit]
+
+    # 분배 중인 리뷰는 양쪽에 다 있을 수 있음 → set으로 중복 제거
+    ids = [pk for _, pk in sorted(set(keys), reverse=True)[:limit]]
+    if not ids:
+        return []
+
+    # 타임라인 행이 남아 있어도 감상 리뷰가 아니면 빼기 (retract_review 전에 바뀐 경우 대비)
+    qs = annotate_is_liked(
+        annotate_review_counts(
+            Review.objects.filter(pk__in=ids, watched=True).select_related("user", "movie").order_by()
+        ),
+        user,
+    )
+    by_id = {review.id: review for review in qs}
+    return [by_id[pk] for pk in ids if pk in by_id]
+
+
+def recount_followers(batch_size=1000, on_batch=None) -> dict:
+    """
+    User.followers_count를 Follow 기준으로 재계산, 달라진 행만 bulk_update
+    (fan-out 여부를 이 값으로 정하므로 F() 증감이 어긋나면 보정)
+    반환: {"checked": n, "fixed": n}
+    """
+    checked = fixed = 0
+    last_id = 0
+    while True:
+        batch = list(
+            User.objects.filter(id__gt=last_id).order_by("id").values_list("id", "followers_count")[:batch_size]
+        )
+        if not batch:
+            break
+        last_id = batch[-1][0]
+
+        actual = dict(
+            Follow.objects.filter(to_user_id__in=[pk for pk, _ in batch])
+            .order_by()
+            .values("to_user_id")
+            .annotate(n=Count("id"))
+            .values_list("to_user_id", "n")
+        )
+        changed = [
+            User(id=pk, followers_count=actual.get(pk, 0)) for pk, count in batch if count != actual.get(pk, 0)
+        ]
+        if changed:
+            User.objects.bulk_update(changed, ["followers_count"])
+
+        checked += len(batch)
+        fixed += len(changed)
+        if on_batch:
+            on_batch(checked, fixed)
+    return {"checked": checked, "fixed": fixed}
@@ -0,0 +1,37 @@
+# backend/reviews/services/top_reviews.py
+"""
+MovieTopReview(영화별 대표 리뷰) 갱신
+- 기준: 좋아요 많은 순 → 최신순 1개 (기존 get_top_review와 동일)
+"""
+from movies.services.home_payload import invalidate_home_payload_for_movie
+from reviews.models import Review, MovieTopReview
+
+
+def refresh_top_review(movie_id: int):
+    top = (
+        Review.objects.filter(movie_id=movie_id)
+        .order_by("-like_count", "-created_at")
+        .values("id", "like_count")
+        .first()
+    )
+    if not top:
+        MovieTopReview.objects.filter(movie_id=movie_id).delete()
+        obj = None
+    else:
+        obj, _ = MovieTopReview.objects.update_or_create(
+            movie_id=movie_id,
+            defaults={"review_id": top["id"], "like_count": top["like_count"]},
+        )
+
+    # 홈 카드에도 대표 리뷰가 나가므로 홈에 걸린 영화면 홈 응답도 다시 만들도록
+    invalidate_home_payload_for_movie(movie_id)
+    return obj
+
+
+def rebuild_top_reviews():
+    # 전체 재계산 (드리프트 복구용)
+    movie_ids = list(Review.objects.order_by().values_list("movie_id", flat=True).distinct())
+    MovieTopReview.objects.exclude(movie_id__in=movie_ids).delete()
+    for movie_id in movie_ids:
+        refresh_top_review(movie_id)
+    return len(movie_ids)
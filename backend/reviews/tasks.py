@@ -0,0 +1,10 @@
+# backend/reviews/tasks.py
+from jobs.registry import task
+
+from .services.timeline import fan_out_review
+
+
+@task("reviews.fan_out_review")
+def fan_out_review_task(review_id: int):
+    # 리뷰 작성 → 작성자 팔로워들의 팔로잉 피드 타임라인에 넣기
+    fan_out_review(review_id)
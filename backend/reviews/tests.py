@@ -1,3 +1,521 @@
-from django.test import TestCase
+from io import StringIO
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APITestCase
+
+from accounts.models import Follow
+from movies.models import Genre, Movie, MovieGenre
+from movies.services.stats import STAT_FIELDS, apply_movie_stats
+from .models import MovieTopReview, Review, ReviewComment, ReviewLike, TimelineEntry
+from .services.likes import toggle_review_like
+from .services.timeline import retract_review
+from .services.top_reviews import rebuild_top_reviews
+
+User = get_user_model()
+
+
+class ReviewListQueryCountTests(APITestCase):
+    """
+    리뷰 목록 API 쿼리 수가 리뷰 개수와 상관없이 일정한지 (is_liked / 영화 카드 N+1 방지)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.me = User.objects.create(username="me", email="me@example.com")
+        cls.movie = Movie.objects.create(tmdb_id=1, title="영화")
+        cls.others = [Movie.objects.create(tmdb_id=100 + i, title=f"다른 영화 {i}") for i in range(5)]
+        genre = Genre.objects.create(tmdb_id=28, name="액션")
+        for movie in [cls.movie, *cls.others]:
+            MovieGenre.objects.create(movie=movie, genre=genre)
+
+    def _add_reviews(self, n):
+        # 다른 유저들이 self.movie에 리뷰, 나는 그중 짝수 번째에 좋아요
+        for i in range(n):
+            user = User.objects.create(username=f"writer{self._next}", email=f"writer{self._next}@example.com")
+            self._next += 1
+            review = Review.objects.create(user=user, movie=self.movie, content="좋아요", watched=True, rating=4)
+            if i % 2 == 0:
+                toggle_review_like(review.id, self.me.id)
+        rebuild_top_reviews()
+
+    def setUp(self):
+        self._next = 0
+        self.client.force_authenticate(self.me)
+        for movie in self.others:
+            Review.objects.create(user=self.me, movie=movie, content="내 리뷰", watched=True, rating=3)
+        Review.objects.create(user=self.me, movie=self.movie, content="내 리뷰", watched=True, rating=5)
+
+    def assertConstantQueries(self, url, num):
+        self._add_reviews(2)
+        with self.assertNumQueries(num):
+            small = self.client.get(url)
+        self._add_reviews(8)
+        with self.assertNumQueries(num):
+            large = self.client.get(url)
+        self.assertEqual(small.status_code, 200)
+        self.assertEqual(large.status_code, 200)
+        return large.json()
+
+    def test_list_movie_reviews(self):
+        # 영화 1 + 리뷰 1 + 카드 장르/대표 리뷰 2
+        data = self.assertConstantQueries(f"/api/reviews/movie/{self.movie.tmdb_id}/", 4)["results"]
+        liked = [r["is_liked"] for r in data if r["user"]["id"] != self.me.id]
+        self.assertEqual(liked.count(True), 5)
+
+    def test_my_reviews(self):
+        self.assertConstantQueries("/api/reviews/my/", 3)
+
+    def test_my_liked_reviews(self):
+        data = self.assertConstantQueries("/api/reviews/my/?status=liked", 3)
+        self.assertEqual(len(data), 5)
+        self.assertTrue(all(r["is_liked"] for r in data))
+
+    def test_my_movie_review(self):
+        # 영화 1 + 리뷰 1 + 카드 장르/대표 리뷰 2
+        data = self.assertConstantQueries(f"/api/reviews/movie/{self.movie.tmdb_id}/my/", 4)
+        self.assertFalse(data["is_liked"])
+
+    def test_anonymous_is_liked_false(self):
+        self._add_reviews(2)
+        self.client.force_authenticate(None)
+        data = self.client.get(f"/api/reviews/movie/{self.movie.tmdb_id}/").json()["results"]
+        self.assertFalse(any(r["is_liked"] for r in data))
+
+
+class ReviewCursorPaginationTests(APITestCase):
+    """
+    커서로 끝까지 넘긴 결과가 전체 정렬과 같은 순서인지 + 페이지당 쿼리 수 일정한지 (기본 응답도 커서 페이지)
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.movie = Movie.objects.create(tmdb_id=1, title="영화")
+        users = [User.objects.create(username=f"u{i}", email=f"u{i}@example.com") for i in range(12)]
+        cls.reviews = [
+            Review.objects.create(user=u, movie=cls.movie, content=f"리뷰 {i}", watched=True, rating=3)
+            for i, u in enumerate(users)
+        ]
+        # 좋아요 수 동점을 섞어서 created_at/id 동점 처리까지 확인
+        for i, review in enumerate(cls.reviews):
+            for user in users[: i % 4]:
+                toggle_review_like(review.id, user.id)
+        Review.objects.filter(pk__in=[r.pk for r in cls.reviews[:4]]).update(created_at=cls.reviews[0].created_at)
+        cls.comments = [
+            ReviewComment.objects.create(review=cls.reviews[0], user=users[i % 3], content=f"댓글 {i}")
+            for i in range(7)
+        ]
+
+    def _walk(self, url, num_queries):
+        ids, pages = [], 0
+        while url:
+            with self.assertNumQueries(num_queries):
+                data = self.client.get(url).json()
+            ids += [item["id"] for item in data["results"]]
+            url, pages = data["next"], pages + 1
+        return ids, pages
+
+    def test_reviews_follow_full_listing(self):
+        base = f"/api/reviews/movie/{self.movie.tmdb_id}/"
+        orderings = {"likes": ("-like_count", "-created_at", "-id"), "recent": ("-created_at", "-id")}
+        for sort, ordering in orderings.items():
+            expected = list(Review.objects.order_by(*ordering).values_list("id", flat=True))
+            # 영화 1 + 리뷰 1 + 카드 장르/대표 리뷰 2
+            ids, pages = self._walk(f"{base}?sort={sort}&page_size=5", 4)
+            self.assertEqual(ids, expected)
+            self.assertEqual(pages, 3)
+
+    def test_default_is_first_page(self):
+        # 파라미터 없이 불러도 전체 목록이 아니라 첫 페이지 + next
+        reviews = self.client.get(f"/api/reviews/movie/{self.movie.tmdb_id}/?page_size=5").json()
+        comments = self.client.get(f"/api/reviews/{self.reviews[0].id}/comments/?page_size=5").json()
+        self.assertEqual((len(reviews["results"]), len(comments["results"])), (5, 5))
+        self.assertIsNotNone(reviews["next"])
+        self.assertIsNotNone(comments["next"])
+
+    def test_comments_follow_full_listing(self):
+        base = f"/api/reviews/{self.reviews[0].id}/comments/"
+        orderings = {"oldest": ("created_at", "id"), "recent": ("-created_at", "-id")}
+        for sort, ordering in orderings.items():
+            expected = list(ReviewComment.objects.order_by(*ordering).values_list("id", flat=True))
+            ids, _ = self._walk(f"{base}?sort={sort}&page_size=3", 1)
+            self.assertEqual(ids, expected)
+            self.assertEqual(len(ids), 7)
+
+    def test_cursor_bounds_leading_key(self):
+        # OR 조건만 있으면 인덱스를 처음부터 훑음 → 첫 정렬 키 범위 조건이 같이 붙는지
+        cases = [
+            (f"/api/reviews/movie/{self.movie.tmdb_id}/?sort=likes&page_size=5", '"like_count" <='),
+            (f"/api/reviews/movie/{self.movie.tmdb_id}/?sort=recent&page_size=5", '"created_at" <='),
+            (f"/api/reviews/{self.reviews[0].id}/comments/?sort=oldest&page_size=3", '"created_at" >='),
+            (f"/api/reviews/{self.reviews[0].id}/comments/?sort=recent&page_size=3", '"created_at" <='),
+        ]
+        for url, bound in cases:
+            next_url = self.client.get(url).json()["next"]
+            with CaptureQueriesContext(connection) as ctx:
+                self.client.get(next_url)
+            self.assertTrue(any(bound in q["sql"] for q in ctx.captured_queries), url)
+
+    def test_invalid_cursor(self):
+        res = self.client.get(f"/api/reviews/movie/{self.movie.tmdb_id}/?cursor=bad")
+        self.assertEqual(res.status_code, 404)
+
+
+class ReviewLikeToggleTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.writer = User.objects.create(username="writer", email="writer@example.com")
+        cls.me = User.objects.create(username="me", email="me@example.com")
+        cls.movie = Movie.objects.create(tmdb_id=1, title="영화")
+        cls.review = Review.objects.create(user=cls.writer, movie=cls.movie, content="리뷰", watched=True, rating=5)
+
+    def test_toggle_updates_counter(self):
+        self.client.force_authenticate(self.me)
+        url = f"/api/reviews/{self.review.id}/like/"
+
+        self.assertEqual(self.client.post(url).json(), {"liked": True, "like_count": 1})
+        self.assertEqual(self.client.post(url).json(), {"liked": False, "like_count": 0})
+        self.assertEqual(self.client.post(url).json(), {"liked": True, "like_count": 1})
+        self.review.refresh_from_db()
+        self.assertEqual(self.review.like_count, 1)
+        self.assertEqual(ReviewLike.objects.filter(review=self.review).count(), 1)
+
+    def test_own_review(self):
+        self.client.force_authenticate(self.writer)
+        res = self.client.post(f"/api/reviews/{self.review.id}/like/")
+        self.assertEqual(res.status_code, 400)
+        self.assertFalse(ReviewLike.objects.exists())
+
+
+class MovieStatsTests(APITestCase):
+    """
+    Movie 반응 집계 컬럼 - 리뷰 작성/수정/삭제, 보고싶어요, 좋아요 때 증감 / recount_movie_stats로 보정
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.me = User.objects.create(username="me", email="me@example.com")
+        cls.other = User.objects.create(username="other", email="other@example.com")
+        cls.movie = Movie.objects.create(tmdb_id=1, title="영화")
+
+    def _stats(self):
+        self.movie.refresh_from_db()
+        return {field: getattr(self.movie, field) for field in STAT_FIELDS}
+
+    def _expect(self, **stats):
+        self.assertEqual(self._stats(), {**dict.fromkeys(STAT_FIELDS, 0), **stats})
+
+    def test_review_lifecycle_counters(self):
+        self.client.force_authenticate(self.me)
+        self.client.post("/api/reviews/movies/1/wish/")
+        self._expect(wish_count=1)
+
+        review_id = Review.objects.get(user=self.me).id
+        self.client.put(f"/api/reviews/{review_id}/", {"content": "봤음", "watched": True, "rating": 4})
+        self._expect(review_count=1, rating_sum=4)
+        self.client.put(f"/api/reviews/{review_id}/", {"content": "다시 봄", "watched": True, "rating": 2})
+        self._expect(review_count=1, rating_sum=2)
+
+        self.client.force_authenticate(self.other)
+        self.client.post("/api/reviews/movie/1/create/", {"content": "좋음", "watched": True, "rating": 5})
+        self.client.post("/api/movies/1/like/")
+        self._expect(review_count=2, rating_sum=7, like_count=1)
+        self.assertEqual(self.movie.rating_avg, 3.5)
+
+        self.client.force_authenticate(self.me)
+        self.client.delete(f"/api/reviews/{review_id}/")
+        self.client.force_authenticate(self.other)
+        self.client.post("/api/movies/1/like/")
+        self._expect(review_count=1, rating_sum=5)
+
+    def test_recount_fixes_drift(self):
+        Review.objects.create(user=self.me, movie=self.movie, content="리뷰", watched=True, rating=4)
+        Review.objects.create(user=self.other, movie=self.movie, content="", watched=False, rating=0)
+        Movie.objects.filter(pk=self.movie.pk).update(review_count=5, rating_sum=1, like_count=3)
+
+        # 어긋난 값에서 감소해도 0 아래로는 안 내려감
+        apply_movie_stats(self.movie.id, like_count=-10)
+        self.assertEqual(self._stats()["like_count"], 0)
+
+        out = StringIO()
+        call_command("recount_movie_stats", stdout=out)
+        self.assertIn("1개 중 1개 보정", out.getvalue())
+        self._expect(review_count=1, rating_sum=4, wish_count=1)
+
+
+class TopReviewTests(APITestCase):
+    """
+    MovieTopReview - 작성/삭제/좋아요 때 갱신, 카드 목록은 영화 수와 상관없이 같은 쿼리 수
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.writers = [User.objects.create(username=f"writer{i}", email=f"writer{i}@example.com") for i in range(2)]
+        cls.fan = User.objects.create(username="fan", email="fan@example.com")
+        cls.movie = Movie.objects.create(tmdb_id=1, title="영화")
+
+    def _post(self, user, content):
+        self.client.force_authenticate(user)
+        return self.client.post(
+            f"/api/reviews/movie/{self.movie.tmdb_id}/create/", {"content": content, "watched": True, "rating": 4}
+        ).json()["id"]
+
+    def _card_top_review(self):
+        cards = self.client.get("/api/movies/list/?fields=tmdb_id,top_review").json()["results"]
+        top = cards[0]["top_review"]
+        return top and (top["id"], top["like_count"])
+
+    def test_hooks_keep_top_review(self):
+        first = self._post(self.writers[0], "먼저")
+        second = self._post(self.writers[1], "나중")
+        self.assertEqual(self._card_top_review(), (second, 0))  # 좋아요 같으면 최신
+
+        self.client.force_authenticate(self.fan)
+        self.client.post(f"/api/reviews/{first}/like/")
+        self.assertEqual(self._card_top_review(), (first, 1))
+
+        self.client.force_authenticate(self.writers[0])
+        self.client.delete(f"/api/reviews/{first}/")
+        self.assertEqual(self._card_top_review(), (second, 0))
+        self.client.force_authenticate(self.writers[1])
+        self.client.delete(f"/api/reviews/{second}/")
+        self.assertIsNone(self._card_top_review())
+        self.assertFalse(MovieTopReview.objects.exists())
+
+    def test_rebuild_repairs_drift(self):
+        review = Review.objects.create(user=self.writers[0], movie=self.movie, content="리뷰", watched=True, rating=4)
+        self.assertFalse(MovieTopReview.objects.exists())
+        self.assertEqual(rebuild_top_reviews(), 1)
+        self.assertEqual(MovieTopReview.objects.get(movie=self.movie).review_id, review.id)
+
+    def test_card_list_queries_do_not_grow(self):
+        def count_queries():
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(self.client.get("/api/movies/list/").status_code, 200)
+            return len(queries)
+
+        for i in range(2):
+            movie = Movie.objects.create(tmdb_id=100 + i, title=f"영화 {i}")
+            Review.objects.create(user=self.writers[0], movie=movie, content="리뷰", watched=True, rating=4)
+        rebuild_top_reviews()
+        small = count_queries()
+        for i in range(2, 12):
+            movie = Movie.objects.create(tmdb_id=100 + i, title=f"영화 {i}")
+            Review.objects.create(user=self.writers[0], movie=movie, content="리뷰", watched=True, rating=4)
+        rebuild_top_reviews()
+        self.assertEqual(count_queries(), small)
+
+
+@override_settings(RECENT_REVIEWS_BUFFER_SIZE=5, RECENT_REVIEWS_CHECK_SECONDS=0)
+class RecentReviewFeedTests(APITestCase):
+    """
+    /api/reviews/recent/ - 캐시 버퍼에서 응답 + 리뷰 변경 훅으로 갱신
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.me = User.objects.create(username="me", email="me@example.com")
+        cls.users = [User.objects.create(username=f"u{i}", email=f"u{i}@example.com") for i in range(8)]
+        cls.movies = [Movie.objects.create(tmdb_id=i + 1, title=f"영화 {i}") for i in range(8)]
+        cls.reviews = [
+            Review.objects.create(user=u, movie=m, content="리뷰", watched=True, rating=4)
+            for u, m in zip(cls.users, cls.movies)
+        ]
+
+    def setUp(self):
+        cache.clear()
+
+    def _ids(self, url="/api/reviews/recent/?limit=50"):
+        return [r["id"] for r in self.client.get(url).json()]
+
+    def test_served_from_buffer(self):
+        newest = [r.id for r in self.reviews[::-1][:5]]
+        self.assertEqual(self._ids(), newest)  # 버퍼 구성 + limit은 버퍼 크기까지
+
+        with self.assertNumQueries(0):
+            self.assertEqual(len(self.client.get("/api/reviews/recent/?limit=3").json()), 3)
+
+        toggle_review_like(newest[1], self.me.id)
+        self.client.force_authenticate(self.me)
+        with self.assertNumQueries(1):
+            data = self.client.get("/api/reviews/recent/").json()
+        self.assertEqual([r["is_liked"] for r in data], [False, True, False, False, False])
+
+    def test_profile_image_absolute_url(self):
+        # 영화별 리뷰 목록(요청 context로 직렬화)과 같은 절대 URL
+        User.objects.filter(pk=self.users[-1].pk).update(profile_image="profiles/a.png")
+        card = self.client.get("/api/reviews/recent/").json()[0]
+        listed = self.client.get(f"/api/reviews/movie/{self.movies[-1].tmdb_id}/").json()["results"][0]
+        self.assertEqual(card["user"]["profile_image"], listed["user"]["profile_image"])
+        self.assertTrue(card["user"]["profile_image"].startswith("http://testserver/"))
+
+    def test_hooks_update_buffer(self):
+        self._ids()
+        self.client.force_authenticate(self.me)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            res = self.client.post(
+                f"/api/reviews/movie/{self.movies[0].tmdb_id}/create/",
+                {"content": "새 리뷰", "watched": True, "rating": 5},
+            )
+        new_id = res.json()["id"]
+        self.assertEqual(self._ids()[0], new_id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.put(f"/api/reviews/{new_id}/", {"content": "수정", "watched": True, "rating": 3})
+        self.assertEqual(self.client.get("/api/reviews/recent/").json()[0]["content"], "수정")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(f"/api/reviews/{self.reviews[-1].id}/like/")
+        data = {r["id"]: r for r in self.client.get("/api/reviews/recent/").json()}
+        self.assertEqual(data[self.reviews[-1].id]["like_count"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f"/api/reviews/{new_id}/")
+        self.assertEqual(self._ids(), [r.id for r in self.reviews[::-1][:5]])
+
+
+@override_settings(FEED_FANOUT_MAX_FOLLOWERS=2, JOBS_EAGER=True)
+class FollowingFeedTests(APITestCase):
+    """
+    /api/reviews/feed/ - 작성 시 타임라인 분배 / 팔로우 시 채우기·언팔로우 시 정리 / 팔로워 많은 작성자는 읽을 때 합침
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.me = User.objects.create(username="me", email="me@example.com")
+        cls.writer = User.objects.create(username="writer", email="writer@example.com")
+        cls.star = User.objects.create(username="star", email="star@example.com")
+        cls.movies = [Movie.objects.create(tmdb_id=i + 1, title=f"영화 {i}") for i in range(6)]
+        # star는 팔로워 3명 → 기준(2) 초과라 분배 없이 읽을 때 합침
+        for i in range(2):
+            fan = User.objects.create(username=f"fan{i}", email=f"fan{i}@example.com")
+            Follow.objects.create(from_user=fan, to_user=cls.star)
+        User.objects.filter(pk=cls.star.pk).update(followers_count=2)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.me)
+
+    def _review(self, user, movie):
+        return Review.objects.create(user=user, movie=movie, content="리뷰", watched=True, rating=4)
+
+    def _follow(self, user):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(f"/api/accounts/users/{user.username}/follow/").json()
+
+    def _feed_ids(self, url="/api/reviews/feed/?page_size=2"):
+        ids = []
+        while url:
+            data = self.client.get(url).json()
+            ids += [r["id"] for r in data["results"]]
+            url = data["next"]
+        return ids
+
+    def test_backfill_fan_out_and_unfollow(self):
+        old = [self._review(self.writer, m) for m in self.movies[:3]]
+        result = self._follow(self.writer)
+        self.assertEqual((result["is_following"], result["followers_count"]), (True, 1))
+        self.assertEqual(self._feed_ids(), [r.id for r in old[::-1]])
+
+        self.client.force_authenticate(self.writer)
+        with self.captureOnCommitCallbacks(execute=True):
+            new_id = self.client.post(
+                f"/api/reviews/movie/{self.movies[3].tmdb_id}/create/",
+                {"content": "새 리뷰", "watched": True, "rating": 5},
+            ).json()["id"]
+        self.client.force_authenticate(self.me)
+        self.assertEqual(self._feed_ids()[0], new_id)
+
+        result = self._follow(self.writer)
+        self.assertEqual((result["is_following"], result["followers_count"]), (False, 0))
+        self.assertEqual(self._feed_ids(), [])
+        self.assertFalse(TimelineEntry.objects.exists())
+
+    def test_popular_author_merged_at_read(self):
+        writer_reviews = [self._review(self.writer, m) for m in self.movies[:3]]
+        star_reviews = [self._review(self.star, m) for m in self.movies[2:]]
+        self._follow(self.writer)
+        self.assertEqual(self._follow(self.star)["followers_count"], 3)
+
+        self.client.force_authenticate(self.star)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(
+                f"/api/reviews/movie/{self.movies[1].tmdb_id}/create/",
+                {"content": "새 리뷰", "watched": True, "rating": 5},
+            )
+        self.client.force_authenticate(self.me)
+
+        # star 리뷰는 타임라인에 없고 피드에는 최신순으로 섞여 나옴
+        self.assertFalse(TimelineEntry.objects.filter(author=self.star).exists())
+        expected = Review.objects.filter(user__in=[self.writer, self.star]).order_by("-created_at", "-id")
+        self.assertEqual(self._feed_ids(), [r.id for r in expected])
+        self.assertEqual(len(expected), len(writer_reviews) + len(star_reviews) + 1)
+
+    def _post_review(self, author, movie):
+        self.client.force_authenticate(author)
+        with self.captureOnCommitCallbacks(execute=True):
+            review_id = self.client.post(
+                f"/api/reviews/movie/{movie.tmdb_id}/create/",
+                {"content": "새 리뷰", "watched": True, "rating": 5},
+            ).json()["id"]
+        self.client.force_authenticate(self.me)
+        return review_id
+
+    def test_author_back_under_threshold_keeps_merged_reviews(self):
+        self._follow(self.star)
+        popular_id = self._post_review(self.star, self.movies[0])
+        self.assertFalse(TimelineEntry.objects.filter(review_id=popular_id).exists())
+
+        # 팔로워가 빠져 기준 이하로 내려가도 그때 분배 안 된 리뷰는 계속 피드에 나옴
+        Follow.objects.filter(to_user=self.star).exclude(from_user=self.me).delete()
+        call_command("recount_followers", stdout=StringIO())
+        self.assertEqual(User.objects.get(pk=self.star.pk).followers_count, 1)
+
+        new_id = self._post_review(self.star, self.movies[1])
+        self.assertTrue(TimelineEntry.objects.filter(user=self.me, review_id=new_id).exists())
+        self.assertEqual(self._feed_ids(), [new_id, popular_id])
+
+    def test_wish_to_watched_update_fans_out(self):
+        self._follow(self.writer)
+        self.client.force_authenticate(self.writer)
+        self.client.post(f"/api/reviews/movies/{self.movies[0].tmdb_id}/wish/")
+        review_id = Review.objects.get(user=self.writer).id
+        self.client.force_authenticate(self.me)
+        self.assertEqual(self._feed_ids(), [])
+
+        self.client.force_authenticate(self.writer)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.put(f"/api/reviews/{review_id}/", {"content": "봤음", "watched": True, "rating": 4})
+        self.client.force_authenticate(self.me)
+        self.assertTrue(TimelineEntry.objects.filter(user=self.me, review_id=review_id).exists())
+        self.assertEqual(self._feed_ids(), [review_id])
+
+    def test_unwatched_review_leaves_feed(self):
+        self._follow(self.writer)
+        review_id = self._post_review(self.writer, self.movies[0])
+        kept_id = self._post_review(self.writer, self.movies[1])
+        self.assertEqual(self._feed_ids(), [kept_id, review_id])
+
+        # 타임라인 행이 남아 있어도 감상 리뷰가 아니면 피드에서 빠짐
+        Review.objects.filter(pk=review_id).update(watched=False)
+        self.assertEqual(self._feed_ids(), [kept_id])
+
+        self.assertEqual(retract_review(review_id), 1)
+        self.assertFalse(TimelineEntry.objects.filter(review_id=review_id).exists())
+        self.assertFalse(Review.objects.get(pk=review_id).fanned_out)
+        self.assertEqual(self._feed_ids(), [kept_id])
+
+    def test_feed_queries(self):
+        for movie in self.movies:
+            self._review(self.writer, movie)
+        self._follow(self.writer)
+        # 타임라인 1 + 합칠 리뷰 1 + 리뷰 1 + 카드 장르/대표 리뷰 2
+        with self.assertNumQueries(5):
+            data = self.client.get("/api/reviews/feed/?page_size=4").json()
+        self.assertEqual(len(data["results"]), 4)
+        self.assertEqual(self.client.get("/api/reviews/feed/?cursor=bad").status_code, 404)
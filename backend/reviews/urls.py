@@ -13,6 +13,7 @@ urlpatterns = [
     
     # 홈 화면용
     path("recent/", views.recent_reviews),                        # GET: 최신 리뷰
+    path("feed/", views.following_feed_view),                    # GET: 팔로잉 피드
     
     # ★ 마이페이지용 (프론트 comet.js의 fetchMyActivity가 여기를 호출함)
     # path("my/", views.my_reviews, name="my_reviews"),
@@ -1,26 +1,47 @@
-from django.db.models import Count
+from django.db.models import Value
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
+from django.db import transaction
 
 from movies.models import Movie 
+from movies.serializers import movie_card_prefetches
+from movies.services.stats import apply_movie_stats, merge_deltas, review_stat_deltas
 from .models import Review, ReviewComment 
-from .serializers import ReviewSerializer, ReviewCreateSerializer, RecentReviewSerializer
+from .serializers import (
+    ReviewSerializer,
+    ReviewCreateSerializer,
+    RecentReviewSerializer,
+    annotate_is_liked,
+    annotate_review_counts,
+)
+from .pagination import CommentCursorPagination, FeedCursorPagination, ReviewCursorPagination
+from .services.likes import toggle_review_like
+from .services.recent_feed import get_recent_reviews, recent_review_changed
+from .services.timeline import following_feed, retract_review, schedule_fan_out
+from .services.top_reviews import refresh_top_review
 
 # 1. 리뷰 목록 조회
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def list_movie_reviews(request, tmdb_id: int):
+    """
+    GET /api/reviews/movie/<tmdb_id>/?sort=likes|recent&cursor=...
+    - 항상 커서 페이지네이션 {next, results} (next는 다음 페이지 전체 URL, page_size 기본 20 / 최대 50)
+    """
     movie = get_object_or_404(Movie, tmdb_id=tmdb_id)
+    # ✅ 빈 코멘트 제외 / watched=True는 SQL에서 "watched"만 남아 SQLite가 (movie, watched, created_at)
+    #    인덱스를 못 타므로 값 비교(watched = 1)로 명시
     qs = (
-        Review.objects.filter(movie=movie, watched=True) # ✅ 빈 코멘트 제외
+        Review.objects.filter(movie=movie, watched=Value(True))
         .select_related("user", "movie")
-        .annotate(likes_count=Count("likes", distinct=True), comments_count=Count("comments", distinct=True))
-        .order_by("-likes_count", "-created_at")
     )
-    return Response(ReviewSerializer(qs, many=True, context={"request": request}).data)
+    qs = annotate_is_liked(annotate_review_counts(qs), request.user)
+    paginator = ReviewCursorPagination()
+    page = paginator.paginate_queryset(qs, request, request.query_params.get("sort"))
+    return paginator.get_paginated_response(ReviewSerializer(page, many=True, context={"request": request}).data)
 
 # 2. 리뷰 작성
 @api_view(["POST"])
@@ -33,14 +54,19 @@ def create_movie_review(request, tmdb_id: int):
     serializer = ReviewCreateSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
 
-    review = Review.objects.create(
-        movie=movie, user=request.user,
-        content=serializer.validated_data["content"],
-        watched=serializer.validated_data.get("watched", False),
-        rating=serializer.validated_data["rating"],
-    )
+    with transaction.atomic():
+        review = Review.objects.create(
+            movie=movie, user=request.user,
+            content=serializer.validated_data["content"],
+            watched=serializer.validated_data.get("watched", False),
+            rating=serializer.validated_data["rating"],
+        )
+        apply_movie_stats(movie.id, **review_stat_deltas(review.watched, review.rating))
+        recent_review_changed(review.id)
+        schedule_fan_out(review)
+    refresh_top_review(movie.id)
     # 리턴 시 user 정보 포함
-    out = Review.objects.filter(id=review.id).select_related("user", "movie").annotate(likes_count=Count("likes"), comments_count=Count("comments")).first()
+    out = annotate_is_liked(annotate_review_counts(Review.objects.filter(id=review.id).select_related("user", "movie")), request.user).first()
     return Response(ReviewSerializer(out, context={"request": request}).data, status=201)
 
 # 3. 리뷰 수정/삭제
@@ -52,47 +78,81 @@ def update_delete_review(request, review_id: int):
         return Response({"detail": "권한이 없습니다."}, status=403)
 
     if request.method == "DELETE":
-        review.delete()
+        with transaction.atomic():
+            # 동시에 두 번 지워도 카운터는 한 번만 감소
+            _, deleted = Review.objects.filter(pk=review.pk).delete()
+            if deleted.get("reviews.Review"):
+                apply_movie_stats(review.movie_id, **review_stat_deltas(review.watched, review.rating, -1))
+                recent_review_changed(review.id)
+        refresh_top_review(review.movie_id)
         return Response(status=204)
 
     serializer = ReviewCreateSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
+    before = review_stat_deltas(review.watched, review.rating, -1)
+    was_watched = review.watched
     review.content = serializer.validated_data["content"]
     review.watched = serializer.validated_data.get("watched", review.watched)
     review.rating = serializer.validated_data["rating"]
-    review.save()
+    with transaction.atomic():
+        # fanned_out은 fan-out 작업이 따로 갱신 → 수정한 필드만 저장
+        review.save(update_fields=["content", "watched", "rating", "updated_at"])
+        apply_movie_stats(review.movie_id, **merge_deltas(before, review_stat_deltas(review.watched, review.rating)))
+        recent_review_changed(review.id)
+        # ✅ 보고싶어요 → 감상으로 바뀌면 이때 팔로워 타임라인에 분배
+        if review.watched and not was_watched:
+            schedule_fan_out(review)
+        # 감상 → 보고싶어요로 바뀌면 팔로워 타임라인에서 빼기
+        elif was_watched and not review.watched:
+            retract_review(review.id)
+    refresh_top_review(review.movie_id)
     
-    out = Review.objects.filter(id=review.id).select_related("user", "movie").annotate(likes_count=Count("likes"), comments_count=Count("comments")).first()
+    out = annotate_is_liked(annotate_review_counts(Review.objects.filter(id=review.id).select_related("user", "movie")), request.user).first()
     return Response(ReviewSerializer(out, context={"request": request}).data)
 
 # 4. 좋아요 토글
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def toggle_like(request, review_id: int):
-    review = get_object_or_404(Review, id=review_id)
+    review = get_object_or_404(Review.objects.only("id", "user_id", "movie_id"), id=review_id)
     if review.user_id == request.user.id:
         return Response({"detail": "본인 글에는 좋아요 불가"}, status=400)
-    
-    if review.likes.filter(id=request.user.id).exists():
-        review.likes.remove(request.user)
-        liked = False
-    else:
-        review.likes.add(request.user)
-        liked = True
-    return Response({"liked": liked, "like_count": review.likes.count()})
+
+    # ✅ 삭제-또는-삽입 + like_count F() 증감, 새 카운트는 컬럼에서 바로
+    liked, like_count = toggle_review_like(review.id, request.user.id)
+    recent_review_changed(review.id)
+    refresh_top_review(review.movie_id)
+    return Response({"liked": liked, "like_count": like_count})
 
 # 5. 최근 리뷰 (홈 화면)
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def recent_reviews(request):
-    limit = int(request.query_params.get("limit", 12))
-    qs = (
-        Review.objects.filter(watched=True) # ✅ 빈 코멘트 제외
-        .select_related("user", "movie")
-        .annotate(likes_count=Count("likes", distinct=True), comments_count=Count("comments", distinct=True))
-        .order_by("-created_at")[:limit]
+    """
+    GET /api/reviews/recent/?limit=12
+    - 미리 만들어 둔 최신 리뷰 카드(reviews.services.recent_feed)를 잘라서 응답
+    - limit은 버퍼 크기(RECENT_REVIEWS_BUFFER_SIZE)까지
+    """
+    try:
+        limit = int(request.query_params.get("limit", 12))
+    except ValueError:
+        limit = 12
+    return Response(get_recent_reviews(request, limit))
+
+# 5-1. 팔로잉 피드
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def following_feed_view(request):
+    """
+    GET /api/reviews/feed/?cursor=...&page_size=20
+    - 내가 팔로우하는 사람들의 리뷰, 최신순 {next, results}
+    - 유저별 타임라인(TimelineEntry) 인덱스 범위 스캔 + 팔로워 많은 작성자는 읽을 때 합침
+    """
+    paginator = FeedCursorPagination()
+    page = paginator.paginate_feed(
+        lambda after, limit: following_feed(request.user, after=after, limit=limit), request
     )
-    return Response(RecentReviewSerializer(qs, many=True, context={"request": request}).data)
+    return paginator.get_paginated_response(RecentReviewSerializer(page, many=True, context={"request": request}).data)
 
 # 6. [핵심] 마이페이지 통합 뷰
 @api_view(["GET"])
@@ -111,8 +171,8 @@ def my_reviews(request):
         else:
             qs = qs.filter(watched=True)  # ✅ 코멘트만 (빈 것 제외)
 
-    qs = qs.annotate(likes_count=Count("likes", distinct=True), comments_count=Count("comments", distinct=True))
-    
+    qs = annotate_is_liked(annotate_review_counts(qs), user)
+
     if sort_param == "latest": qs = qs.order_by("-created_at")
     elif sort_param == "rating_high": qs = qs.order_by("-rating", "-created_at")
     
@@ -128,12 +188,27 @@ def toggle_movie_wish(request, tmdb_id: int):
     if review:
         if review.watched:
             return Response({"detail": "이미 감상한 작품입니다."}, status=400)
-        review.delete()
+        with transaction.atomic():
+            _, deleted = Review.objects.filter(pk=review.pk).delete()
+            if deleted.get("reviews.Review"):
+                apply_movie_stats(movie.id, wish_count=-1)
+        refresh_top_review(movie.id)
         return Response({"wished": False, "message": "취소됨"})
     else:
-        Review.objects.create(movie=movie, user=request.user, watched=False, rating=0, content="")
+        with transaction.atomic():
+            Review.objects.create(movie=movie, user=request.user, watched=False, rating=0, content="")
+            apply_movie_stats(movie.id, wish_count=1)
+        refresh_top_review(movie.id)
         return Response({"wished": True, "message": "등록됨"})
 
+def _comment_data(c):
+    return {
+        "id": c.id,
+        "content": c.content,
+        "user": { "id": c.user.id, "username": c.user.username, "profile_image": c.user.profile_image.url if c.user.profile_image else None },
+        "created_at": c.created_at
+    }
+
 # 8. 대댓글 작성 (ID 포함)
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
@@ -143,27 +218,21 @@ def create_review_comment(request, review_id):
     if not content: return Response(status=400)
     
     comment = ReviewComment.objects.create(review=review, user=request.user, content=content)
-    return Response({
-        "id": comment.id,
-        "content": comment.content,
-        "user": { "id": comment.user.id, "username": comment.user.username, "profile_image": comment.user.profile_image.url if comment.user.profile_image else None },
-        "created_at": comment.created_at
-    })
+    recent_review_changed(review.id)
+    return Response(_comment_data(comment))
 
 # 9. 대댓글 목록 (ID 포함)
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def list_review_comments(request, review_id):
-    comments = ReviewComment.objects.filter(review_id=review_id).select_related('user').order_by('created_at')
-    data = []
-    for c in comments:
-        data.append({
-            "id": c.id,
-            "content": c.content,
-            "user": { "id": c.user.id, "username": c.user.username, "profile_image": c.user.profile_image.url if c.user.profile_image else None },
-            "created_at": c.created_at
-        })
-    return Response(data)
+    """
+    GET /api/reviews/<review_id>/comments/?sort=oldest|recent&cursor=...
+    - 항상 커서 페이지네이션 {next, results} (page_size 기본 30 / 최대 100)
+    """
+    comments = ReviewComment.objects.filter(review_id=review_id).select_related('user')
+    paginator = CommentCursorPagination()
+    page = paginator.paginate_queryset(comments, request, request.query_params.get("sort"))
+    return paginator.get_paginated_response([_comment_data(c) for c in page])
 
 # 10. 대댓글 삭제
 @api_view(["DELETE"])
@@ -172,6 +241,7 @@ def delete_review_comment(request, comment_id):
     comment = get_object_or_404(ReviewComment, id=comment_id)
     if comment.user != request.user: return Response(status=403)
     comment.delete()
+    recent_review_changed(comment.review_id)
     return Response(status=204)
 
 
@@ -189,16 +259,13 @@ def delete_review_comment(request, comment_id):
 def get_my_movie_review(request, tmdb_id: int):
     movie = get_object_or_404(Movie, tmdb_id=tmdb_id)
 
-    review = (
+    qs = (
         Review.objects
         .filter(movie=movie, user=request.user)
         .select_related("user", "movie")
-        .annotate(
-            likes_count=Count("likes", distinct=True),
-            comments_count=Count("comments", distinct=True),
-        )
-        .first()
+        .prefetch_related(*movie_card_prefetches("movie__"))
     )
+    review = annotate_is_liked(annotate_review_counts(qs), request.user).first()
 
     if not review:
         return Response(status=204)
@@ -54,6 +54,7 @@ INSTALLED_APPS = [
     "movies",
     "reviews",
     "recommends",
+    "jobs",
 ]
 
 MIDDLEWARE = [
@@ -150,6 +151,65 @@ CORS_ALLOWED_ORIGINS = [
 ]
 # ✅ 외부 API 키(나중 단계에서 사용)
 TMDB_API_KEY = os.getenv("TMDB_API_KEY", "")
+TMDB_BASE_URL = os.getenv("TMDB_BASE_URL", "https://api.themoviedb.org/3")  # 벤치마크/로컬 fake 서버로 바꿀 때
+# TMDB 요청 한도(초당 요청 수 / 순간 최대 burst) - 동시 수집 엔진의 token bucket 기준
+TMDB_RATE_LIMIT = float(os.getenv("TMDB_RATE_LIMIT", "40"))
+TMDB_RATE_BURST = int(os.getenv("TMDB_RATE_BURST", "20"))
+TMDB_MAX_CONCURRENCY = int(os.getenv("TMDB_MAX_CONCURRENCY", "16"))
+# TMDB 응답 디스크 캐시 (TTL은 movies.services.tmdb.TMDB_CACHE_TTLS 기본값을 TMDB_CACHE_TTLS로 덮어쓰기 가능)
+TMDB_CACHE_ENABLED = os.getenv("TMDB_CACHE_ENABLED", "1") == "1"
+TMDB_CACHE_PATH = os.getenv("TMDB_CACHE_PATH", str(BASE_DIR / "tmdb_cache.sqlite3"))
+TMDB_CACHE_MAX_MB = int(os.getenv("TMDB_CACHE_MAX_MB", "200"))
+# 영화 상세: 마지막 동기화 후 이 시간이 지나면 백그라운드 갱신 예약
+MOVIE_REFRESH_MAX_AGE_HOURS = int(os.getenv("MOVIE_REFRESH_MAX_AGE_HOURS", "24"))
+# 런타임/크레딧이 비어 있는 영화는 마지막 갱신 시도 후 이 시간(분)이 지나야 다시 예약
+MOVIE_REFRESH_RETRY_MINUTES = int(os.getenv("MOVIE_REFRESH_RETRY_MINUTES", str(60 * 6)))
+
+# ✅ 공용 캐시 (웹 프로세스 / 워커 / 관리 명령이 같이 봐야 해서 프로세스 로컬 캐시는 X)
+# REDIS_URL이 있으면 Redis(redis 패키지 필요), 없으면 파일 캐시
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": os.getenv("CACHE_DIR", str(BASE_DIR / ".cache")),
+            "OPTIONS": {"MAX_ENTRIES": 5000},
+        }
+    }
+# 영화 상세 응답 캐시 유지 시간(초), 동기화/반응 변경 때는 즉시 무효화
+MOVIE_DETAIL_CACHE_SECONDS = int(os.getenv("MOVIE_DETAIL_CACHE_SECONDS", str(60 * 60 * 6)))
+# 인물 필모그래피 캐시 유지 시간(초), 크레딧 동기화 때는 즉시 무효화
+PERSON_CREDITS_CACHE_SECONDS = int(os.getenv("PERSON_CREDITS_CACHE_SECONDS", str(60 * 60)))
+# 자동완성 색인: 이 간격(초)마다 카탈로그 버전을 확인해 바뀌었으면 백그라운드 재구성
+SUGGEST_REFRESH_SECONDS = float(os.getenv("SUGGEST_REFRESH_SECONDS", "30"))
+# 홈 응답: 프로세스 메모리 사본을 이 간격(초)마다 공용 캐시의 버전과 비교
+HOME_PAYLOAD_CHECK_SECONDS = float(os.getenv("HOME_PAYLOAD_CHECK_SECONDS", "1"))
+# 최근 리뷰 피드(/api/reviews/recent/): 공용 캐시에 최신 리뷰 카드 N개 보관
+RECENT_REVIEWS_BUFFER_SIZE = int(os.getenv("RECENT_REVIEWS_BUFFER_SIZE", "50"))
+RECENT_REVIEWS_TTL = int(os.getenv("RECENT_REVIEWS_TTL", str(60 * 10)))   # 카드 안 영화 정보 드리프트 상한(초)
+RECENT_REVIEWS_CHECK_SECONDS = float(os.getenv("RECENT_REVIEWS_CHECK_SECONDS", "1"))
+# 팔로잉 피드(/api/reviews/feed/): 리뷰 작성 시 팔로워 타임라인에 미리 넣음(fan-out on write)
+# 팔로워가 이 수보다 많은 작성자는 넣지 않고 피드를 읽을 때 합침
+FEED_FANOUT_MAX_FOLLOWERS = int(os.getenv("FEED_FANOUT_MAX_FOLLOWERS", "1000"))
+FEED_FANOUT_BATCH_SIZE = int(os.getenv("FEED_FANOUT_BATCH_SIZE", "500"))
+FEED_BACKFILL_LIMIT = int(os.getenv("FEED_BACKFILL_LIMIT", "100"))   # 팔로우 시 타임라인에 채울 최근 리뷰 수
+
+# ✅ 백그라운드 작업 큐 (python manage.py run_workers --workers N)
+# JOBS_EAGER=1이면 워커 없이 등록 즉시 실행 (로컬 개발용)
+JOBS_EAGER = os.getenv("JOBS_EAGER", "0") == "1"
+JOBS_MAX_ATTEMPTS = int(os.getenv("JOBS_MAX_ATTEMPTS", "5"))
+JOBS_BACKOFF_BASE = int(os.getenv("JOBS_BACKOFF_BASE", "10"))      # 재시도 대기: base * 2^(n-1)초
+JOBS_BACKOFF_MAX = int(os.getenv("JOBS_BACKOFF_MAX", "3600"))
+JOBS_LOCK_TIMEOUT = int(os.getenv("JOBS_LOCK_TIMEOUT", "600"))     # RUNNING 상태로 멈춘 작업 재등록 기준(초)
+JOBS_HEARTBEAT_INTERVAL = int(os.getenv("JOBS_HEARTBEAT_INTERVAL", "60"))  # 실행 중 locked_at 갱신 주기(초, LOCK_TIMEOUT보다 짧게)
+JOBS_RETENTION_DAYS = int(os.getenv("JOBS_RETENTION_DAYS", "7"))   # DONE/FAILED 작업 보관 기간(일)
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY", "")
 OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY", "")
 AUTH_USER_MODEL = "accounts.User"
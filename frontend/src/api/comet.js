@@ -58,8 +58,21 @@ export async function fetchRecentReviews(limit = 12) {
   return res.data
 }
 
-export async function fetchMovieReviews(tmdbId) {
-  const res = await api.get(`/reviews/movie/${tmdbId}/`)
+// 팔로잉 피드: params { cursor, page_size } → { next, results } (next는 다음 페이지 전체 URL)
+export async function fetchFollowingFeed(params = {}) {
+  const res = await api.get('/reviews/feed/', { params })
+  return res.data
+}
+
+// 커서 페이지 목록(리뷰/댓글/피드)의 next(전체 URL) 그대로 요청 → { next, results }
+export async function fetchNextPage(nextUrl) {
+  const res = await api.get(nextUrl)
+  return res.data
+}
+
+// params: { sort: 'likes' | 'recent', page_size } → { next, results } (다음 페이지는 fetchNextPage(next))
+export async function fetchMovieReviews(tmdbId, params = {}) {
+  const res = await api.get(`/reviews/movie/${tmdbId}/`, { params })
   return res.data
 }
 
@@ -239,8 +252,9 @@ export async function toggleMovieLike(tmdbId) {
 
 
 // [추가] 대댓글 목록 가져오기
-export async function fetchReviewComments(reviewId) {
-  const res = await api.get(`/reviews/${reviewId}/comments/`)
+// params: { sort: 'oldest' | 'recent', page_size } → { next, results } (다음 페이지는 fetchNextPage(next))
+export async function fetchReviewComments(reviewId, params = {}) {
+  const res = await api.get(`/reviews/${reviewId}/comments/`, { params })
   return res.data
 }
 